@@ -0,0 +1,292 @@
+"""
+In-process stand-ins for the GitHub REST API and the Discord/Slack webhooks
+
+FakeGitHub serves the endpoints GitHubClient uses (pulls, labels, merge,
+PR listing) with configurable latency and rate-limit headers. Merges are
+three-way merged into a real bare repository as squash commits, so
+consecutive runs see the default branch move exactly as they would against
+GitHub, and a PR that conflicts with the moved base is rejected with 405.
+"""
+
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+_PULLS = re.compile(r"^/repos/[^/]+/[^/]+/pulls$")
+_PULL = re.compile(r"^/repos/[^/]+/[^/]+/pulls/(\d+)$")
+_MERGE = re.compile(r"^/repos/[^/]+/[^/]+/pulls/(\d+)/merge$")
+_LABELS = re.compile(r"^/repos/[^/]+/[^/]+/issues/(\d+)/labels$")
+
+
+class _Server:
+    """Threaded HTTP server on an ephemeral localhost port"""
+
+    def __init__(self, handler_class):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+        self._httpd.daemon_threads = True
+        self._httpd.owner = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self.lock = threading.Lock()
+        self.requests: Counter = Counter()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def owner(self):
+        return self.server.owner
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        return json.loads(body) if body else {}
+
+    def _reply(self, status: int, body=None, headers: Optional[Dict[str, str]] = None):
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _GitHubHandler(_Handler):
+    def _handle(self, method: str):
+        fake = self.owner
+        path = urlparse(self.path).path
+        body = self._read_json() if method in ("POST", "PUT", "PATCH") else None
+        time.sleep(fake.latency)
+
+        with fake.lock:
+            fake.requests[f"{method} {_shape(path)}"] += 1
+            headers = fake.rate_limit_headers()
+            status, result = fake.dispatch(method, path, self.path, body)
+
+        etag = f'"{hash(json.dumps(result, sort_keys=True))}"' if method == "GET" and status == 200 else None
+        if etag:
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                return self._reply(304, None, headers)
+        if isinstance(result, tuple):
+            result, link = result
+            if link:
+                headers["Link"] = link
+        self._reply(status, result, headers)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+
+class FakeGitHub(_Server):
+    """
+    Fake GitHub REST API backed by a bare repository
+
+    Args:
+        origin: Path of the bare repository PRs are merged into
+        default_branch: Base branch name
+        latency: Seconds added to every response
+        mergeable_after: GET polls that report mergeable=null before true
+        rate_limit: X-RateLimit-Limit reported for the core resource
+    """
+
+    def __init__(self, origin: str, default_branch: str = "main", latency: float = 0.0,
+                 mergeable_after: int = 0, rate_limit: int = 5000):
+        super().__init__(_GitHubHandler)
+        self.origin = origin
+        self.default_branch = default_branch
+        self.latency = latency
+        self.mergeable_after = mergeable_after
+        self.rate_limit = rate_limit
+        self.remaining = rate_limit
+        self.reset_at = int(time.time()) + 3600
+        self.pulls: Dict[int, Dict] = {}
+
+    def rate_limit_headers(self) -> Dict[str, str]:
+        self.remaining = max(0, self.remaining - 1)
+        return {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(self.reset_at),
+            "X-RateLimit-Resource": "core"
+        }
+
+    def dispatch(self, method: str, path: str, raw_path: str, body):
+        if method == "POST" and _PULLS.match(path):
+            return 201, self._create_pull(body)
+        if method == "GET" and _PULLS.match(path):
+            return 200, self._list_pulls(raw_path)
+        match = _PULL.match(path)
+        if method == "GET" and match:
+            return self._get_pull(int(match.group(1)))
+        match = _LABELS.match(path)
+        if method == "POST" and match:
+            pull = self.pulls.get(int(match.group(1)))
+            if pull is None:
+                return 404, {"message": "Not Found"}
+            pull["labels"].extend({"name": name} for name in body.get("labels", []))
+            return 200, pull["labels"]
+        match = _MERGE.match(path)
+        if method == "PUT" and match:
+            return self._merge(int(match.group(1)), body)
+        return 404, {"message": "Not Found"}
+
+    def _create_pull(self, body) -> Dict:
+        number = len(self.pulls) + 1
+        pull = {
+            "number": number,
+            "node_id": f"PR_{number}",
+            "html_url": f"{self.url}/pull/{number}",
+            "title": body.get("title", ""),
+            "state": "open",
+            "merged": False,
+            "mergeable": None,
+            "head": {"ref": body["head"]},
+            "base": {"ref": body.get("base", self.default_branch)},
+            "labels": [],
+            "polls": 0
+        }
+        self.pulls[number] = pull
+        return _public(pull)
+
+    def _get_pull(self, number: int):
+        pull = self.pulls.get(number)
+        if pull is None:
+            return 404, {"message": "Not Found"}
+        pull["polls"] += 1
+        if pull["state"] == "open" and pull["polls"] > self.mergeable_after:
+            pull["mergeable"] = True
+        return 200, _public(pull)
+
+    def _list_pulls(self, raw_path: str):
+        query = parse_qs(urlparse(raw_path).query)
+        state = query.get("state", ["open"])[0]
+        per_page = int(query.get("per_page", [30])[0])
+        page = int(query.get("page", [1])[0])
+        pulls = [_public(p) for p in self.pulls.values() if state == "all" or p["state"] == state]
+        chunk = pulls[(page - 1) * per_page:page * per_page]
+        link = None
+        if page * per_page < len(pulls):
+            base = raw_path.split("?", 1)[0]
+            link = f'<{self.url}{base}?state={state}&per_page={per_page}&page={page + 1}>; rel="next"'
+        return chunk, link
+
+    def _merge(self, number: int, body):
+        pull = self.pulls.get(number)
+        if pull is None:
+            return 404, {"message": "Not Found"}
+        if pull["state"] != "open":
+            return 405, {"message": "Pull Request is not mergeable"}
+
+        base = f"refs/heads/{self.default_branch}"
+        head = f"refs/heads/{pull['head']['ref']}"
+        message = (body or {}).get("commit_title") or f"Merge PR #{number}"
+        try:
+            parent = _git(self.origin, "rev-parse", base)
+            # Three-way merge of head into the current base, like GitHub's squash merge
+            merge = subprocess.run(
+                ["git", "-C", self.origin, "merge-tree", "--write-tree", "--no-messages", parent, head],
+                capture_output=True, text=True
+            )
+            if merge.returncode == 1:
+                pull["mergeable"] = False
+                return 405, {"message": "Pull Request is not mergeable"}
+            if merge.returncode != 0:
+                raise RuntimeError(merge.stderr.strip())
+            tree = merge.stdout.split("\n", 1)[0].strip()
+            sha = _git(self.origin, "commit-tree", tree, "-p", parent, "-m", message)
+            # Fails if the base moved since it was read, as a concurrent merge would on GitHub
+            _git(self.origin, "update-ref", base, sha, parent)
+        except RuntimeError as e:
+            return 409, {"message": str(e)}
+
+        pull.update(state="closed", merged=True, mergeable=None, merge_commit_sha=sha)
+        return 200, {"sha": sha, "merged": True, "message": "Pull Request successfully merged"}
+
+
+class FakeWebhooks(_Server):
+    """Records Discord (/discord) and Slack (/slack) webhook posts"""
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(_WebhookHandler)
+        self.latency = latency
+        self.payloads: List[Dict] = []
+
+    @property
+    def discord_url(self) -> str:
+        return f"{self.url}/discord"
+
+    @property
+    def slack_url(self) -> str:
+        return f"{self.url}/slack"
+
+
+class _WebhookHandler(_Handler):
+    def do_POST(self):
+        hooks = self.owner
+        payload = self._read_json()
+        time.sleep(hooks.latency)
+        with hooks.lock:
+            hooks.requests[f"POST {self.path}"] += 1
+            hooks.payloads.append(payload)
+        # Discord answers 204 No Content, Slack answers 200 "ok"
+        self._reply(204 if self.path.startswith("/discord") else 200, None)
+
+
+def _public(pull: Dict) -> Dict:
+    return {key: value for key, value in pull.items() if key != "polls"}
+
+
+def _shape(path: str) -> str:
+    return re.sub(r"/\d+(?=/|$)", "/{n}", path)
+
+
+_MERGE_IDENTITY = {
+    "GIT_AUTHOR_NAME": "GitHub", "GIT_AUTHOR_EMAIL": "noreply@github.com",
+    "GIT_COMMITTER_NAME": "GitHub", "GIT_COMMITTER_EMAIL": "noreply@github.com"
+}
+
+
+def _git(repo: str, *args: str) -> str:
+    env = {**os.environ, **_MERGE_IDENTITY}
+    result = subprocess.run(["git", "-C", repo, *args], capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+    return result.stdout.strip()
@@ -0,0 +1,87 @@
+"""
+Throwaway repositories for benchmarks
+
+make_workspace() creates a bare ``origin.git`` and a clone of it with a
+config/config.json pointing at the fake API, the requested number of files
+to modify and the requested number of collaborators.
+"""
+
+import json
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class Workspace:
+    """Paths of one benchmark fixture"""
+
+    root: Path
+    origin: Path
+    work: Path
+
+    @property
+    def config_path(self) -> Path:
+        return self.work / "config" / "config.json"
+
+
+def _git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+
+def make_workspace(root: Path, files: int = 3, collaborators: int = 2,
+                   default_branch: str = "main") -> Workspace:
+    """
+    Create a bare origin and a configured clone
+
+    Args:
+        root: Empty directory to create the fixture in
+        files: Number of files single-user mode modifies
+        collaborators: Number of configured collaborators
+        default_branch: Default branch name
+
+    Returns:
+        Workspace with the origin and clone paths
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    origin = root / "origin.git"
+    work = root / "work"
+
+    _git(root, "init", "-q", "--bare", "-b", default_branch, str(origin))
+    _git(root, "init", "-q", "-b", default_branch, str(work))
+    _git(work, "config", "user.name", "Benchmark User")
+    _git(work, "config", "user.email", "bench@example.com")
+    _git(work, "remote", "add", "origin", str(origin))
+
+    config = json.loads((REPO_ROOT / "config" / "config.json").read_text(encoding="utf-8"))
+    config["github"]["repository"] = {"owner": "bench", "name": "fixture", "default_branch": default_branch}
+    config["github"]["response_cache"]["path"] = None
+    config["github"]["use_graphql"] = False
+    config["run_settings"]["delay_seconds"] = 0
+    config["run_settings"]["state_file"] = str(root / "state.jsonl")
+    config["notifications"]["outbox"]["path"] = str(root / "outbox.sqlite3")
+    config["collaborators"] = [
+        {"name": f"bench-user-{i}", "email": f"bench-user-{i}@example.com"} for i in range(collaborators)
+    ]
+    config["files"]["to_modify"] = [f"docs/file-{i}.md" for i in range(files)]
+
+    (work / "config").mkdir()
+    (work / "config" / "config.json").write_text(json.dumps(config, indent=2), encoding="utf-8")
+    (work / "templates").mkdir()
+    (work / "templates" / "pr_template.md").write_text(
+        (REPO_ROOT / "templates" / "pr_template.md").read_text(encoding="utf-8"), encoding="utf-8"
+    )
+    (work / "README.md").write_text("# Benchmark fixture\n", encoding="utf-8")
+    (work / "docs").mkdir()
+    for path in config["files"]["to_modify"]:
+        (work / path).write_text(f"# {path}\n", encoding="utf-8")
+
+    _git(work, "add", "-A")
+    _git(work, "commit", "-q", "-m", "Initial fixture")
+    _git(work, "push", "-q", "-u", "origin", default_branch)
+    return Workspace(root=root, origin=origin, work=work)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Benchmark AutoPRCreator against a local bare remote and a fake GitHub API
+
+Scenarios:
+    single_user          run_single_user_mode (branch, modify, commit, push) per file count
+    collaborator         run_collaborator_mode (2 commits per collaborator, push) per collaborator count
+    create_and_merge_pr  create, label, wait for mergeability, merge and notify one prepared branch
+
+Every case runs in a fresh fixture (see fixtures.py) with one untimed warm-up
+iteration. Results are written as JSON; pass --compare to diff against an
+earlier results file and fail on regressions.
+
+Usage:
+    python -m benchmarks.run_benchmarks --output bench.json
+    python -m benchmarks.run_benchmarks --files 1,10,50 --collaborators 2,8 --repeat 10 --latency-ms 25
+    python -m benchmarks.run_benchmarks --output new.json --compare bench.json --max-regression 0.2
+
+    # Logging overhead on a 1,000-commit collaborator run (2 commits per collaborator)
+    python -m benchmarks.run_benchmarks --scenarios collaborator --collaborators 500 --output quiet.json
+    python -m benchmarks.run_benchmarks --scenarios collaborator --collaborators 500 --log-level DEBUG \
+        --log-json /tmp/bench-log.jsonl --output logged.json --compare quiet.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fake_github import FakeGitHub, FakeWebhooks
+from benchmarks.fixtures import REPO_ROOT, make_workspace
+from src.utils import percentile
+
+logger = logging.getLogger("benchmarks")
+
+
+@contextmanager
+def _environment(**values: str):
+    previous = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+@contextmanager
+def _chdir(path: Path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "mean": round(statistics.mean(samples), 6),
+        "min": round(min(samples), 6),
+        "p50": round(percentile(samples, 0.50), 6),
+        "p95": round(percentile(samples, 0.95), 6),
+        "max": round(max(samples), 6)
+    }
+
+
+def run_case(scenario: str, files: int, collaborators: int, repeat: int, latency: float,
+             mergeable_after: int, log_level: str = "WARNING", log_json: str = None) -> Dict:
+    """
+    Run one scenario in a fresh fixture
+
+    Args:
+        log_level: Root log level while timing
+        log_json: Also log to this JSON-lines file
+
+    Returns:
+        Result record with samples, summary statistics and request counts per iteration
+    """
+    from src.main import AutoPRCreator
+
+    with tempfile.TemporaryDirectory(prefix="auto-pr-bench-") as tmp:
+        workspace = make_workspace(Path(tmp), files=files, collaborators=collaborators)
+        with FakeGitHub(str(workspace.origin), latency=latency, mergeable_after=mergeable_after) as github, \
+                FakeWebhooks(latency=latency) as webhooks, \
+                _environment(GITHUB_API_URL=github.url, GITHUB_TOKEN="bench-token",
+                             DISCORD_WEBHOOK=webhooks.discord_url, SLACK_WEBHOOK=webhooks.slack_url), \
+                _chdir(workspace.work):
+
+            creator = AutoPRCreator(config_path=str(workspace.config_path), log_json=log_json)
+            logging.getLogger().setLevel(log_level)
+            creator.merge_waiter.initial_interval = min(creator.merge_waiter.initial_interval, 0.05)
+
+            iteration = _scenario(creator, scenario)
+            samples = []
+            try:
+                for index in range(repeat + 1):
+                    if index == 1:
+                        # Count requests of timed iterations only
+                        github.requests.clear()
+                        webhooks.requests.clear()
+                    prepared = iteration.setup() if iteration.setup else None
+                    start = time.perf_counter()
+                    iteration.run(prepared)
+                    elapsed = time.perf_counter() - start
+                    if index > 0:
+                        samples.append(elapsed)
+            finally:
+                creator.close()
+
+            requests = Counter(github.requests)
+            requests.update(webhooks.requests)
+
+    return {
+        "scenario": scenario,
+        "files": files,
+        "collaborators": collaborators,
+        "repeat": repeat,
+        "latency_ms": round(latency * 1000, 3),
+        "log_level": log_level,
+        "samples": [round(sample, 6) for sample in samples],
+        **_summarize(samples),
+        "requests_per_iteration": {
+            name: round(count / repeat, 2) for name, count in sorted(requests.items())
+        }
+    }
+
+
+class _Iteration:
+    def __init__(self, run: Callable, setup: Callable = None):
+        self.run = run
+        self.setup = setup
+
+
+def _scenario(creator, scenario: str) -> _Iteration:
+    if scenario == "single_user":
+        return _Iteration(lambda _: creator.run_single_user_mode())
+    if scenario == "collaborator":
+        return _Iteration(lambda _: creator.run_collaborator_mode())
+    if scenario == "create_and_merge_pr":
+        return _Iteration(
+            run=lambda prepared: creator.create_and_merge_pr(*prepared),
+            setup=creator.run_single_user_mode
+        )
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+def _metadata(latency: float) -> Dict:
+    def command(*args: str) -> str:
+        try:
+            return subprocess.run(args, cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip()
+        except OSError:
+            return ""
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "git": command("git", "--version"),
+        "commit": command("git", "rev-parse", "HEAD"),
+        "latency_ms": round(latency * 1000, 3)
+    }
+
+
+def _case_key(result: Dict) -> str:
+    return f"{result['scenario']}[files={result['files']},collaborators={result['collaborators']}]"
+
+
+def compare(current: Dict, baseline: Dict, max_regression: float) -> bool:
+    """
+    Print p50 changes against a baseline results file
+
+    Returns:
+        False if any case's p50 got slower by more than max_regression
+    """
+    previous = {_case_key(result): result for result in baseline.get("results", [])}
+    ok = True
+    print(f"\n{'case':<56} {'baseline p50':>13} {'current p50':>12} {'change':>8}")
+    for result in current["results"]:
+        key = _case_key(result)
+        if key not in previous:
+            print(f"{key:<56} {'-':>13} {result['p50']:>11.4f}s {'new':>8}")
+            continue
+        before = previous[key]["p50"]
+        change = (result["p50"] - before) / before if before else 0.0
+        flag = ""
+        if change > max_regression:
+            flag = "  REGRESSION"
+            ok = False
+        print(f"{key:<56} {before:>12.4f}s {result['p50']:>11.4f}s {change:>+7.1%}{flag}")
+    return ok
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Auto PR Creator against local fakes")
+    parser.add_argument("--scenarios", default="single_user,collaborator,create_and_merge_pr",
+                        help="Comma-separated scenarios to run")
+    parser.add_argument("--files", type=_int_list, default=[1, 10],
+                        help="File counts for single_user and create_and_merge_pr (comma-separated)")
+    parser.add_argument("--collaborators", type=_int_list, default=[2, 8],
+                        help="Collaborator counts for the collaborator scenario (comma-separated)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed iterations per case")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="Latency added to every fake API response")
+    parser.add_argument("--mergeable-after", type=int, default=1,
+                        help="Polls that report mergeable=null before a PR becomes mergeable")
+    parser.add_argument("--output", default="benchmark-results.json", help="Where to write the JSON results")
+    parser.add_argument("--compare", help="Baseline results file to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="Allowed p50 slowdown against the baseline before failing (0.25 = 25%%)")
+    parser.add_argument("--log-level", default="WARNING", choices=["DEBUG", "INFO", "WARNING"],
+                        help="Root log level during timed iterations")
+    parser.add_argument("--log-json", help="Also write logs as JSON lines to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    latency = args.latency_ms / 1000
+
+    cases = []
+    for scenario in args.scenarios.split(","):
+        if scenario == "collaborator":
+            cases.extend((scenario, 1, count) for count in args.collaborators)
+        else:
+            cases.extend((scenario, count, 2) for count in args.files)
+
+    results = []
+    for scenario, files, collaborators in cases:
+        result = run_case(scenario, files, collaborators, args.repeat, latency, args.mergeable_after,
+                          args.log_level, args.log_json)
+        logging.getLogger().setLevel(logging.INFO)
+        logger.info(
+            f"{_case_key(result):<56} p50={result['p50']:.4f}s p95={result['p95']:.4f}s "
+            f"mean={result['mean']:.4f}s"
+        )
+        results.append(result)
+
+    output = {"meta": _metadata(latency), "results": results}
+    Path(args.output).write_text(json.dumps(output, indent=2), encoding="utf-8")
+    logger.info(f"Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if not compare(output, baseline, args.max_regression):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
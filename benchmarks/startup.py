@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Startup-time budget check for the CLI
+
+Measures, in fresh interpreters:
+    import        cumulative ``-X importtime`` of src.main
+    help          ``run.py --help``
+    dry_run       ``run.py --dry-run`` against a benchmark fixture
+
+and fails if the src.main import exceeds the budget or if --help/--dry-run
+load any of the heavy third-party modules (requests, urllib3, dotenv,
+aiohttp), which are meant to be imported only when a run needs them.
+
+Usage:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --budget-ms 80 --runs 10 --output startup.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fixtures import REPO_ROOT, make_workspace
+
+logger = logging.getLogger("benchmarks.startup")
+
+HEAVY_MODULES = ("requests", "urllib3", "dotenv", "aiohttp")
+
+
+def _import_profile(args: List[str], cwd: Path) -> Tuple[float, Dict[str, int]]:
+    """
+    Run a Python command under -X importtime
+
+    Returns:
+        Wall time in seconds and the cumulative import time (us) per module
+    """
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    env.pop("GITHUB_TOKEN", None)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=cwd, env=env,
+                            capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} exited with {result.returncode}: {result.stderr[-500:]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        try:
+            modules[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # header line
+    return elapsed, modules
+
+
+def _heavy(modules: Dict[str, int]) -> Set[str]:
+    return {name for name in modules if name.split(".")[0] in HEAVY_MODULES}
+
+
+def measure(runs: int) -> Dict:
+    """
+    Measure import and CLI startup times
+
+    Args:
+        runs: Fresh interpreters per measurement (the median is reported)
+
+    Returns:
+        Result record with medians in milliseconds and heavy modules loaded per command
+    """
+    with tempfile.TemporaryDirectory(prefix="auto-pr-startup-") as tmp:
+        workspace = make_workspace(Path(tmp), files=1, collaborators=2)
+        run_py = str(REPO_ROOT / "run.py")
+        commands = {
+            "import": (["-c", "import src.main"], REPO_ROOT),
+            "help": ([run_py, "--help"], workspace.work),
+            "dry_run": ([run_py, "--dry-run", "--config", str(workspace.config_path)], workspace.work)
+        }
+
+        results = {}
+        for name, (args, cwd) in commands.items():
+            walls, imports, heavy = [], [], set()
+            for _ in range(runs):
+                elapsed, modules = _import_profile(args, cwd)
+                walls.append(elapsed * 1000)
+                imports.append(modules.get("src.main", 0) / 1000)
+                heavy |= _heavy(modules)
+            results[name] = {
+                "wall_ms": round(statistics.median(walls), 2),
+                "src_main_import_ms": round(statistics.median(imports), 2),
+                "heavy_modules": sorted(heavy)
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check Auto PR Creator startup against an import-time budget")
+    parser.add_argument("--budget-ms", type=float, default=100.0,
+                        help="Maximum cumulative import time of src.main (median)")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement")
+    parser.add_argument("--output", help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    results = measure(max(1, args.runs))
+
+    ok = True
+    for name, result in results.items():
+        logger.info(f"{name:<8} wall={result['wall_ms']:.1f}ms src.main import={result['src_main_import_ms']:.1f}ms")
+        if result["heavy_modules"]:
+            ok = False
+            logger.error(f"{name} imported {', '.join(result['heavy_modules'])}")
+
+    import_ms = results["import"]["src_main_import_ms"]
+    if import_ms > args.budget_ms:
+        ok = False
+        logger.error(f"src.main import took {import_ms:.1f}ms, budget is {args.budget_ms:.1f}ms")
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps({"budget_ms": args.budget_ms, "results": results}, indent=2), encoding="utf-8"
+        )
+        logger.info(f"Results written to {args.output}")
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
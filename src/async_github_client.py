@@ -0,0 +1,83 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from src.github_client import GitHubClient
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGitHubClient:
+    """
+    asyncio facade over GitHubClient with bounded concurrency
+
+    Mirrors the GitHubClient API as coroutines. There is no async I/O
+    underneath: each call is the blocking GitHubClient call run on a small
+    thread pool, so calls share the client's pooled transport and
+    rate-limit scheduler, and at most ``max_concurrency`` are in flight at
+    once.
+    """
+
+    def __init__(self, client: GitHubClient, max_concurrency: int = 4):
+        """
+        Initialize async client
+
+        Args:
+            client: Synchronous GitHubClient to run calls on
+            max_concurrency: Maximum number of concurrent API calls
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="github-async")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    async def _call(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def create_pr(self, branch: str, title: str, body: str, draft: bool = False) -> Dict[str, Any]:
+        """Create a pull request"""
+        return await self._call(self.client.create_pr, branch, title, body, draft=draft)
+
+    async def add_labels(self, pr_number: int, labels: List[str]):
+        """Add labels to PR"""
+        return await self._call(self.client.add_labels, pr_number, labels)
+
+    async def merge_pr(self, pr_number: int, method: str = "merge") -> Dict[str, Any]:
+        """Merge a pull request"""
+        return await self._call(self.client.merge_pr, pr_number, method=method)
+
+    async def get_pr(self, pr_number: int) -> Dict[str, Any]:
+        """Get PR details"""
+        return await self._call(self.client.get_pr, pr_number)
+
+    async def list_prs(self, state: str = "open", **filters: Any) -> List[Dict[str, Any]]:
+        """List pull requests"""
+        return await self._call(self.client.list_prs, state, **filters)
+
+    async def run_in_pool(self, func, *args, **kwargs):
+        """Run any other blocking call (e.g. a webhook) under the same concurrency limit"""
+        return await self._call(func, *args, **kwargs)
+
+    def submit(self, func, *args, **kwargs) -> Future:
+        """
+        Start a blocking call on the pool without awaiting it
+
+        Returns a concurrent.futures.Future, so calls running on the pool
+        can block on its result; wrap it with asyncio.wrap_future to await it.
+        """
+        return self._executor.submit(func, *args, **kwargs)
+
+    def close(self):
+        """Shut down the worker threads"""
+        self._executor.shutdown(wait=True)
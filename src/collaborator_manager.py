@@ -7,6 +7,11 @@ import json
 import random
 import string
 
+from src import tracing
+from src.commit_builder import CommitBuilder
+from src.content_updater import ContentUpdater
+from src.contribution_summary import INDEX_PATH, SUMMARY_PATH, ContributionSummary
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,32 +21,32 @@ class CollaboratorManager:
     def __init__(self, config, repo_path="."):
         self.config = config
         self.repo_path = Path(repo_path).resolve()
-        self.collaborators = config.config.get("collaborators", [])
+        self.collaborators = [collaborator.as_dict() for collaborator in config.settings.collaborators]
+        self.content_updater = ContentUpdater(config.settings.update_log_entries)
+        self.summary_recent_entries = config.settings.summary_recent_entries
+
+    def apply_config(self, config):
+        """Pick up a reloaded collaborator list; branches already being built keep the old one"""
+        self.collaborators = [collaborator.as_dict() for collaborator in config.settings.collaborators]
+        self.content_updater.max_entries = config.settings.update_log_entries
+        self.summary_recent_entries = config.settings.summary_recent_entries
 
     def _run_git(self, args: List[str]) -> str:
         """Run git command"""
-        result = subprocess.run(
-            ["git"] + args,
-            cwd=self.repo_path,
-            capture_output=True,
-            text=True,
-            shell=True
-        )
+        with tracing.span(args[0] if args else "git", "git", argv=args):
+            result = subprocess.run(
+                ["git"] + args,
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True
+            )
         if result.returncode != 0:
             raise RuntimeError(result.stderr.strip())
         return result.stdout.strip()
 
-    def setup_collaborator_identity(self, collaborator: Dict):
-        """Temporarily set git identity for a collaborator"""
-        self._run_git(["config", "user.name", collaborator['name']])
-        self._run_git(["config", "user.email", collaborator['email']])
-        logger.info(f"🔄 Switched to collaborator: {collaborator['name']} ({collaborator['email']})")
-
-    def reset_identity(self, original_name: str, original_email: str):
-        """Reset git identity to original user"""
-        self._run_git(["config", "user.name", original_name])
-        self._run_git(["config", "user.email", original_email])
-        logger.info("🔄 Reset to original git identity")
+    def _commit_builder(self, branch: str) -> CommitBuilder:
+        """Create a fast-import commit builder for a branch"""
+        return CommitBuilder(self.repo_path, branch, run_git=self._run_git)
 
     def create_collaborator_commit(self, branch: str, collaborator: Dict, file_index: int):
         """
@@ -52,26 +57,20 @@ class CollaboratorManager:
             collaborator: Collaborator dict with name and email
             file_index: Index to determine which file to modify
         """
-        # Switch to branch
-        self._run_git(["checkout", branch])
-        
-        # Save original identity
-        original_name = self._run_git(["config", "user.name"])
-        original_email = self._run_git(["config", "user.email"])
-        
-        try:
-            # Switch to collaborator identity
-            self.setup_collaborator_identity(collaborator)
-            
-            # Create a unique file for this collaborator
-            safe_name = collaborator['name'].replace(' ', '-').lower()
-            filename = f"contributions/{safe_name}-contribution-{file_index}.md"
-            filepath = self.repo_path / filename
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write collaborator's contribution
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            content = f"""# 🤝 Contribution by @{collaborator['name']}
+        with self._commit_builder(branch) as builder:
+            filename = self._add_collaborator_commit(builder, branch, collaborator, file_index)
+        return filename
+
+    def _add_collaborator_commit(self, builder: CommitBuilder, branch: str, collaborator: Dict,
+                                 file_index: int) -> str:
+        """Stream a single collaborator commit into an open commit builder"""
+        # Create a unique file for this collaborator
+        safe_name = collaborator['name'].replace(' ', '-').lower()
+        filename = f"contributions/{safe_name}-contribution-{file_index}.md"
+
+        # Write collaborator's contribution
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        content = f"""# 🤝 Contribution by @{collaborator['name']}
 
 ## 📋 Contribution Details
 - **Date:** {timestamp}
@@ -92,20 +91,18 @@ class CollaboratorManager:
 *This commit was authored by @{collaborator['name']}*
 *🤖 Generated by Auto PR Creator*
 """
-            filepath.write_text(content, encoding="utf-8")
-            
-            # Also modify a shared file to show collaboration
-            readme_path = self.repo_path / "README.md"
-            if readme_path.exists():
-                with open(readme_path, "a", encoding="utf-8", newline="\n") as f:
-                    f.write(f"\n- 🚀 Contribution from @{collaborator['name']} on {timestamp}\n")
-            
-            # Stage files
-            self._run_git(["add", filename])
-            self._run_git(["add", "README.md"])
-            
-            # Create commit message with co-authors
-            commit_msg = f"""feat: contribution from @{collaborator['name']} (#{file_index})
+        files = {filename: content}
+
+        # Also modify a shared file to show collaboration (bounded update log, not an ever-growing list)
+        readme = builder.read_file("README.md")
+        if readme is not None:
+            files["README.md"] = self.content_updater.render(
+                readme, f"🚀 Contribution from @{collaborator['name']} on {timestamp} (`{branch}` #{file_index})",
+                "README.md"
+            )
+
+        # Create commit message with co-authors
+        commit_msg = f"""feat: contribution from @{collaborator['name']} (#{file_index})
 
 This commit adds contribution from @{collaborator['name']} as part of collaborative development.
 
@@ -115,18 +112,10 @@ This commit adds contribution from @{collaborator['name']} as part of collaborat
 
 Co-authored-by: {collaborator['name']} <{collaborator['email']}>
 """
-            # Use temp file for commit message to handle special characters
-            msg_file = self.repo_path / ".git" / "COMMIT_EDITMSG.tmp"
-            msg_file.write_text(commit_msg, encoding="utf-8")
-            self._run_git(["commit", "-F", str(msg_file)])
-            msg_file.unlink()
-            
-            logger.info(f"✅ Commit created by @{collaborator['name']} (file: {filename})")
-            
-        finally:
-            # Always reset identity
-            self.reset_identity(original_name, original_email)
-            
+        # Author and committer are set on the commit itself, repo config is never touched
+        builder.commit(collaborator, commit_msg, files)
+
+        logger.info(f"✅ Commit created by @{collaborator['name']} (file: {filename})")
         return filename
 
     def create_multi_collaborator_commits(self, branch: str, num_commits_per_collaborator: int = 2):
@@ -139,88 +128,43 @@ Co-authored-by: {collaborator['name']} <{collaborator['email']}>
         """
         all_commits = []
         
-        # Create contributions directory
-        contrib_dir = self.repo_path / "contributions"
-        contrib_dir.mkdir(exist_ok=True)
-        
-        for i in range(num_commits_per_collaborator):
-            for collaborator in self.collaborators:
-                try:
-                    filename = self.create_collaborator_commit(branch, collaborator, i+1)
-                    all_commits.append({
-                        'collaborator': collaborator['name'],
-                        'email': collaborator['email'],
-                        'file': filename,
-                        'index': i+1,
-                        'timestamp': datetime.now().isoformat()
-                    })
-                    logger.info(f"📝 Created commit #{i+1} for @{collaborator['name']}")
-                except Exception as e:
-                    logger.error(f"❌ Failed to create commit for {collaborator['name']}: {e}")
-        
-        # Create a summary file
-        self._create_contributions_summary(branch, all_commits)
+        # All commits, including the summary, go through a single fast-import process
+        with self._commit_builder(branch) as builder:
+            for i in range(num_commits_per_collaborator):
+                for collaborator in self.collaborators:
+                    try:
+                        filename = self._add_collaborator_commit(builder, branch, collaborator, i+1)
+                        all_commits.append({
+                            'collaborator': collaborator['name'],
+                            'email': collaborator['email'],
+                            'file': filename,
+                            'index': i+1,
+                            'timestamp': datetime.now().isoformat()
+                        })
+                        logger.info(f"📝 Created commit #{i+1} for @{collaborator['name']}")
+                    except Exception as e:
+                        # A failed commit leaves nothing in the stream, so the branch goes on
+                        # without it; if fast-import itself died, finishing the builder fails
+                        logger.error(f"❌ Failed to create commit for {collaborator['name']}: {e}")
+            
+            # Create a summary file
+            self._create_contributions_summary(branch, all_commits, builder)
         
         return all_commits
     
-    def _create_contributions_summary(self, branch: str, commits: List[Dict]):
-        """Create a summary of all contributions"""
-        summary_file = self.repo_path / "contributions" / "SUMMARY.md"
-        
-        content = f"""# 📊 Collaborative Contributions Summary
-
-## 🌿 Branch: `{branch}`
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## 👥 Contributors ({len(set(c['collaborator'] for c in commits))})
-
-| # | Contributor | Email | Commits |
-|---|-------------|-------|---------|
-"""
-        
-        # Group by collaborator
-        contributors = {}
-        for commit in commits:
-            if commit['collaborator'] not in contributors:
-                contributors[commit['collaborator']] = {
-                    'email': commit['email'],
-                    'count': 0
-                }
-            contributors[commit['collaborator']]['count'] += 1
-        
-        for i, (name, data) in enumerate(contributors.items(), 1):
-            content += f"| {i} | @{name} | `{data['email']}` | {data['count']} |\n"
-        
-        content += """
-## 📝 Individual Contributions
+    def _create_contributions_summary(self, branch: str, commits: List[Dict], builder: CommitBuilder):
+        """Fold this branch's commits into the contributions index and re-render the summary"""
+        summary = ContributionSummary.load(builder.read_file(INDEX_PATH), self.summary_recent_entries)
+        summary.add(branch, commits)
+        files = {SUMMARY_PATH: summary.render(branch), INDEX_PATH: summary.to_json()}
 
-"""
-        for commit in commits:
-            content += f"- [{commit['timestamp'][:10]}] @{commit['collaborator']}: `{commit['file']}`\n"
-        
-        content += """
----
-*🤖 Generated by Auto PR Creator - Collaborative Mode*
-"""
-        
-        summary_file.write_text(content, encoding="utf-8")
-        self._run_git(["add", "contributions/SUMMARY.md"])
-        
-        # Commit summary as a special collaborator
-        original_name = self._run_git(["config", "user.name"])
-        original_email = self._run_git(["config", "user.email"])
-        
-        try:
-            commit_msg = f"""docs: add contributions summary for {branch}
+        # Commit summary as the repository's own identity
+        coauthor = self.config.get_coauthor_config()
+        commit_msg = f"""docs: add contributions summary for {branch}
 
-This summary tracks all collaborative contributions on this branch.
+This summary tracks collaborative contributions, including the ones on this branch.
 
-Co-authored-by: {self.config.get_coauthor_config()['name']} <{self.config.get_coauthor_config()['email']}>
+Co-authored-by: {coauthor['name']} <{coauthor['email']}>
 """
-            msg_file = self.repo_path / ".git" / "COMMIT_EDITMSG.tmp"
-            msg_file.write_text(commit_msg, encoding="utf-8")
-            self._run_git(["commit", "-F", str(msg_file)])
-            msg_file.unlink()
-            logger.info("📊 Created contributions summary")
-        finally:
-            self.reset_identity(original_name, original_email)
\ No newline at end of file
+        builder.commit(builder.default_identity(), commit_msg, files)
+        logger.info("📊 Created contributions summary")
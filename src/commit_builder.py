@@ -0,0 +1,303 @@
+import subprocess
+import tempfile
+import time
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from src import tracing
+
+logger = logging.getLogger(__name__)
+
+FileContent = Union[str, bytes, None]
+
+
+def _git_timezone(timestamp: int) -> str:
+    """Format the local UTC offset at ``timestamp`` the way git expects (+HHMM)"""
+    offset = datetime.fromtimestamp(timestamp).astimezone().utcoffset()
+    minutes = int(offset.total_seconds() // 60) if offset else 0
+    sign = "+" if minutes >= 0 else "-"
+    minutes = abs(minutes)
+    return f"{sign}{minutes // 60:02d}{minutes % 60:02d}"
+
+
+def _quote_path(path: str) -> str:
+    """Quote a path for the fast-import stream when git requires it"""
+    if path.startswith('"') or "\n" in path:
+        return json.dumps(path, ensure_ascii=False)
+    return path
+
+
+def _data(content: bytes) -> bytes:
+    """Frame content as a fast-import data command"""
+    return f"data {len(content)}\n".encode("utf-8") + content + b"\n"
+
+
+def _format_identity(identity: Dict, timestamp: int) -> str:
+    """Format a name/email dict as a fast-import identity line"""
+    name = identity["name"]
+    email = identity["email"]
+    for value in (name, email):
+        if any(c in value for c in "<>\n"):
+            raise ValueError(f"Invalid character in git identity: {value!r}")
+    return f"{name} <{email}> {timestamp} {_git_timezone(timestamp)}"
+
+
+class CommitBuilder:
+    """
+    Builds commits on a branch through one long-lived `git fast-import` process
+
+    Blobs, trees and commits are streamed straight into the object database,
+    so author and committer are set per commit without touching the repository
+    config and the number of git processes does not depend on how many commits
+    are created.
+    """
+
+    def __init__(self, repo_path=".", branch: str = "", run_git: Optional[Callable[[List[str]], str]] = None):
+        """
+        Initialize commit builder
+
+        Args:
+            repo_path: Path to git repository
+            branch: Existing branch to append commits to
+            run_git: Optional callable used for the few one-shot git commands
+        """
+        if not branch:
+            raise ValueError("Branch name is required")
+
+        self.repo_path = Path(repo_path).resolve()
+        self.branch = branch
+        self.ref = f"refs/heads/{branch}"
+        self._run_git = run_git or self._default_run_git
+
+        self._process = None
+        self._stderr = None
+        self._marks_file = None
+        self._parent = None
+        self._checked_out = False
+        self._mark = 0
+        self._files: Dict[str, FileContent] = {}
+        self._identity = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.finish()
+        else:
+            self.abort()
+        return False
+
+    def _default_run_git(self, args: List[str]) -> str:
+        """Run a one-shot git command"""
+        result = subprocess.run(
+            ["git"] + args,
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"Git command failed: {' '.join(args)}")
+        return result.stdout.strip()
+
+    def start(self):
+        """Resolve the branch tip and start the fast-import process"""
+        if self._process is not None:
+            return
+
+        # One call resolves both the branch tip and what HEAD points to
+        output = self._run_git(["rev-parse", f"{self.ref}^{{commit}}", "--symbolic-full-name", "HEAD"])
+        lines = output.splitlines()
+        self._parent = lines[0].strip()
+        self._checked_out = len(lines) > 1 and lines[1].strip() == self.ref
+
+        marks = tempfile.NamedTemporaryFile(prefix="fast-import-", suffix=".marks", delete=False)
+        marks.close()
+        self._marks_file = Path(marks.name)
+        self._stderr = tempfile.TemporaryFile()
+
+        self._process = subprocess.Popen(
+            ["git", "fast-import", "--quiet", "--done", f"--export-marks={self._marks_file}"],
+            cwd=self.repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=self._stderr
+        )
+        logger.debug(f"Started fast-import for {self.ref} at {self._parent[:12]}")
+
+    def _write(self, data: bytes):
+        try:
+            self._process.stdin.write(data)
+        except (BrokenPipeError, OSError) as e:
+            raise RuntimeError(f"git fast-import terminated unexpectedly: {self._read_stderr() or e}")
+
+    def _read_stderr(self) -> str:
+        if self._stderr is None:
+            return ""
+        self._stderr.seek(0)
+        return self._stderr.read().decode("utf-8", errors="replace").strip()
+
+    def default_identity(self) -> Dict:
+        """Get the repository's configured committer identity"""
+        if self._identity is None:
+            ident = self._run_git(["var", "GIT_COMMITTER_IDENT"])
+            name, _, rest = ident.partition(" <")
+            email = rest.split(">", 1)[0]
+            self._identity = {"name": name, "email": email}
+        return self._identity
+
+    def read_file(self, path: str) -> Optional[str]:
+        """
+        Get the current content of a file on the branch being built
+
+        Args:
+            path: Repository-relative file path
+
+        Returns:
+            File content, or None if the file does not exist
+        """
+        if path in self._files:
+            content = self._files[path]
+            if isinstance(content, bytes):
+                return content.decode("utf-8")
+            return content
+
+        # Always the committed blob: the working tree may have uncommitted edits or
+        # translated line endings. The one-shot runner strips output, so run git directly.
+        with tracing.span("cat-file", "git", path=path):
+            result = subprocess.run(
+                ["git", "cat-file", "blob", f"{self._parent}:{path}"],
+                cwd=self.repo_path,
+                capture_output=True,
+                timeout=30
+            )
+        if result.returncode != 0:
+            return None
+        return result.stdout.decode("utf-8")
+
+    def commit(self, author: Dict, message: str, files: Dict[str, FileContent],
+               committer: Optional[Dict] = None) -> int:
+        """
+        Stream a commit onto the branch
+
+        Args:
+            author: Author dict with 'name' and 'email'
+            message: Full commit message
+            files: Mapping of repository-relative path to new content (None deletes the file)
+            committer: Committer dict, defaults to the author
+
+        Returns:
+            fast-import mark of the new commit
+        """
+        if self._process is None:
+            self.start()
+
+        timestamp = int(time.time())
+        author_line = _format_identity(author, timestamp)
+        committer_line = _format_identity(committer or author, timestamp)
+
+        # The whole command is assembled first and written at once, so a commit that
+        # fails validation leaves nothing in the stream and later commits can follow
+        mark = self._mark + 1
+        command = bytearray(f"commit {self.ref}\nmark :{mark}\n".encode("utf-8"))
+        command += f"author {author_line}\ncommitter {committer_line}\n".encode("utf-8")
+        command += _data(message.encode("utf-8"))
+        if mark == 1:
+            command += f"from {self._parent}\n".encode("utf-8")
+
+        for path, content in files.items():
+            if content is None:
+                command += f"D {_quote_path(path)}\n".encode("utf-8")
+            else:
+                data = content.encode("utf-8") if isinstance(content, str) else content
+                command += f"M 100644 inline {_quote_path(path)}\n".encode("utf-8")
+                command += _data(data)
+        command += b"\n"
+
+        self._write(bytes(command))
+        self._mark = mark
+        self._files.update(files)
+
+        logger.debug(f"Streamed commit :{mark} by {author['name']} ({len(files)} file(s))")
+        return mark
+
+    def finish(self) -> List[str]:
+        """
+        Finish the import, update the branch and sync the working tree
+
+        Returns:
+            SHAs of the created commits, in creation order
+
+        Raises:
+            RuntimeError: If fast-import or the working tree update fails; in the
+                latter case the branch is reset to where it started
+        """
+        if self._process is None:
+            return []
+
+        try:
+            with tracing.span("fast-import", "git", commits=self._mark) as span:
+                self._write(b"done\n")
+                self._process.stdin.close()
+                returncode = self._process.wait(timeout=120)
+                span.set(returncode=returncode)
+            if returncode != 0:
+                raise RuntimeError(f"git fast-import failed: {self._read_stderr()}")
+
+            shas = self._read_marks()
+        finally:
+            self._cleanup()
+
+        if shas and self._checked_out:
+            # Two-tree merge moves index and working tree from the old tip to the new one
+            # and refuses to clobber local modifications
+            try:
+                self._run_git(["read-tree", "-m", "-u", self._parent, self.ref])
+            except RuntimeError as e:
+                # Put the branch back on the commit the working tree still matches
+                self._run_git(["update-ref", "-m", "commit builder: working tree update failed",
+                               self.ref, self._parent, shas[-1]])
+                raise RuntimeError(
+                    f"Failed to update the working tree, {self.ref} was reset to {self._parent[:12]} "
+                    f"(the new commits are still available as {shas[-1]}): {e}"
+                ) from e
+
+        logger.debug(f"fast-import wrote {len(shas)} commit(s) to {self.ref}")
+        return shas
+
+    def abort(self):
+        """Stop fast-import without updating the branch"""
+        if self._process is None:
+            return
+        try:
+            self._process.kill()
+            self._process.wait(timeout=10)
+        except Exception as e:
+            logger.debug(f"Failed to stop fast-import cleanly: {e}")
+        finally:
+            self._cleanup()
+        logger.warning(f"Aborted commit import for {self.ref}")
+
+    def _read_marks(self) -> List[str]:
+        marks = {}
+        for line in self._marks_file.read_text(encoding="utf-8").splitlines():
+            mark, _, sha = line.partition(" ")
+            marks[int(mark.lstrip(":"))] = sha.strip()
+        return [marks[m] for m in sorted(marks)]
+
+    def _cleanup(self):
+        self._process = None
+        if self._stderr is not None:
+            self._stderr.close()
+            self._stderr = None
+        if self._marks_file is not None:
+            try:
+                self._marks_file.unlink()
+            except OSError:
+                pass
+            self._marks_file = None
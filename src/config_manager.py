@@ -1,21 +1,52 @@
 import json
 import os
+import threading
+import time
 from pathlib import Path
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Any, Callable, List, Mapping, Optional, Tuple
 import logging
 
+from src.config_schema import ConfigError, ConfigSnapshot, _Frozen, parse_config
+
 logger = logging.getLogger(__name__)
 
+_ENV_VARS = ("GITHUB_TOKEN", "GITHUB_API_URL", "DISCORD_WEBHOOK", "SLACK_WEBHOOK")
+
+# .env files already loaded into os.environ by this process
+_loaded_env_files = set()
+
+
+def _view(value: Any) -> Any:
+    """Read-only mapping view of a snapshot section (nested sections included)"""
+    if isinstance(value, _Frozen):
+        return MappingProxyType({name: _view(getattr(value, name)) for name in value.__slots__})
+    return value
+
 
 class ConfigManager:
-    """Production-ready configuration manager with validation"""
+    """
+    Production-ready configuration manager with validation
+
+    ``settings`` is the validated, immutable ConfigSnapshot; the get_*_config
+    getters return read-only views of the same values for callers that
+    want mappings.
+    """
 
     def __init__(self, config_path="config/config.json"):
         self.config_path = Path(config_path).resolve()
         self.config = {}
+        self._stamp = self._file_stamp()
         self._load_config()
         self._load_env()
         self._validate_config()
+        self._cache_sections()
+
+        # Hot reload state
+        self.version = 1
+        self._subscribers: List[Callable[["ConfigManager"], None]] = []
+        self._reload_lock = threading.Lock()
+        self._next_poll = 0.0
 
     def _load_config(self):
         """Load JSON configuration file"""
@@ -29,30 +60,119 @@ class ConfigManager:
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file: {e}")
 
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """mtime and size of the config file, None if it cannot be read"""
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def _load_env(self):
-        """Load environment variables from .env file"""
-        env_path = Path(".env")
+        """Load environment variables from .env file, once per process"""
+        env_path = Path(".env").resolve()
+        if env_path in _loaded_env_files:
+            return
         if env_path.exists():
+            # Imported here so runs without a .env never load python-dotenv
+            from dotenv import load_dotenv
             load_dotenv(env_path)
+            _loaded_env_files.add(env_path)
             logger.debug("Environment variables loaded from .env")
         else:
             logger.warning(".env file not found, using system environment variables")
 
     def _validate_config(self):
-        """Validate required configuration sections"""
-        required_sections = ["github", "files"]
-        for section in required_sections:
-            if section not in self.config:
-                raise ValueError(f"Missing required config section: {section}")
-
-        # Validate GitHub repository config
-        repo_config = self.get_repo_config()
-        if not repo_config.get("owner") or not repo_config.get("name"):
-            raise ValueError("GitHub repository owner and name must be configured")
+        """Validate the configuration and build the typed snapshot"""
+        self.settings: ConfigSnapshot = parse_config(self.config, {name: os.getenv(name) for name in _ENV_VARS})
+
+    def subscribe(self, callback: Callable[["ConfigManager"], None]):
+        """
+        Register a callback for configuration reloads
+
+        Args:
+            callback: Called with this ConfigManager after a new version was applied
+        """
+        self._subscribers.append(callback)
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """
+        Reload the config file if it changed on disk
+
+        Polling is a single stat() at most every run_settings.config_poll_seconds.
+        A changed file is parsed and validated completely before anything
+        is replaced; invalid JSON, schema errors or a different
+        github.repository are rejected and the last good config stays in
+        effect. Subscribers are notified after a successful reload.
+
+        Args:
+            force: Check the file even if the poll interval has not elapsed
+
+        Returns:
+            True if a new configuration was applied
+        """
+        run_settings = self.settings.run_settings
+        if not run_settings.hot_reload and not force:
+            return False
+        now = time.monotonic()
+        if not force and now < self._next_poll:
+            return False
+        self._next_poll = now + run_settings.config_poll_seconds
+
+        with self._reload_lock:
+            stamp = self._file_stamp()
+            if stamp is None or stamp == self._stamp:
+                return False
+            # Remember the stamp even if this version is rejected, so it is not re-parsed on every poll
+            self._stamp = stamp
+
+            try:
+                with open(self.config_path, "r", encoding="utf-8") as f:
+                    config = json.load(f)
+                settings = parse_config(config, {name: os.getenv(name) for name in _ENV_VARS})
+                if settings.repository.slug != self.settings.repository.slug:
+                    raise ConfigError("github.repository", "cannot change while running, restart to switch repositories")
+            except (OSError, ValueError) as e:
+                logger.error(f"❌ Rejected config change, keeping the last good configuration: {e}")
+                return False
+
+            self.config = config
+            self.settings = settings
+            self._cache_sections()
+            self.version += 1
+            subscribers = list(self._subscribers)
+
+        logger.info(f"🔄 Configuration reloaded from {self.config_path} (version {self.version})")
+        for callback in subscribers:
+            try:
+                callback(self)
+            except Exception as e:
+                logger.error(f"Config reload subscriber failed: {e}")
+        return True
+
+    def _cache_sections(self):
+        """Build the read-only section views getters return, once per config version"""
+        settings = self.settings
+        notifications = settings.notifications
+        self._sections = {
+            "http": _view(settings.http),
+            "repo": _view(settings.repository),
+            "merge": _view(settings.merge),
+            "rate_limit": _view(settings.rate_limit),
+            "response_cache": _view(settings.response_cache),
+            "coauthor": _view(settings.coauthor) if settings.coauthor else MappingProxyType({}),
+            "notifications": MappingProxyType({
+                "enabled": MappingProxyType({"discord": notifications.discord, "slack": notifications.slack}),
+                "dispatch": _view(notifications.dispatch),
+                "outbox": _view(notifications.outbox)
+            }),
+            "pull_request": _view(settings.pull_request),
+            "daemon": _view(settings.daemon)
+        }
 
     def get_github_token(self):
         """Get GitHub token from environment variables"""
-        token = os.getenv("GITHUB_TOKEN")
+        token = self.settings.github_token
         if not token:
             raise ValueError(
                 "GITHUB_TOKEN not found in environment variables. "
@@ -62,34 +182,56 @@ class ConfigManager:
 
     def get_discord_webhook(self):
         """Get Discord webhook URL from environment variables"""
-        webhook = os.getenv("DISCORD_WEBHOOK")
-        return webhook  # Optional, can be None
+        return self.settings.discord_webhook  # Optional, can be None
 
     def get_slack_webhook(self):
         """Get Slack webhook URL from environment variables"""
-        webhook = os.getenv("SLACK_WEBHOOK")
-        return webhook  # Optional, can be None
+        return self.settings.slack_webhook  # Optional, can be None
+
+    def get_github_api_url(self):
+        """Get GitHub API base URL (GITHUB_API_URL for GitHub Enterprise)"""
+        return self.settings.api_url
+
+    def get_repo_slug(self):
+        """Get "owner/name" of the configured repository"""
+        return self.settings.repository.slug
 
-    def get_repo_config(self):
+    def get_http_config(self) -> Mapping[str, Any]:
+        """Get HTTP transport configuration"""
+        return self._sections["http"]
+
+    def get_repo_config(self) -> Mapping[str, Any]:
         """Get repository configuration"""
-        return self.config.get("github", {}).get("repository", {})
+        return self._sections["repo"]
 
-    def get_merge_config(self):
+    def get_merge_config(self) -> Mapping[str, Any]:
         """Get merge configuration"""
-        return self.config.get("github", {}).get("merge", {})
+        return self._sections["merge"]
+
+    def get_rate_limit_config(self) -> Mapping[str, Any]:
+        """Get GitHub rate-limit scheduler configuration"""
+        return self._sections["rate_limit"]
 
-    def get_coauthor_config(self):
+    def get_response_cache_config(self) -> Mapping[str, Any]:
+        """Get GitHub response cache configuration"""
+        return self._sections["response_cache"]
+
+    def get_coauthor_config(self) -> Mapping[str, Any]:
         """Get co-author configuration"""
-        return self.config.get("coauthor", {})
+        return self._sections["coauthor"]
 
-    def get_notification_config(self):
+    def get_notification_config(self) -> Mapping[str, Any]:
         """Get notification configuration"""
-        return self.config.get("notifications", {})
+        return self._sections["notifications"]
 
-    def get_files_to_modify(self):
+    def get_files_to_modify(self) -> Tuple[str, ...]:
         """Get list of files to modify"""
-        return self.config.get("files", {}).get("to_modify", [])
+        return self.settings.files_to_modify
 
-    def get_pr_config(self):
+    def get_pr_config(self) -> Mapping[str, Any]:
         """Get pull request configuration"""
-        return self.config.get("pull_request", {})
\ No newline at end of file
+        return self._sections["pull_request"]
+
+    def get_daemon_config(self) -> Mapping[str, Any]:
+        """Get daemon (job queue) configuration"""
+        return self._sections["daemon"]
\ No newline at end of file
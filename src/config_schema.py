@@ -0,0 +1,376 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.content_updater import log_syntax
+
+logger = logging.getLogger(__name__)
+
+MERGE_METHODS = ("merge", "squash", "rebase")
+
+
+class ConfigError(ValueError):
+    """Invalid configuration value, raised with the dotted path of the offending key"""
+
+    def __init__(self, key: str, message: str):
+        super().__init__(f"config.{key}: {message}")
+        self.key = key
+
+
+class _Frozen:
+    """Base for immutable, slotted config views"""
+
+    __slots__ = ()
+
+    def __init__(self, **values: Any):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class RepositorySettings(_Frozen):
+    """github.repository"""
+
+    __slots__ = ("owner", "name", "default_branch", "slug")
+
+
+class MergeSettings(_Frozen):
+    """github.merge"""
+
+    __slots__ = ("method", "retry_count", "retry_delay_seconds", "poll_timeout_seconds")
+
+
+class RunSettings(_Frozen):
+    """run_settings"""
+
+    __slots__ = (
+        "pr_count", "delay_seconds", "auto_merge", "dry_run", "max_retries", "repo_path", "readme_file",
+        "worktrees", "fetch_staleness_seconds", "max_concurrency", "state_file", "state_compact_every",
+        "hot_reload", "config_poll_seconds"
+    )
+
+
+class Collaborator(_Frozen):
+    """One entry of collaborators (or the coauthor)"""
+
+    __slots__ = ("name", "email")
+
+    def as_dict(self) -> Dict[str, str]:
+        return {"name": self.name, "email": self.email}
+
+
+class RateLimitSettings(_Frozen):
+    """github.rate_limit"""
+
+    __slots__ = ("secondary_per_minute", "secondary_burst", "reserve_fraction", "max_retries")
+
+
+class ResponseCacheSettings(_Frozen):
+    """github.response_cache"""
+
+    __slots__ = ("enabled", "max_entries", "path")
+
+
+class HttpSettings(_Frozen):
+    """http"""
+
+    __slots__ = ("pool_connections", "pool_maxsize", "http2", "timeout_seconds", "max_retries")
+
+
+class PullRequestSettings(_Frozen):
+    """pull_request"""
+
+    __slots__ = ("title", "labels", "draft")
+
+
+class DispatchSettings(_Frozen):
+    """notifications.dispatch"""
+
+    __slots__ = ("enabled", "queue_size", "coalesce_seconds", "max_batch", "retry_interval_seconds")
+
+
+class OutboxSettings(_Frozen):
+    """notifications.outbox"""
+
+    __slots__ = ("enabled", "path", "max_attempts", "base_delay_seconds", "max_delay_seconds", "batch_size")
+
+
+class NotificationSettings(_Frozen):
+    """notifications; discord and slack are the notifications.enabled switches"""
+
+    __slots__ = ("discord", "slack", "dispatch", "outbox")
+
+
+class DaemonSettings(_Frozen):
+    """daemon (job queue)"""
+
+    __slots__ = ("queue_dir", "max_concurrency", "poll_seconds")
+
+
+class ConfigSnapshot(_Frozen):
+    """Validated, read-only view of config.json plus the environment it runs in"""
+
+    __slots__ = (
+        "repository", "merge", "rate_limit", "response_cache", "http", "run_settings", "pull_request",
+        "notifications", "daemon", "collaborators", "coauthor", "files_to_modify", "update_log_entries",
+        "summary_recent_entries", "use_graphql", "api_url", "github_token", "discord_webhook", "slack_webhook"
+    )
+
+
+# Field specs: key -> (types, default, check, description of valid values)
+_NUMBER = (int, float)
+
+
+def _non_negative(value) -> bool:
+    return value >= 0
+
+
+def _positive(value) -> bool:
+    return value > 0
+
+
+_RUN_SETTINGS = {
+    "pr_count": (int, 1, _positive, "a positive integer"),
+    "delay_seconds": (_NUMBER, 0, _non_negative, "a number >= 0"),
+    "auto_merge": (bool, True, None, "true or false"),
+    "dry_run": (bool, False, None, "true or false"),
+    "max_retries": (int, 3, _non_negative, "an integer >= 0"),
+    "repo_path": (str, ".", None, "a path"),
+    "readme_file": (str, "README.md", None, "a path"),
+    "worktrees": (int, None, _non_negative, "an integer >= 0 (0 or null picks one per CPU, up to 4)"),
+    "fetch_staleness_seconds": (_NUMBER, 60, _non_negative, "a number >= 0"),
+    "max_concurrency": (int, 4, _positive, "a positive integer"),
+    "state_file": (str, "state.jsonl", None, "a path"),
+    "state_compact_every": (int, 100, _positive, "a positive integer"),
+    "hot_reload": (bool, True, None, "true or false"),
+    "config_poll_seconds": (_NUMBER, 1.0, _non_negative, "a number >= 0")
+}
+
+_FILES = {
+    "update_log_entries": (int, 10, _positive, "a positive integer"),
+    "summary_recent_entries": (int, 50, _positive, "a positive integer")
+}
+
+_RATE_LIMIT = {
+    "secondary_per_minute": (_NUMBER, 80, _positive, "a positive number"),
+    "secondary_burst": (int, 10, _positive, "a positive integer"),
+    "reserve_fraction": (_NUMBER, 0.2, lambda value: 0 <= value < 1, "a number from 0 up to (not including) 1"),
+    "max_retries": (int, 3, _non_negative, "an integer >= 0")
+}
+
+_RESPONSE_CACHE = {
+    "enabled": (bool, True, None, "true or false"),
+    "max_entries": (int, 512, _positive, "a positive integer"),
+    "path": (str, None, None, "a path or null")
+}
+
+_HTTP = {
+    "pool_connections": (int, 4, _positive, "a positive integer"),
+    "pool_maxsize": (int, 16, _positive, "a positive integer"),
+    "http2": (bool, False, None, "true or false"),
+    "timeout_seconds": (_NUMBER, 30, _positive, "a positive number"),
+    "max_retries": (int, 3, _non_negative, "an integer >= 0")
+}
+
+_PULL_REQUEST = {
+    "title": (str, "🚀 Auto PR Update", None, "a string"),
+    "labels": (list, ["automated"], lambda value: all(isinstance(label, str) for label in value),
+               "a list of label names"),
+    "draft": (bool, False, None, "true or false")
+}
+
+_CHANNELS = {
+    "discord": (bool, True, None, "true or false"),
+    "slack": (bool, True, None, "true or false")
+}
+
+_DISPATCH = {
+    "enabled": (bool, True, None, "true or false"),
+    "queue_size": (int, 1000, _positive, "a positive integer"),
+    "coalesce_seconds": (_NUMBER, 2.0, _non_negative, "a number >= 0"),
+    "max_batch": (int, 20, _positive, "a positive integer"),
+    "retry_interval_seconds": (_NUMBER, 5.0, _positive, "a positive number")
+}
+
+_OUTBOX = {
+    "enabled": (bool, True, None, "true or false"),
+    "path": (str, ".cache/notification-outbox.sqlite3", None, "a path"),
+    "max_attempts": (int, 10, _positive, "a positive integer"),
+    "base_delay_seconds": (_NUMBER, 2.0, _non_negative, "a number >= 0"),
+    "max_delay_seconds": (_NUMBER, 600.0, _non_negative, "a number >= 0"),
+    "batch_size": (int, 20, _positive, "a positive integer")
+}
+
+_DAEMON = {
+    "queue_dir": (str, "queue", None, "a path"),
+    "max_concurrency": (int, 2, _positive, "a positive integer"),
+    "poll_seconds": (_NUMBER, 0.5, _positive, "a positive number")
+}
+
+_MERGE = {
+    "method": (str, "squash", lambda value: value in MERGE_METHODS, f"one of {', '.join(MERGE_METHODS)}"),
+    "retry_count": (int, 3, _non_negative, "an integer >= 0"),
+    "retry_delay_seconds": (_NUMBER, 5, _non_negative, "a number >= 0"),
+    "poll_timeout_seconds": (_NUMBER, 120, _positive, "a positive number")
+}
+
+
+def _type_name(value) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+def _section(config: Dict, key: str) -> Dict:
+    section = config
+    for part in key.split("."):
+        section = section.get(part, {})
+        if not isinstance(section, dict):
+            raise ConfigError(key, f"expected an object, got {_type_name(section)}")
+    return section
+
+
+def _fields(section: Dict, key: str, spec: Dict) -> Dict[str, Any]:
+    """Validate a section against a field spec, filling in defaults"""
+    for name in section:
+        if name not in spec:
+            logger.warning(f"Unknown config key {key}.{name} is ignored")
+
+    values = {}
+    for name, (types, default, check, expected) in spec.items():
+        value = section.get(name, default)
+        if value is None and default is None:
+            values[name] = None
+            continue
+        # bool is an int subclass, but "retry_count": true is a mistake
+        wrong_type = not isinstance(value, types) or (isinstance(value, bool) and types is not bool)
+        if wrong_type or (check and not check(value)):
+            raise ConfigError(f"{key}.{name}", f"expected {expected}, got {value!r}")
+        values[name] = value
+    return values
+
+
+def _person(entry: Any, key: str) -> Collaborator:
+    if not isinstance(entry, dict):
+        raise ConfigError(key, f"expected an object with name and email, got {_type_name(entry)}")
+    name = entry.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ConfigError(f"{key}.name", f"expected a non-empty string, got {name!r}")
+    email = entry.get("email")
+    if not isinstance(email, str) or "@" not in email:
+        raise ConfigError(f"{key}.email", f"expected an email address, got {email!r}")
+    return Collaborator(name=name, email=email)
+
+
+def _collaborators(config: Dict) -> Tuple[Collaborator, ...]:
+    entries = config.get("collaborators", [])
+    if not isinstance(entries, list):
+        raise ConfigError("collaborators", f"expected a list, got {_type_name(entries)}")
+
+    collaborators: List[Collaborator] = []
+    seen = set()
+    for index, entry in enumerate(entries):
+        collaborator = _person(entry, f"collaborators[{index}]")
+        if collaborator.name in seen:
+            raise ConfigError(f"collaborators[{index}].name", f"duplicate collaborator {collaborator.name!r}")
+        seen.add(collaborator.name)
+        collaborators.append(collaborator)
+    return tuple(collaborators)
+
+
+def _notifications(config: Dict) -> NotificationSettings:
+    section = _section(config, "notifications")
+    for name in section:
+        if name not in ("enabled", "dispatch", "outbox"):
+            logger.warning(f"Unknown config key notifications.{name} is ignored")
+    return NotificationSettings(
+        **_fields(_section(config, "notifications.enabled"), "notifications.enabled", _CHANNELS),
+        dispatch=DispatchSettings(**_fields(_section(config, "notifications.dispatch"), "notifications.dispatch",
+                                            _DISPATCH)),
+        outbox=OutboxSettings(**_fields(_section(config, "notifications.outbox"), "notifications.outbox", _OUTBOX))
+    )
+
+
+def _pull_request(config: Dict) -> PullRequestSettings:
+    values = _fields(_section(config, "pull_request"), "pull_request", _PULL_REQUEST)
+    values["labels"] = tuple(values["labels"])
+    return PullRequestSettings(**values)
+
+
+def parse_config(config: Dict, env: Dict[str, Optional[str]]) -> ConfigSnapshot:
+    """
+    Validate a loaded config.json and build its snapshot
+
+    Args:
+        config: Parsed config.json
+        env: GITHUB_TOKEN, GITHUB_API_URL, DISCORD_WEBHOOK and SLACK_WEBHOOK values
+
+    Returns:
+        Immutable ConfigSnapshot
+
+    Raises:
+        ConfigError: A key is missing or has an invalid value
+    """
+    for section in ("github", "files"):
+        if section not in config:
+            raise ConfigError(section, "missing required section")
+
+    repo = _section(config, "github.repository")
+    for name in ("owner", "name"):
+        if not isinstance(repo.get(name), str) or not repo.get(name):
+            raise ConfigError(f"github.repository.{name}", "GitHub repository owner and name must be configured")
+    default_branch = repo.get("default_branch", "main")
+    if not isinstance(default_branch, str) or not default_branch:
+        raise ConfigError("github.repository.default_branch", f"expected a branch name, got {default_branch!r}")
+
+    files = _section(config, "files").get("to_modify", [])
+    if not isinstance(files, list) or not all(isinstance(path, str) for path in files):
+        raise ConfigError("files.to_modify", "expected a list of paths")
+    for path in files:
+        try:
+            log_syntax(path)
+        except ValueError as e:
+            raise ConfigError("files.to_modify", str(e))
+    file_settings = _fields(
+        {key: value for key, value in _section(config, "files").items() if key != "to_modify"}, "files", _FILES
+    )
+
+    coauthor = config.get("coauthor")
+    use_graphql = _section(config, "github").get("use_graphql", False)
+    if not isinstance(use_graphql, bool):
+        raise ConfigError("github.use_graphql", f"expected true or false, got {use_graphql!r}")
+
+    return ConfigSnapshot(
+        repository=RepositorySettings(
+            owner=repo["owner"],
+            name=repo["name"],
+            default_branch=default_branch,
+            slug=f"{repo['owner']}/{repo['name']}"
+        ),
+        merge=MergeSettings(**_fields(_section(config, "github.merge"), "github.merge", _MERGE)),
+        rate_limit=RateLimitSettings(**_fields(_section(config, "github.rate_limit"), "github.rate_limit",
+                                               _RATE_LIMIT)),
+        response_cache=ResponseCacheSettings(**_fields(_section(config, "github.response_cache"),
+                                                       "github.response_cache", _RESPONSE_CACHE)),
+        http=HttpSettings(**_fields(_section(config, "http"), "http", _HTTP)),
+        run_settings=RunSettings(**_fields(_section(config, "run_settings"), "run_settings", _RUN_SETTINGS)),
+        pull_request=_pull_request(config),
+        notifications=_notifications(config),
+        daemon=DaemonSettings(**_fields(_section(config, "daemon"), "daemon", _DAEMON)),
+        collaborators=_collaborators(config),
+        coauthor=_person(coauthor, "coauthor") if coauthor else None,
+        files_to_modify=tuple(files),
+        update_log_entries=file_settings["update_log_entries"],
+        summary_recent_entries=file_settings["summary_recent_entries"],
+        use_graphql=use_graphql,
+        api_url=(env.get("GITHUB_API_URL") or "https://api.github.com").rstrip("/"),
+        github_token=env.get("GITHUB_TOKEN") or None,
+        discord_webhook=env.get("DISCORD_WEBHOOK") or None,
+        slack_webhook=env.get("SLACK_WEBHOOK") or None
+    )
@@ -0,0 +1,238 @@
+import os
+import re
+import stat
+import tempfile
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+UPDATE_LOG_START = "<!-- auto-pr:update-log:start -->"
+UPDATE_LOG_END = "<!-- auto-pr:update-log:end -->"
+
+# Lines earlier versions appended forever; they are folded into the update log
+_LEGACY_LINES = (
+    re.compile(r"^# (Auto-updated on .+)$"),
+    re.compile(r"^- (🚀 Contribution from @.+)$")
+)
+
+
+class LogSyntax:
+    """How the update log is written in one kind of file: block markers and entry framing"""
+
+    def __init__(self, start: str, end: str, prefix: str, suffix: str = ""):
+        self.start = start
+        self.end = end
+        self.prefix = prefix
+        self.suffix = suffix
+        self.block = re.compile(re.escape(start) + r"\n?(.*?)" + re.escape(end), re.DOTALL)
+
+    def entry(self, text: str) -> str:
+        return f"{self.prefix}{text}{self.suffix}"
+
+    def parse(self, line: str) -> Optional[str]:
+        """Entry text of a block line, None for anything else"""
+        if not line.startswith(self.prefix) or not line.endswith(self.suffix):
+            return None
+        return line[len(self.prefix):len(line) - len(self.suffix)]
+
+
+MARKDOWN = LogSyntax(UPDATE_LOG_START, UPDATE_LOG_END, "- ")
+HASH_COMMENTS = LogSyntax("# auto-pr:update-log:start", "# auto-pr:update-log:end", "# - ")
+SLASH_COMMENTS = LogSyntax("// auto-pr:update-log:start", "// auto-pr:update-log:end", "// - ")
+BLOCK_COMMENTS = LogSyntax("/* auto-pr:update-log:start */", "/* auto-pr:update-log:end */", "/* - ", " */")
+DASH_COMMENTS = LogSyntax("-- auto-pr:update-log:start", "-- auto-pr:update-log:end", "-- - ")
+
+_SYNTAX_BY_SUFFIX = {
+    **dict.fromkeys((".md", ".markdown", ".mdx", ".html", ".htm", ".xml", ".svg"), MARKDOWN),
+    **dict.fromkeys((".js", ".jsx", ".ts", ".tsx", ".mjs", ".c", ".h", ".cc", ".cpp", ".hpp", ".cs",
+                     ".java", ".kt", ".go", ".rs", ".swift", ".scala", ".dart", ".php", ".scss"), SLASH_COMMENTS),
+    ".css": BLOCK_COMMENTS,
+    **dict.fromkeys((".sql", ".lua", ".hs"), DASH_COMMENTS)
+}
+
+# Formats without comments; any update log would make them invalid
+_NO_COMMENTS = (".json", ".ipynb")
+
+
+def log_syntax(path: str) -> LogSyntax:
+    """
+    Pick the update log syntax for a file from its extension
+
+    Markup files get an HTML comment block, C-like sources ``//`` comments,
+    and everything else (Python, shell, YAML, TOML, plain text, ...) ``#``
+    comments, the syntax of the line earlier versions appended.
+
+    Raises:
+        ValueError: The file format has no comments
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in _NO_COMMENTS:
+        raise ValueError(f"{path}: {suffix} files have no comment syntax for an update log")
+    return _SYNTAX_BY_SUFFIX.get(suffix, HASH_COMMENTS)
+
+
+def atomic_write(path: Path, data: bytes):
+    """
+    Replace a file's contents atomically
+
+    The data is written to a temporary file in the same directory and
+    renamed over the target, so readers see either the old or the new file.
+    Permissions of an existing file are kept.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class ContentUpdater:
+    """
+    Keeps a bounded, rolling update log in tracked files
+
+    Instead of appending a line on every run, each file gets one block
+    between a start and an end marker holding the last ``max_entries``
+    entries. New entries push out the oldest, so file size, blob size and
+    diff size stay constant however many runs there have been. The block
+    is written as comments in the file's own syntax (see log_syntax) and
+    keeps the file's line endings. Lines appended by earlier versions
+    ("# Auto-updated on ...", "- 🚀 Contribution from ...") are folded into
+    the block the first time a file is updated.
+    """
+
+    def __init__(self, max_entries: int = 10):
+        """
+        Initialize updater
+
+        Args:
+            max_entries: Entries kept in each file's update log
+        """
+        self.max_entries = max(1, max_entries)
+
+    def render(self, content: Optional[str], entry: str, path: str = "README.md") -> str:
+        """
+        Add an entry to the update log of a file's content
+
+        Args:
+            content: Current file content, None for a new file
+            entry: Log entry text (one line)
+            path: File path, selects the comment syntax of the block
+
+        Returns:
+            New file content
+
+        Raises:
+            ValueError: The file format has no comments
+        """
+        syntax = log_syntax(path)
+        content = content or ""
+        crlf = "\r\n" in content
+        if crlf:
+            content = content.replace("\r\n", "\n")
+
+        found = syntax
+        match = syntax.block.search(content)
+        if not match and syntax is not MARKDOWN:
+            # Earlier releases wrote the Markdown block into every file type
+            found = MARKDOWN
+            match = MARKDOWN.block.search(content)
+        if match:
+            before, after = content[:match.start()], content[match.end():]
+            logged = [text for text in map(found.parse, match.group(1).split("\n")) if text is not None]
+        else:
+            before, after, logged = content, "", []
+
+        # Lines appended by earlier versions are the oldest entries
+        legacy: List[str] = []
+        before, after = (self._fold_legacy(part, legacy) for part in (before, after))
+        entries = legacy + logged + [entry]
+
+        block = "\n".join(
+            [syntax.start] + [syntax.entry(item) for item in entries[-self.max_entries:]] + [syntax.end]
+        )
+
+        if match:
+            rendered = before + block + after
+        else:
+            before = before.rstrip()
+            rendered = f"{before}\n\n{block}\n" if before else f"{block}\n"
+        return rendered.replace("\n", "\r\n") if crlf else rendered
+
+    @staticmethod
+    def _fold_legacy(text: str, entries: List[str]) -> str:
+        """Move legacy appended lines from text into entries"""
+        if "Auto-updated on" not in text and "Contribution from @" not in text:
+            return text
+        kept = []
+        for line in text.split("\n"):
+            legacy = next((m for m in (p.match(line) for p in _LEGACY_LINES) if m), None)
+            if legacy:
+                entries.append(legacy.group(1))
+            else:
+                kept.append(line)
+        # Each legacy line came with a blank line before it
+        return re.sub(r"\n{3,}", "\n\n", "\n".join(kept))
+
+    def render_files(self, contents: Dict[str, Optional[str]], entry: str) -> Dict[str, str]:
+        """
+        Compute new contents for several files in one pass
+
+        Args:
+            contents: Current content per path (None for new files)
+            entry: Log entry added to every file
+
+        Returns:
+            New content per path
+        """
+        return {path: self.render(content, entry, path) for path, content in contents.items()}
+
+    def update_files(self, root: Path, files: List[str], entry: str) -> List[str]:
+        """
+        Add an entry to the update log of files on disk
+
+        Every file is read and its new content computed before the first
+        write; each write is atomic. Missing parent directories are created
+        once per directory.
+
+        Args:
+            root: Directory the paths are relative to
+            files: File paths
+            entry: Log entry added to every file
+
+        Returns:
+            Paths that were updated
+        """
+        current: Dict[str, Optional[str]] = {}
+        for file_path in files:
+            try:
+                # newline="" keeps CRLF files as they are
+                with open(root / file_path, "r", encoding="utf-8", newline="") as f:
+                    current[file_path] = f.read()
+            except FileNotFoundError:
+                current[file_path] = None
+
+        rendered = self.render_files(current, entry)
+
+        created = set()
+        for file_path, content in rendered.items():
+            full_path = root / file_path
+            if current[file_path] is None and full_path.parent not in created:
+                full_path.parent.mkdir(parents=True, exist_ok=True)
+                created.add(full_path.parent)
+            atomic_write(full_path, content.encode("utf-8"))
+            logger.debug(f"Updated log in {file_path}")
+
+        return list(rendered)
@@ -0,0 +1,133 @@
+import json
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PATH = "contributions/SUMMARY.md"
+INDEX_PATH = "contributions/.summary-index.json"
+INDEX_VERSION = 1
+
+
+class ContributionSummary:
+    """
+    Incrementally maintained contributions/SUMMARY.md
+
+    Per-collaborator totals and the most recent contribution records live in
+    a small sidecar index (INDEX_PATH) committed next to the summary. Each
+    branch folds its own commits into the index and re-renders the summary
+    from it, so the work per branch depends on the number of collaborators
+    and ``max_recent``, not on how many contributions were ever recorded.
+    Older records are counted but only the latest ``max_recent`` are listed.
+    """
+
+    def __init__(self, index: Optional[Dict] = None, max_recent: int = 50):
+        """
+        Initialize summary
+
+        Args:
+            index: Parsed sidecar index, None to start empty
+            max_recent: Individual contributions listed in the summary
+        """
+        index = index or {}
+        self.contributors: Dict[str, Dict] = index.get("contributors", {})
+        self.recent: List[Dict] = index.get("recent", [])
+        self.total = index.get("total", 0)
+        self.branches = index.get("branches", 0)
+        self.max_recent = max(1, max_recent)
+
+    @classmethod
+    def load(cls, text: Optional[str], max_recent: int = 50) -> "ContributionSummary":
+        """
+        Create a summary from the content of the sidecar index
+
+        An unreadable or incompatible index is logged and replaced by an
+        empty one, so the summary restarts instead of failing the branch.
+
+        Args:
+            text: Index file content, None if the file does not exist
+            max_recent: Individual contributions listed in the summary
+        """
+        if text is None:
+            return cls(max_recent=max_recent)
+        try:
+            index = json.loads(text)
+            if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+                raise ValueError(f"expected an index of version {INDEX_VERSION}")
+        except ValueError as e:
+            logger.warning(f"Ignoring contributions index {INDEX_PATH}: {e}")
+            return cls(max_recent=max_recent)
+        return cls(index, max_recent)
+
+    def add(self, branch: str, commits: List[Dict]):
+        """
+        Fold one branch's commits into the aggregates
+
+        Args:
+            branch: Branch the commits were made on
+            commits: Records from create_multi_collaborator_commits
+        """
+        for commit in commits:
+            row = self.contributors.setdefault(commit['collaborator'], {'email': commit['email'], 'commits': 0})
+            row['email'] = commit['email']
+            row['commits'] += 1
+            row['last'] = commit['timestamp'][:10]
+            self.recent.append({
+                'date': commit['timestamp'][:10],
+                'collaborator': commit['collaborator'],
+                'file': commit['file'],
+                'branch': branch
+            })
+        del self.recent[:-self.max_recent]
+        self.total += len(commits)
+        self.branches += 1
+
+    def to_json(self) -> str:
+        """Serialize the sidecar index"""
+        return json.dumps({
+            "version": INDEX_VERSION,
+            "total": self.total,
+            "branches": self.branches,
+            "contributors": self.contributors,
+            "recent": self.recent
+        }, indent=2, ensure_ascii=False) + "\n"
+
+    def render(self, branch: str, generated: Optional[datetime] = None) -> str:
+        """
+        Render SUMMARY.md
+
+        Args:
+            branch: Branch the summary is committed on
+            generated: Generation time, now if omitted
+
+        Returns:
+            Markdown content
+        """
+        generated = generated or datetime.now()
+        lines = [
+            "# 📊 Collaborative Contributions Summary",
+            "",
+            f"## 🌿 Branch: `{branch}`",
+            f"**Generated:** {generated.strftime('%Y-%m-%d %H:%M:%S')}  ",
+            f"**Total:** {self.total} contributions across {self.branches} branches",
+            "",
+            f"## 👥 Contributors ({len(self.contributors)})",
+            "",
+            "| # | Contributor | Email | Commits | Last |",
+            "|---|-------------|-------|---------|------|"
+        ]
+        lines.extend(
+            f"| {i} | @{name} | `{row['email']}` | {row['commits']} | {row.get('last', '')} |"
+            for i, (name, row) in enumerate(self.contributors.items(), 1)
+        )
+        lines += ["", "## 📝 Individual Contributions", ""]
+        lines.extend(
+            f"- [{record['date']}] @{record['collaborator']}: `{record['file']}` on `{record['branch']}`"
+            for record in reversed(self.recent)
+        )
+        earlier = self.total - len(self.recent)
+        if earlier > 0:
+            lines.append(f"- … and {earlier} earlier contributions")
+        lines += ["", "---", "*🤖 Generated by Auto PR Creator - Collaborative Mode*", ""]
+        return "\n".join(lines)
@@ -0,0 +1,260 @@
+import json
+import os
+import signal
+import threading
+import time
+import uuid
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+JOB_MODES = ("single", "collaborator")
+
+
+class JobError(ValueError):
+    """Invalid job file, raised with the offending key"""
+
+
+@dataclass
+class Job:
+    """One queued request for PRs"""
+
+    id: str
+    mode: str = "single"
+    files: Optional[List[str]] = None
+    labels: Optional[List[str]] = None
+    count: int = 1
+
+    @classmethod
+    def from_dict(cls, data: Any, default_id: str) -> "Job":
+        """
+        Validate a parsed job file
+
+        Args:
+            data: Parsed JSON
+            default_id: ID used when the job has none (the file name)
+
+        Raises:
+            JobError: A key is missing or has an invalid value
+        """
+        if not isinstance(data, dict):
+            raise JobError("job: expected an object")
+        job_id = data.get("id", default_id)
+        if not isinstance(job_id, str) or not job_id:
+            raise JobError(f"job.id: expected a non-empty string, got {job_id!r}")
+        mode = data.get("mode", "single")
+        if mode not in JOB_MODES:
+            raise JobError(f"job.mode: expected one of {', '.join(JOB_MODES)}, got {mode!r}")
+        for key in ("files", "labels"):
+            value = data.get(key)
+            if value is not None and (not isinstance(value, list) or not all(isinstance(v, str) for v in value)):
+                raise JobError(f"job.{key}: expected a list of strings, got {value!r}")
+        if data.get("files") is not None and mode != "single":
+            raise JobError("job.files: only supported in single mode")
+        count = data.get("count", 1)
+        if not isinstance(count, int) or isinstance(count, bool) or count < 1:
+            raise JobError(f"job.count: expected a positive integer, got {count!r}")
+        return cls(id=job_id, mode=mode, files=data.get("files"), labels=data.get("labels"), count=count)
+
+
+def submit_job(queue_dir: str, job: Dict) -> Path:
+    """
+    Drop a job into a daemon's queue
+
+    The file is written under a temporary name and renamed into incoming/,
+    so the daemon never sees a partial job.
+
+    Args:
+        queue_dir: Daemon queue directory
+        job: Job fields (mode, files, labels, count, id)
+
+    Returns:
+        Path of the queued job file
+    """
+    incoming = Path(queue_dir) / "incoming"
+    incoming.mkdir(parents=True, exist_ok=True)
+    name = f"{datetime.now().strftime('%Y%m%d%H%M%S%f')}-{job.get('id') or uuid.uuid4().hex[:8]}.json"
+    tmp = incoming / f".{name}.tmp"
+    tmp.write_text(json.dumps(job), encoding="utf-8")
+    os.replace(tmp, incoming / name)
+    return incoming / name
+
+
+class JobDaemon:
+    """
+    Long-running job processor around one warm AutoPRCreator
+
+    Jobs are JSON files dropped into ``<queue_dir>/incoming`` (see
+    submit_job). Each one is claimed by renaming it into ``processing/``,
+    run, and moved to ``done/`` next to a ``.result.json`` with its status
+    and PRs. Up to ``max_concurrency`` jobs run at once; building and
+    merging branches is serialized (see AutoPRCreator.run_once), PR
+    creation without auto-merge and notifications overlap. SIGINT/SIGTERM
+    stop claiming new jobs and let the running ones finish. Jobs left in
+    ``processing/`` by a crash are re-queued on start and run again from
+    the beginning. A changed config file is applied only while no job is
+    running.
+    """
+
+    def __init__(self, creator, queue_dir: str = "queue", max_concurrency: int = 2, poll_interval: float = 0.5):
+        """
+        Initialize daemon
+
+        Args:
+            creator: AutoPRCreator whose clients stay warm between jobs
+            queue_dir: Directory holding incoming/, processing/ and done/
+            max_concurrency: Jobs processed at the same time
+            poll_interval: Seconds between scans of incoming/
+        """
+        self.creator = creator
+        self.queue_dir = Path(queue_dir)
+        self.incoming = self.queue_dir / "incoming"
+        self.processing = self.queue_dir / "processing"
+        self.done = self.queue_dir / "done"
+        self.max_concurrency = max(1, max_concurrency)
+        self.poll_interval = poll_interval
+
+        self._stop = threading.Event()
+        self._branch_lock = threading.Lock()
+        self._counts_lock = threading.Lock()
+        self.counts = {"succeeded": 0, "failed": 0, "rejected": 0}
+
+    @classmethod
+    def from_config(cls, creator, queue_dir: Optional[str] = None) -> "JobDaemon":
+        """Create a daemon from the daemon config section"""
+        settings = creator.config.settings.daemon
+        return cls(
+            creator,
+            queue_dir=queue_dir or settings.queue_dir,
+            max_concurrency=settings.max_concurrency,
+            poll_interval=settings.poll_seconds
+        )
+
+    def stop(self):
+        """Stop claiming jobs; run() returns once in-flight jobs are done"""
+        self._stop.set()
+
+    def _on_signal(self, signum, frame):
+        name = signal.Signals(signum).name
+        if self._stop.is_set():
+            logger.warning(f"Received {name} again, still waiting for in-flight jobs")
+            return
+        logger.info(f"🛑 Received {name}, finishing in-flight jobs before exiting")
+        self.stop()
+
+    def run(self) -> bool:
+        """
+        Process jobs until stopped
+
+        Returns:
+            True if no job failed
+        """
+        for directory in (self.incoming, self.processing, self.done):
+            directory.mkdir(parents=True, exist_ok=True)
+        self._requeue_interrupted()
+
+        previous_handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                previous_handlers[signum] = signal.signal(signum, self._on_signal)
+
+        logger.info(f"🛰️ Daemon watching {self.incoming} (max {self.max_concurrency} concurrent jobs)")
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="daemon-job")
+        in_flight: Set[Future] = set()
+        try:
+            while not self._stop.is_set():
+                in_flight = {future for future in in_flight if not future.done()}
+                # Apply config changes between jobs only, so a running job never sees two versions
+                if not in_flight:
+                    self.creator.config.reload_if_changed()
+                for path in self._claim(self.max_concurrency - len(in_flight)):
+                    in_flight.add(executor.submit(self._process, path))
+                self._stop.wait(self.poll_interval)
+
+            running = sum(1 for future in in_flight if not future.done())
+            if running:
+                logger.info(f"⏳ Draining {running} in-flight job(s)")
+        finally:
+            executor.shutdown(wait=True)
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+        logger.info(
+            f"👋 Daemon stopped: {self.counts['succeeded']} succeeded, "
+            f"{self.counts['failed']} failed, {self.counts['rejected']} rejected"
+        )
+        return self.counts["failed"] == 0
+
+    def _requeue_interrupted(self):
+        interrupted = sorted(self.processing.glob("*.json"))
+        for path in interrupted:
+            os.replace(path, self.incoming / path.name)
+        if interrupted:
+            logger.info(f"♻️ Re-queued {len(interrupted)} interrupted job(s)")
+
+    def _claim(self, limit: int) -> List[Path]:
+        """Move up to ``limit`` jobs, oldest name first, from incoming/ to processing/"""
+        if limit <= 0:
+            return []
+        claimed = []
+        for path in sorted(self.incoming.glob("*.json")):
+            target = self.processing / path.name
+            try:
+                os.rename(path, target)
+            except FileNotFoundError:
+                continue  # claimed by another daemon
+            claimed.append(target)
+            if len(claimed) >= limit:
+                break
+        return claimed
+
+    def _process(self, path: Path) -> Dict[str, Any]:
+        """Run one claimed job and write its result"""
+        started = time.time()
+        result: Dict[str, Any] = {"id": path.stem, "status": "failed", "prs": [], "error": None}
+        try:
+            job = Job.from_dict(json.loads(path.read_text(encoding="utf-8")), path.stem)
+            result.update(id=job.id, mode=job.mode)
+            logger.info(f"📥 Job {job.id}: {job.count} PR(s) in {job.mode} mode")
+            for _ in range(job.count):
+                pr = self.creator.run_once(job.mode, files=job.files, labels=job.labels,
+                                           branch_lock=self._branch_lock)
+                if pr:
+                    result["prs"].append({"number": pr.get("number"), "html_url": pr.get("html_url")})
+            result["status"] = "succeeded"
+        except (JobError, json.JSONDecodeError) as e:
+            result.update(status="rejected", error=str(e))
+            logger.error(f"❌ Rejected job {path.name}: {e}")
+        except Exception as e:
+            result["error"] = str(e)
+            logger.error(f"❌ Job {result['id']} failed: {e}")
+            try:
+                self.creator.notifier.send_error_notification(e, {"job": result["id"]})
+            except Exception:
+                pass
+
+        result.update(
+            started_at=datetime.fromtimestamp(started).isoformat(timespec="seconds"),
+            duration_seconds=round(time.time() - started, 3)
+        )
+        self._finish(path, result)
+        return result
+
+    def _finish(self, path: Path, result: Dict[str, Any]):
+        """Write the result next to the job in done/"""
+        result_path = self.done / f"{path.stem}.result.json"
+        tmp = result_path.with_name(f".{result_path.name}.tmp")
+        tmp.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        os.replace(tmp, result_path)
+        os.replace(path, self.done / path.name)
+
+        with self._counts_lock:
+            self.counts[result["status"]] += 1
+        if result["status"] == "succeeded":
+            numbers = ", ".join(f"#{pr['number']}" for pr in result["prs"]) or "none (dry run)"
+            logger.info(f"✅ Job {result['id']} done in {result['duration_seconds']:.1f}s, PRs: {numbers}")
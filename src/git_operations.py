@@ -1,42 +1,125 @@
-import subprocess
 from pathlib import Path
 from datetime import datetime
 import logging
-from typing import List, Optional
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src import tracing
+from src.content_updater import ContentUpdater
+from src.git_process import GitProcessPool
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class StageResult:
+    """Outcome of staging a batch of files"""
+
+    staged: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True when every requested file was staged"""
+        return not self.failed
+
+
+class RefFreshnessCache:
+    """
+    Remembers the SHA of remote branches and when they were last fetched
+
+    Entries older than ``max_age`` seconds are considered stale. Fetches go
+    through a lock, so GitOperations instances sharing one cache (e.g. across
+    worktrees of the same repository) fetch a branch at most once per window.
+    """
+
+    def __init__(self, max_age: float = 60, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize freshness cache
+
+        Args:
+            max_age: Seconds after which a fetched SHA is considered stale
+            clock: Monotonic time source
+        """
+        self.max_age = max_age
+        self._clock = clock
+        self._entries: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def is_fresh(self, branch: str) -> bool:
+        """Check whether a branch was fetched within the staleness window"""
+        entry = self._entries.get(branch)
+        return entry is not None and self._clock() - entry[1] < self.max_age
+
+    def get_or_refresh(self, branch: str, fetch: Callable[[], str]) -> str:
+        """
+        Get the cached SHA of a branch, calling ``fetch`` if it is stale
+
+        Args:
+            branch: Remote branch name
+            fetch: Callable that fetches the branch and returns its new SHA
+
+        Returns:
+            SHA of the remote branch
+        """
+        with self._lock:
+            if self.is_fresh(branch):
+                return self._entries[branch][0]
+            sha = fetch()
+            self._entries[branch] = (sha, self._clock())
+            return sha
+
+    def invalidate(self, branch: Optional[str] = None):
+        """Forget one branch, or all branches, so the next use fetches again"""
+        with self._lock:
+            if branch is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(branch, None)
+
+
 class GitOperations:
     """Windows-optimized Git operations using subprocess"""
 
-    def __init__(self, config, repo_path="."):
+    def __init__(self, config, repo_path=".", freshness_cache: Optional[RefFreshnessCache] = None):
         """
         Initialize Git operations
         
         Args:
             config: ConfigManager instance
             repo_path: Path to git repository
+            freshness_cache: Shared remote ref cache, created from run_settings if omitted
         """
         self.config = config
         self.repo_path = Path(repo_path).resolve()
+        self.git_pool = GitProcessPool(self.repo_path)
+
+        if freshness_cache is None:
+            max_age = config.settings.run_settings.fetch_staleness_seconds
+            freshness_cache = RefFreshnessCache(max_age)
+        self.freshness_cache = freshness_cache
+        self.content_updater = ContentUpdater(config.settings.update_log_entries)
         self._verify_git_repo()
 
     def _verify_git_repo(self):
         """Verify that the current directory is a git repository"""
         try:
-            self._run_git(["status", "--porcelain"])
+            self.git_pool.verify()
             logger.debug(f"Verified git repository at {self.repo_path}")
         except RuntimeError:
             raise RuntimeError(f"Not a git repository: {self.repo_path}")
 
-    def _run_git(self, args: List[str], check: bool = True) -> str:
+    def _run_git(self, args: List[str], check: bool = True, input: Optional[str] = None) -> str:
         """
         Run git command with proper error handling
         
         Args:
             args: Git command arguments
             check: Whether to check return code
+            input: Optional data for stdin
         
         Returns:
             Command output
@@ -44,29 +127,13 @@ class GitOperations:
         Raises:
             RuntimeError: If git command fails
         """
-        try:
-            result = subprocess.run(
-                ["git"] + args,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                shell=True,  # Required for Windows
-                timeout=30
-            )
-
-            if check and result.returncode != 0:
-                error_msg = result.stderr.strip() or f"Git command failed: {' '.join(args)}"
-                raise RuntimeError(error_msg)
-
-            if result.stdout:
-                logger.debug(f"Git output: {result.stdout.strip()[:200]}")
-
-            return result.stdout.strip()
-
-        except subprocess.TimeoutExpired:
-            raise RuntimeError(f"Git command timed out: {' '.join(args)}")
-        except Exception as e:
-            raise RuntimeError(f"Failed to run git command: {e}")
+        with tracing.span(args[0] if args else "git", "git", argv=args):
+            output = self.git_pool.run(args, check=check, input=input)
+
+        if output:
+            logger.debug("Git output: %.200s", output)
+
+        return output
 
     def create_branch(self, branch_name: str):
         """
@@ -75,52 +142,136 @@ class GitOperations:
         Args:
             branch_name: Name of the branch to create
         """
-        default_branch = self.config.get_repo_config().get("default_branch", "main")
+        default_branch = self.config.settings.repository.default_branch
 
         logger.info(f"Creating branch: {branch_name} from {default_branch}")
 
-        # Fetch latest changes
-        self._run_git(["fetch", "--all"])
+        if self.git_pool.resolve(f"refs/heads/{branch_name}"):
+            raise RuntimeError(f"Branch already exists: {branch_name}")
 
-        # Checkout default branch and pull latest
-        self._run_git(["checkout", default_branch])
-        self._run_git(["pull", "origin", default_branch])
+        # Fetch the default branch only if our last look at it is stale
+        self.refresh_default_branch()
 
-        # Create and switch to new branch
-        self._run_git(["checkout", "-b", branch_name])
+        # Branch straight from the remote-tracking ref, no local checkout/pull needed
+        self._run_git(["checkout", "--no-track", "-b", branch_name, f"origin/{default_branch}"])
 
         logger.info(f"Successfully created branch: {branch_name}")
 
+    def refresh_default_branch(self, force: bool = False) -> str:
+        """
+        Make sure origin/<default_branch> is recent enough to branch from
+
+        Args:
+            force: Fetch even if the cached SHA is still fresh
+
+        Returns:
+            SHA of origin/<default_branch>
+        """
+        default_branch = self.config.settings.repository.default_branch
+        if force:
+            self.freshness_cache.invalidate(default_branch)
+
+        def fetch() -> str:
+            self._run_git(["fetch", "origin", default_branch])
+            sha = self.git_pool.resolve(f"refs/remotes/origin/{default_branch}")
+            if not sha:
+                raise RuntimeError(f"Remote branch not found after fetch: origin/{default_branch}")
+            logger.debug(f"Fetched origin/{default_branch} at {sha[:12]}")
+            return sha
+
+        return self.freshness_cache.get_or_refresh(default_branch, fetch)
+
+    def detach(self):
+        """Detach HEAD at the current commit"""
+        self._run_git(["checkout", "--detach"])
+
     def modify_files(self, files: List[str]) -> List[str]:
         """
-        Modify specified files
-        
+        Add an entry to the rolling update log of the specified files
+
+        All new contents are computed before anything is written, and each
+        file is replaced atomically. The log keeps the last
+        files.update_log_entries entries, so the files do not grow. The
+        entry names the checked out branch, so it differs from every entry
+        already in the log even when they were written in the same second.
+
         Args:
             files: List of file paths to modify
             
         Returns:
             List of successfully modified files
         """
-        modified = []
-        timestamp = datetime.now()
+        entry = f"Auto-updated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} in `{self.get_current_branch()}`"
+        try:
+            return self.content_updater.update_files(self.repo_path, files, entry)
+        except Exception as e:
+            logger.error(f"Failed to modify files {', '.join(files)}: {e}")
+            raise
+
+    def stage_files(self, files: List[str]) -> StageResult:
+        """
+        Stage files with a single index update
+
+        Paths are validated up front so one bad entry is reported on its own
+        instead of aborting the whole batch. Missing files that are tracked in
+        HEAD are staged as deletions. Symlinks are staged as links, not as
+        the file they point to. If git still rejects the batch, the paths
+        are staged one by one so each failure is reported for its own path.
+
+        Args:
+            files: Repository-relative file paths
 
-        for file_path in files:
+        Returns:
+            StageResult with staged paths and a reason for each failed path
+        """
+        result = StageResult()
+        candidates = []
+        missing = []
+
+        for file_path in dict.fromkeys(files):
+            # Normalized lexically: resolve() would follow a symlink to its target
+            full_path = Path(os.path.normpath(self.repo_path / file_path))
             try:
-                full_path = self.repo_path / file_path
-                full_path.parent.mkdir(parents=True, exist_ok=True)
+                relative = full_path.relative_to(self.repo_path).as_posix()
+            except ValueError:
+                result.failed[file_path] = "outside of repository"
+                continue
 
-                # Append timestamp to file
-                with open(full_path, "a", encoding="utf-8", newline="\n") as f:
-                    f.write(f"\n# Auto-updated on {timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            if relative == ".":
+                result.failed[file_path] = "is a directory"
+            elif full_path.is_symlink():
+                candidates.append((file_path, relative))
+            elif full_path.is_dir():
+                result.failed[file_path] = "is a directory"
+            elif full_path.exists():
+                candidates.append((file_path, relative))
+            else:
+                missing.append((file_path, relative))
 
-                modified.append(file_path)
-                logger.debug(f"Modified file: {file_path}")
+        # Deleted files can only be staged if HEAD tracks them
+        if missing:
+            lookups = self.git_pool.batch_check([f"HEAD:{relative}" for _, relative in missing])
+            for (file_path, relative), found in zip(missing, lookups):
+                if found:
+                    candidates.append((file_path, relative))
+                else:
+                    result.failed[file_path] = "does not exist"
 
-            except Exception as e:
-                logger.error(f"Failed to modify file {file_path}: {e}")
-                raise
+        if candidates:
+            try:
+                self.git_pool.update_index([relative for _, relative in candidates])
+                result.staged.extend(file_path for file_path, _ in candidates)
+            except RuntimeError:
+                # update-index stops at the first bad path; find out which ones git rejects
+                for file_path, relative in candidates:
+                    try:
+                        self.git_pool.update_index([relative])
+                        result.staged.append(file_path)
+                    except RuntimeError as e:
+                        result.failed[file_path] = str(e)
 
-        return modified
+        logger.debug(f"Staged {len(result.staged)} file(s), {len(result.failed)} failed")
+        return result
 
     def commit(self, files: List[str], coauthor: dict):
         """
@@ -134,10 +285,11 @@ class GitOperations:
             logger.warning("No files to commit")
             return
 
-        # Stage files
-        for file_path in files:
-            self._run_git(["add", file_path])
-            logger.debug(f"Staged file: {file_path}")
+        # Stage all files with a single index update
+        result = self.stage_files(files)
+        if not result.ok:
+            failures = "; ".join(f"{path}: {reason}" for path, reason in result.failed.items())
+            raise RuntimeError(f"Failed to stage {len(result.failed)} file(s): {failures}")
 
         # Create commit message with proper co-author format
         # IMPORTANT: GitHub requires:
@@ -155,12 +307,11 @@ Changes made to {len(files)} file(s).
 
 Co-authored-by: {coauthor['name']} <{coauthor['email']}>
 """
-        # Commit with the formatted message
-        # Using -m with a multi-line string works correctly in git
-        self._run_git(["commit", "-m", message])
+        # Commit with the formatted message, passed on stdin
+        self._run_git(["commit", "-F", "-"], input=message)
         
         # Verify the commit message format
-        logger.debug(f"Commit message format:\n{message}")
+        logger.debug("Commit message format:\n%s", message)
         logger.info(f"Committed {len(files)} files with co-author: {coauthor['name']}")
 
     def push(self, branch_name: str):
@@ -175,9 +326,18 @@ Co-authored-by: {coauthor['name']} <{coauthor['email']}>
 
     def get_current_branch(self) -> str:
         """Get current branch name"""
-        return self._run_git(["rev-parse", "--abbrev-ref", "HEAD"])
+        return self.git_pool.current_branch()
 
     def has_changes(self) -> bool:
         """Check if there are uncommitted changes"""
         status = self._run_git(["status", "--porcelain"])
-        return bool(status.strip())
\ No newline at end of file
+        return bool(status.strip())
+
+    def apply_config(self, config):
+        """Pick up a reloaded configuration (fetch staleness window, update log size)"""
+        self.freshness_cache.max_age = config.settings.run_settings.fetch_staleness_seconds
+        self.content_updater.max_entries = config.settings.update_log_entries
+
+    def close(self):
+        """Stop persistent git worker processes"""
+        self.git_pool.close()
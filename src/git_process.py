@@ -0,0 +1,236 @@
+import subprocess
+import threading
+import logging
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Requests are written to a worker in chunks so its stdout pipe can never fill up
+# while we are still blocked writing to its stdin
+_BATCH_CHUNK = 256
+
+
+class _BatchWorker:
+    """A long-lived git process that answers exactly one line per request line"""
+
+    def __init__(self, repo_path: Path, args: List[str]):
+        self.repo_path = repo_path
+        self.args = args
+        self._process = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git"] + self.args,
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                bufsize=1
+            )
+            logger.debug(f"Started git worker: git {' '.join(self.args)}")
+
+    def request(self, lines: List[str]) -> List[str]:
+        """
+        Send request lines and collect one response line for each
+
+        Args:
+            lines: Request lines (without newlines)
+
+        Returns:
+            Response lines, in request order
+
+        Raises:
+            RuntimeError: If the worker dies mid-request
+        """
+        responses = []
+        with self._lock:
+            self._ensure_started()
+            try:
+                for start in range(0, len(lines), _BATCH_CHUNK):
+                    chunk = lines[start:start + _BATCH_CHUNK]
+                    self._process.stdin.write("".join(f"{line}\n" for line in chunk))
+                    self._process.stdin.flush()
+                    for _ in chunk:
+                        response = self._process.stdout.readline()
+                        if not response:
+                            raise RuntimeError(f"git {self.args[0]} worker exited unexpectedly")
+                        responses.append(response.rstrip("\n"))
+            except (BrokenPipeError, OSError) as e:
+                self._kill()
+                raise RuntimeError(f"git {self.args[0]} worker failed: {e}")
+            except RuntimeError:
+                self._kill()
+                raise
+        return responses
+
+    def _kill(self):
+        if self._process is not None:
+            try:
+                self._process.kill()
+                self._process.wait(timeout=5)
+            except Exception:
+                pass
+            self._process = None
+
+    def close(self):
+        """Close stdin and wait for the worker to exit"""
+        with self._lock:
+            if self._process is None:
+                return
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout=5)
+            except Exception:
+                self._kill()
+            self._process = None
+
+
+class GitProcessPool:
+    """
+    Long-lived git process layer for a single repository
+
+    Object and ref lookups go to a persistent `cat-file --batch-check` worker
+    that is started on first use and shared by all callers. Index updates are fed
+    through one `update-index --stdin` per batch, because update-index holds
+    the index lock for as long as it runs. Everything else is a single git
+    process without an intermediate shell.
+    """
+
+    def __init__(self, repo_path=".", timeout: int = 30):
+        """
+        Initialize process pool
+
+        Args:
+            repo_path: Path to git repository
+            timeout: Timeout in seconds for one-shot commands
+        """
+        self.repo_path = Path(repo_path).resolve()
+        self.timeout = timeout
+        self._git_dir = None
+        self._cat_file = _BatchWorker(self.repo_path, ["cat-file", "--batch-check"])
+
+    def run(self, args: List[str], check: bool = True, input: Optional[str] = None,
+            timeout: Optional[int] = None) -> str:
+        """
+        Run a one-shot git command
+
+        Args:
+            args: Git command arguments
+            check: Whether to check return code
+            input: Optional data for stdin
+            timeout: Override for the default timeout
+
+        Returns:
+            Command output
+
+        Raises:
+            RuntimeError: If git command fails
+        """
+        try:
+            result = subprocess.run(
+                ["git"] + args,
+                cwd=self.repo_path,
+                input=input,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                timeout=timeout or self.timeout
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"Git command timed out: {' '.join(args)}")
+        except OSError as e:
+            raise RuntimeError(f"Failed to run git command: {e}")
+
+        if check and result.returncode != 0:
+            error_msg = result.stderr.strip() or f"Git command failed: {' '.join(args)}"
+            raise RuntimeError(error_msg)
+
+        return result.stdout.strip()
+
+    def batch_check(self, objects: List[str]) -> List[Optional[Tuple[str, str, int]]]:
+        """
+        Look up objects through the persistent cat-file worker
+
+        Refs are re-read on every lookup, but the worker reads the index only
+        once, so index (``:path``) lookups must not be sent here.
+
+        Args:
+            objects: Object names (SHAs, refs, ``rev:path``)
+
+        Returns:
+            ``(sha, type, size)`` for each object, or None if it does not exist
+        """
+        results = []
+        for line in self._cat_file.request(objects):
+            parts = line.split()
+            if len(parts) == 3 and parts[1] != "missing":
+                results.append((parts[0], parts[1], int(parts[2])))
+            else:
+                results.append(None)
+        return results
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Resolve an object name to a SHA, or None if it does not exist"""
+        result = self.batch_check([name])[0]
+        return result[0] if result else None
+
+    def update_index(self, paths: List[str]) -> List[str]:
+        """
+        Stage paths with a single `update-index` process
+
+        Existing files are added, missing files are removed from the index.
+
+        Args:
+            paths: Repository-relative file paths
+
+        Returns:
+            update-index verbose output, one line per path
+
+        Raises:
+            RuntimeError: If update-index rejects the batch
+        """
+        if not paths:
+            return []
+        output = self.run(
+            ["update-index", "--add", "--remove", "--verbose", "-z", "--stdin"],
+            input="".join(f"{path}\0" for path in paths)
+        )
+        return output.splitlines()
+
+    def verify(self):
+        """
+        Check that the path is inside a git repository
+
+        Raises:
+            RuntimeError: If it is not
+        """
+        if not self.git_dir.is_dir():
+            raise RuntimeError(f"Not a git repository: {self.repo_path}")
+
+    @property
+    def git_dir(self) -> Path:
+        """Absolute path of the (per-worktree) git directory"""
+        if self._git_dir is None:
+            self._git_dir = Path(self.run(["rev-parse", "--absolute-git-dir"]))
+        return self._git_dir
+
+    def current_branch(self) -> str:
+        """
+        Read the checked out branch without spawning git
+
+        Returns:
+            Branch name, or "HEAD" when detached
+        """
+        head = (self.git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if head.startswith("ref: refs/heads/"):
+            return head[len("ref: refs/heads/"):]
+        return "HEAD"
+
+    def close(self):
+        """Stop all persistent workers"""
+        self._cat_file.close()
@@ -1,76 +1,82 @@
 import requests
 import time
 import logging
-from typing import Dict, List, Optional, Any
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from urllib.parse import urlencode, urlsplit
 import sys
 
+from src import tracing
+from src.http_transport import HttpTransport
+from src.rate_limiter import RateLimitScheduler
+from src.response_cache import ResponseCache
+from src.github_graphql import (
+    PULL_REQUEST_FIELDS, GraphQLBatch, GraphQLError, PullRequestInfo, RepositoryContext
+)
+
 logger = logging.getLogger(__name__)
 
 
 class GitHubClient:
     """Production-ready GitHub API client with retry logic"""
 
-    def __init__(self, config):
+    def __init__(self, config, transport: Optional[HttpTransport] = None):
         """
         Initialize GitHub client
         
         Args:
             config: ConfigManager instance
+            transport: Shared HTTP transport, created from config if omitted
         """
         self.config = config
         self.token = config.get_github_token()
 
-        repo = config.get_repo_config()
-        self.owner = repo.get("owner")
-        self.repo = repo.get("name")
-
-        if not self.owner or not self.repo:
-            raise ValueError("Repository owner and name must be configured")
-
-        self.base_url = "https://api.github.com"
-        self.api_url = f"{self.base_url}/repos/{self.owner}/{self.repo}"
-
-        # Setup session with retry strategy
-        self.session = requests.Session()
-        self._setup_session()
-
-        logger.info(f"GitHub client initialized for {self.owner}/{self.repo}")
+        repo = config.settings.repository
+        self.owner = repo.owner
+        self.repo = repo.name
+        self.default_branch = repo.default_branch
 
-    def _setup_session(self):
-        """Setup requests session with retry strategy"""
-        # Check urllib3 version for compatibility
-        retry_kwargs = {
-            "total": 3,
-            "status_forcelist": [429, 500, 502, 503, 504],
-            "backoff_factor": 1
-        }
-        
-        # Handle different versions of urllib3
-        import urllib3
-        urllib3_version = tuple(map(int, urllib3.__version__.split('.')[:2]))
-        
-        if urllib3_version >= (2, 0):
-            # Newer versions use allowed_methods
-            retry_kwargs["allowed_methods"] = ["HEAD", "GET", "POST", "PUT", "DELETE"]
+        self.base_url = config.get_github_api_url()
+        self.api_url = f"{self.base_url}/repos/{repo.slug}"
+        # GitHub Enterprise serves GraphQL at /api/graphql next to /api/v3
+        if self.base_url.endswith("/api/v3"):
+            self.graphql_url = f"{self.base_url[:-len('/v3')]}/graphql"
         else:
-            # Older versions use method_whitelist
-            retry_kwargs["method_whitelist"] = ["HEAD", "GET", "POST", "PUT", "DELETE"]
+            self.graphql_url = f"{self.base_url}/graphql"
+        self._repository_context: Optional[RepositoryContext] = None
 
-        retry_strategy = Retry(**retry_kwargs)
+        # Pooled keep-alive transport, shared with other clients when given
+        self.transport = transport or HttpTransport.from_config(config)
+        self._owns_transport = transport is None
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Paces calls from the rate-limit headers GitHub sends back
+        self.rate_limiter = RateLimitScheduler.from_config(config)
+        self.max_rate_limit_retries = config.settings.rate_limit.max_retries
 
-        # Headers
-        self.session.headers.update({
+        # ETag cache for GET endpoints; 304s are served locally and cost no rate limit
+        self.response_cache = ResponseCache.from_config(config)
+
+        # Sent per request so the shared session never carries the token
+        self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/vnd.github.v3+json",
             "Content-Type": "application/json",
             "User-Agent": "Auto-PR-Creator/1.0"
-        })
+        }
+
+        logger.info(f"GitHub client initialized for {self.owner}/{self.repo}")
+
+    def apply_config(self, config):
+        """Pick up a reloaded configuration (base branch, rate-limit retries)"""
+        self.default_branch = config.settings.repository.default_branch
+        self.max_rate_limit_retries = config.settings.rate_limit.max_retries
+
+    def close(self):
+        """Persist the response cache and close the transport if this client created it"""
+        if self.response_cache:
+            self.response_cache.save()
+            logger.debug(f"Response cache stats: {self.response_cache.stats()}")
+        if self._owns_transport:
+            self.transport.close()
 
     def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -85,13 +91,57 @@ class GitHubClient:
             API response as dictionary
         """
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
+        result, _ = self._send(method, url, data)
+        return result
+
+    def _send(self, method: str, url: str, data: Optional[Dict] = None, resource: str = "core",
+              pace_as: Optional[str] = None, cache: bool = True) -> Tuple[Any, Optional[str]]:
+        """
+        Send a request to an absolute API URL
+
+        Args:
+            method: HTTP method
+            url: Absolute URL, including any query string
+            data: Request body data
+            resource: Rate-limit resource the call is billed to
+            pace_as: Method the rate limiter should treat the call as (defaults to method)
+            cache: Whether a GET may use and fill the response cache
+
+        Returns:
+            Decoded response body and the raw Link header (None if absent)
+        """
+        headers = self.headers
+        cache_key = url if cache and method == "GET" and self.response_cache else None
+        cached = None
+        if cache_key:
+            cached = self.response_cache.lookup(cache_key)
+            headers = {**self.headers, **ResponseCache.conditional_headers(cached)}
 
         try:
-            response = self.session.request(method, url, json=data, timeout=30)
+            for attempt in range(self.max_rate_limit_retries + 1):
+                self.rate_limiter.acquire(pace_as or method, resource)
+                with tracing.span(tracing.endpoint_name(method, self._endpoint_path(url)), "github") as span:
+                    response = self.transport.request(method, url, headers=headers, json=data)
+                    span.set(status=response.status_code, attempt=attempt + 1)
+                resource = self.rate_limiter.update(response.headers, resource)
+
+                # Rate-limit rejections are retried after exactly the delay GitHub asked for
+                if attempt == self.max_rate_limit_retries:
+                    break
+                if self.rate_limiter.retry_after(response.status_code, response.headers, resource) is None:
+                    break
+
+            if cached is not None and response.status_code == 304:
+                return self.response_cache.hit(cache_key, cached)
+
             response.raise_for_status()
             
             # Return JSON if content exists, otherwise empty dict
-            return response.json() if response.content else {}
+            result = response.json() if response.content else {}
+            link = response.headers.get("Link")
+            if cache_key:
+                self.response_cache.store(cache_key, response.headers, result)
+            return result, link
 
         except requests.exceptions.RequestException as e:
             error_msg = f"GitHub API request failed: {e}"
@@ -104,6 +154,24 @@ class GitHubClient:
             logger.error(error_msg)
             raise
 
+    def _endpoint_path(self, url: str) -> str:
+        """Path of an API URL below the API root (e.g. /repos/o/r/pulls, /graphql), for tracing"""
+        if url == self.graphql_url:
+            return "/graphql"
+        path = urlsplit(url).path
+        base_path = urlsplit(self.base_url).path.rstrip("/")
+        if base_path and path.startswith(f"{base_path}/"):
+            return path[len(base_path):]
+        return path
+
+    def get_rate_limit_budget(self) -> Dict[str, Dict]:
+        """Get the scheduler's current rate-limit budget per resource"""
+        return self.rate_limiter.get_budget()
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get response cache hit/miss counters"""
+        return self.response_cache.stats() if self.response_cache else {}
+
     def create_pr(self, branch: str, title: str, body: str, draft: bool = False) -> Dict[str, Any]:
         """
         Create a pull request
@@ -120,7 +188,7 @@ class GitHubClient:
         data = {
             "title": title,
             "head": branch,
-            "base": self.config.get_repo_config().get("default_branch", "main"),
+            "base": self.default_branch,
             "body": body,
             "draft": draft
         }
@@ -164,6 +232,232 @@ class GitHubClient:
         """Get PR details"""
         return self._request("GET", f"pulls/{pr_number}")
 
-    def list_prs(self, state: str = "open") -> List[Dict[str, Any]]:
-        """List pull requests"""
-        return self._request("GET", f"pulls?state={state}")
\ No newline at end of file
+    def iter_prs(self, state: str = "open", head: Optional[str] = None, base: Optional[str] = None,
+                 sort: Optional[str] = None, direction: Optional[str] = None,
+                 per_page: int = 100, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream pull requests page by page
+
+        Pages are fetched lazily by following the Link header, so only one
+        page is held in memory and breaking out of the loop stops fetching.
+        Pages bypass the response cache, which would otherwise keep every
+        page body and push out the entries that polling relies on.
+
+        Args:
+            state: open, closed or all
+            head: Filter by head as "user:ref-name"
+            base: Filter by base branch name
+            sort: created, updated, popularity or long-running
+            direction: asc or desc
+            per_page: Page size (GitHub allows up to 100)
+            limit: Stop after this many pull requests
+
+        Yields:
+            Pull request data
+        """
+        params = {"state": state, "per_page": per_page}
+        for key, value in (("head", head), ("base", base), ("sort", sort), ("direction", direction)):
+            if value:
+                params[key] = value
+
+        url = f"{self.api_url}/pulls?{urlencode(params)}"
+        count = 0
+        while url:
+            page, link = self._send("GET", url, cache=False)
+            for pr in page:
+                yield pr
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+            url = _next_page_url(link)
+
+    def list_prs(self, state: str = "open", **filters: Any) -> List[Dict[str, Any]]:
+        """List pull requests (all pages; see iter_prs for filters)"""
+        return list(self.iter_prs(state=state, **filters))
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run a GraphQL query or mutation
+
+        Args:
+            query: GraphQL document
+            variables: Document variables
+
+        Returns:
+            The response's data object
+
+        Raises:
+            GraphQLError: If the response carries errors
+        """
+        is_mutation = query.lstrip().startswith("mutation")
+        result, _ = self._send(
+            "POST",
+            self.graphql_url,
+            {"query": query, "variables": variables or {}},
+            resource="graphql",
+            pace_as="POST" if is_mutation else "GET"
+        )
+        if result.get("errors"):
+            raise GraphQLError(result["errors"], result.get("data"))
+        return result.get("data") or {}
+
+    def execute_batch(self, batch: GraphQLBatch) -> Dict[str, Any]:
+        """Send a GraphQLBatch as one request and return results keyed by alias"""
+        query, variables = batch.build()
+        return self.graphql(query, variables)
+
+    def get_repository_context(self, labels: List[str], refresh: bool = False) -> RepositoryContext:
+        """
+        Look up the repository ID and label IDs in one query (cached per client)
+
+        Args:
+            labels: Label names the caller is going to apply
+            refresh: Ignore the cached context
+
+        Returns:
+            RepositoryContext; labels that do not exist yet are listed in missing_labels
+        """
+        context = self._repository_context
+        if context and not refresh and all(
+            label in context.label_ids or label in context.missing_labels for label in labels
+        ):
+            return context
+
+        selections = ["id"]
+        for i, _ in enumerate(labels):
+            selections.append(f"l{i}: label(name: $label{i}) {{ id name }}")
+        batch = GraphQLBatch("query")
+        variables = {"owner": ("String!", self.owner), "name": ("String!", self.repo)}
+        variables.update({f"label{i}": ("String!", label) for i, label in enumerate(labels)})
+        batch.add("repository", f"repository(owner: $owner, name: $name) {{ {' '.join(selections)} }}", variables)
+
+        repository = self.execute_batch(batch)["repository"]
+        context = RepositoryContext(id=repository["id"])
+        for i, label in enumerate(labels):
+            node = repository.get(f"l{i}")
+            if node:
+                context.label_ids[label] = node["id"]
+            else:
+                context.missing_labels.append(label)
+
+        self._repository_context = context
+        return context
+
+    def create_pr_graphql(self, branch: str, title: str, body: str, draft: bool = False,
+                          labels: Optional[List[str]] = None) -> PullRequestInfo:
+        """
+        Create a pull request through GraphQL
+
+        Args:
+            branch: Head branch name
+            title: PR title
+            body: PR body/description
+            draft: Whether to create as draft PR
+            labels: Labels that will be applied later; their IDs are fetched
+                with the repository ID so labelling needs no extra lookup
+
+        Returns:
+            Created pull request
+        """
+        context = self.get_repository_context(labels or [])
+        batch = GraphQLBatch("mutation")
+        batch.add("create", f"createPullRequest(input: $input) {{ pullRequest {{ {PULL_REQUEST_FIELDS} }} }}", {
+            "input": ("CreatePullRequestInput!", {
+                "repositoryId": context.id,
+                "baseRefName": self.default_branch,
+                "headRefName": branch,
+                "title": title,
+                "body": body,
+                "draft": draft
+            })
+        })
+        pr = PullRequestInfo.from_node(self.execute_batch(batch)["create"]["pullRequest"])
+        logger.info(f"Created PR #{pr.number}: {pr.url}")
+        return pr
+
+    def label_and_merge_graphql(self, pr: PullRequestInfo, labels: List[str],
+                                method: str = "merge") -> PullRequestInfo:
+        """
+        Add labels and merge a pull request in a single GraphQL request
+
+        Labels that do not exist in the repository yet are added through the
+        REST endpoint, which creates them.
+
+        Args:
+            pr: Pull request to update
+            labels: Label names
+            method: Merge method (merge, squash, rebase)
+
+        Returns:
+            Merged pull request
+        """
+        context = self.get_repository_context(labels)
+        batch = GraphQLBatch("mutation")
+
+        label_ids = [context.label_ids[label] for label in labels if label in context.label_ids]
+        if label_ids:
+            batch.add("labels", "addLabelsToLabelable(input: $input) { clientMutationId }", {
+                "input": ("AddLabelsToLabelableInput!", {"labelableId": pr.id, "labelIds": label_ids})
+            })
+        missing = [label for label in labels if label in context.missing_labels]
+        if missing:
+            self.add_labels(pr.number, missing)
+            # They exist now; look them up again next time
+            self._repository_context = None
+
+        batch.add("merge", f"mergePullRequest(input: $input) {{ pullRequest {{ {PULL_REQUEST_FIELDS} }} }}", {
+            "input": ("MergePullRequestInput!", {
+                "pullRequestId": pr.id,
+                "mergeMethod": method.upper(),
+                "commitHeadline": f"Merge PR #{pr.number} (automated)"
+            })
+        })
+
+        merged = PullRequestInfo.from_node(self.execute_batch(batch)["merge"]["pullRequest"])
+        logger.info(f"Labelled and merged PR #{merged.number}")
+        return merged
+
+    def get_prs_status(self, pr_numbers: List[int], batch_size: int = 50) -> Dict[int, PullRequestInfo]:
+        """
+        Fetch state and mergeability of several pull requests in one query
+
+        Long lists are split into queries of at most ``batch_size`` pull
+        requests, which keeps each one well below GitHub's node and timeout
+        limits.
+
+        Args:
+            pr_numbers: PR numbers
+            batch_size: Pull requests per query
+
+        Returns:
+            Mapping of PR number to PullRequestInfo (missing PRs are omitted)
+        """
+        statuses = {}
+        size = max(1, batch_size)
+        for start in range(0, len(pr_numbers), size):
+            chunk = pr_numbers[start:start + size]
+            selections = " ".join(
+                f"p{i}: pullRequest(number: {int(number)}) {{ {PULL_REQUEST_FIELDS} }}"
+                for i, number in enumerate(chunk)
+            )
+            batch = GraphQLBatch("query")
+            batch.add("repository", f"repository(owner: $owner, name: $name) {{ {selections} }}", {
+                "owner": ("String!", self.owner),
+                "name": ("String!", self.repo)
+            })
+            repository = self.execute_batch(batch)["repository"]
+            for i in range(len(chunk)):
+                node = repository.get(f"p{i}")
+                if node:
+                    statuses[node["number"]] = PullRequestInfo.from_node(node)
+        return statuses
+
+
+def _next_page_url(link: Optional[str]) -> Optional[str]:
+    """Extract the rel="next" URL from a Link header"""
+    if not link:
+        return None
+    for entry in requests.utils.parse_header_links(link):
+        if entry.get("rel") == "next":
+            return entry.get("url")
+    return None
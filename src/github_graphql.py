@@ -0,0 +1,129 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+PULL_REQUEST_FIELDS = "id number url title state merged mergeable headRefName baseRefName"
+
+_VARIABLE = re.compile(r"\$(\w+)")
+
+
+class GraphQLError(RuntimeError):
+    """GraphQL response that carried errors"""
+
+    def __init__(self, errors: List[Dict], data: Optional[Dict] = None):
+        messages = "; ".join(error.get("message", "unknown error") for error in errors)
+        super().__init__(f"GitHub GraphQL request failed: {messages}")
+        self.errors = errors
+        self.data = data or {}
+
+
+@dataclass
+class PullRequestInfo:
+    """Pull request fields returned by the GraphQL API"""
+
+    id: str
+    number: int
+    url: str
+    title: str = ""
+    state: str = "OPEN"
+    merged: bool = False
+    mergeable: str = "UNKNOWN"
+    head_ref: str = ""
+    base_ref: str = ""
+
+    @classmethod
+    def from_node(cls, node: Dict[str, Any]) -> "PullRequestInfo":
+        return cls(
+            id=node["id"],
+            number=node["number"],
+            url=node.get("url", ""),
+            title=node.get("title", ""),
+            state=node.get("state", "OPEN"),
+            merged=node.get("merged", False),
+            mergeable=node.get("mergeable") or "UNKNOWN",
+            head_ref=node.get("headRefName", ""),
+            base_ref=node.get("baseRefName", "")
+        )
+
+    def to_rest(self) -> Dict[str, Any]:
+        """Shape the PR like a REST response for code that expects one (e.g. notifications)"""
+        return {
+            "node_id": self.id,
+            "number": self.number,
+            "html_url": self.url,
+            "title": self.title,
+            "state": self.state.lower(),
+            "merged": self.merged,
+            "head": {"ref": self.head_ref},
+            "base": {"ref": self.base_ref}
+        }
+
+
+@dataclass
+class RepositoryContext:
+    """Node IDs needed by pull request mutations"""
+
+    id: str
+    label_ids: Dict[str, str] = field(default_factory=dict)
+    missing_labels: List[str] = field(default_factory=list)
+
+
+class GraphQLBatch:
+    """
+    Collects several aliased fields into one GraphQL document
+
+    Each field's ``$variables`` are renamed to ``$<alias>_<name>`` so fields
+    added independently never clash, and the whole batch is sent as a
+    single request. Mutations in one document run in the order they were
+    added.
+    """
+
+    def __init__(self, operation: str = "query"):
+        if operation not in ("query", "mutation"):
+            raise ValueError("operation must be 'query' or 'mutation'")
+        self.operation = operation
+        self._fields: List[str] = []
+        self._definitions: List[str] = []
+        self._variables: Dict[str, Any] = {}
+        self.aliases: List[str] = []
+
+    def add(self, alias: str, selection: str, variables: Optional[Dict[str, Tuple[str, Any]]] = None) -> str:
+        """
+        Add an aliased field
+
+        Args:
+            alias: Alias the result is returned under
+            selection: Field with arguments and sub-selection, using ``$name`` variables
+            variables: Mapping of variable name to (GraphQL type, value)
+
+        Returns:
+            The alias
+        """
+        if not re.fullmatch(r"[A-Za-z_]\w*", alias) or alias in self.aliases:
+            raise ValueError(f"Invalid or duplicate alias: {alias}")
+
+        variables = variables or {}
+        for name, (graphql_type, value) in variables.items():
+            self._definitions.append(f"${alias}_{name}: {graphql_type}")
+            self._variables[f"{alias}_{name}"] = value
+        selection = _VARIABLE.sub(lambda m: f"${alias}_{m.group(1)}", selection)
+
+        self._fields.append(f"{alias}: {selection}")
+        self.aliases.append(alias)
+        return alias
+
+    def build(self) -> Tuple[str, Dict[str, Any]]:
+        """
+        Render the document
+
+        Returns:
+            GraphQL document and its variables
+        """
+        if not self._fields:
+            raise ValueError("GraphQL batch is empty")
+        definitions = f"({', '.join(self._definitions)})" if self._definitions else ""
+        body = "\n  ".join(self._fields)
+        return f"{self.operation}{definitions} {{\n  {body}\n}}", self._variables
+
+    def __len__(self):
+        return len(self._fields)
@@ -0,0 +1,219 @@
+import logging
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+def build_retry(total: int = 3) -> Retry:
+    """
+    Build the urllib3 retry strategy shared by all HTTP clients
+
+    Args:
+        total: Maximum number of retries
+
+    Returns:
+        Retry instance
+    """
+    # 429 is left to callers so they can wait exactly as long as Retry-After asks.
+    # Only idempotent methods are retried: a repeated POST opens a second PR and a
+    # repeated merge PUT fails with 405 once the first one went through.
+    retry_kwargs = {
+        "total": total,
+        "status_forcelist": [500, 502, 503, 504],
+        "backoff_factor": 1,
+        "respect_retry_after_header": False
+    }
+
+    # Handle different versions of urllib3
+    import urllib3
+    urllib3_version = tuple(map(int, urllib3.__version__.split('.')[:2]))
+
+    if urllib3_version >= (2, 0):
+        # Newer versions use allowed_methods
+        retry_kwargs["allowed_methods"] = ["HEAD", "GET", "DELETE"]
+    else:
+        # Older versions use method_whitelist
+        retry_kwargs["method_whitelist"] = ["HEAD", "GET", "DELETE"]
+
+    return Retry(**retry_kwargs)
+
+
+class _StatusResponse:
+    """The part of a urllib3 response Retry.increment looks at"""
+
+    def __init__(self, status: int):
+        self.status = status
+
+    def get_redirect_location(self):
+        return False
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    requests transport adapter that sends requests over a multiplexed httpx HTTP/2 client
+
+    Failed attempts are retried with the same urllib3 Retry policy as the
+    HTTP/1.1 adapter (see build_retry): connection errors for every method,
+    read errors and retryable statuses for idempotent methods only, with
+    the same backoff. Exhausted status retries raise RetryError, as
+    HTTPAdapter does.
+    """
+
+    def __init__(self, max_connections: int = 16, max_keepalive: int = 16, max_retries: Optional[Retry] = None):
+        super().__init__()
+        import httpx
+        self._httpx = httpx
+        self.max_retries = max_retries or Retry(0, read=False)
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive)
+        )
+
+    def _as_urllib3_error(self, error: Exception) -> Exception:
+        """Classify an httpx error the way Retry counts urllib3 errors"""
+        httpx = self._httpx
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            return ConnectTimeoutError(str(error))
+        if isinstance(error, httpx.TimeoutException):
+            return ReadTimeoutError(None, None, str(error))
+        return ProtocolError(str(error))
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        httpx = self._httpx
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+
+        retry = self.max_retries
+        while True:
+            try:
+                result = self._client.request(
+                    request.method,
+                    request.url,
+                    headers=dict(request.headers),
+                    content=request.body,
+                    timeout=timeout
+                )
+            except httpx.HTTPError as e:
+                try:
+                    retry = retry.increment(request.method, request.url, error=self._as_urllib3_error(e))
+                except (MaxRetryError, ConnectTimeoutError, ReadTimeoutError, ProtocolError):
+                    if isinstance(e, httpx.TimeoutException):
+                        raise requests.exceptions.Timeout(e, request=request)
+                    raise requests.exceptions.ConnectionError(e, request=request)
+                logger.debug(f"Retrying {request.method} {request.url} after {type(e).__name__}: {e}")
+                retry.sleep()
+                continue
+
+            if retry.is_retry(request.method, result.status_code):
+                try:
+                    retry = retry.increment(request.method, request.url,
+                                            response=_StatusResponse(result.status_code))
+                except MaxRetryError as e:
+                    raise requests.exceptions.RetryError(e, request=request)
+                logger.debug(f"Retrying {request.method} {request.url} after HTTP {result.status_code}")
+                retry.sleep()
+                continue
+            break
+
+        response = requests.Response()
+        response.status_code = result.status_code
+        response.headers = CaseInsensitiveDict(result.headers.items())
+        response.reason = result.reason_phrase
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.encoding = result.encoding
+        response._content = result.content
+        return response
+
+    def close(self):
+        self._client.close()
+
+
+class HttpTransport:
+    """
+    Shared HTTP transport for GitHub API calls and webhooks
+
+    One requests session with tuned connection pools and keep-alive, so
+    every client reuses warm TLS connections instead of opening a new one per
+    call. HTTP/2 multiplexing is used when enabled and httpx[http2] is
+    installed. Callers pass their own headers per request; the session
+    carries no credentials.
+    """
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 16, http2: bool = False,
+                 timeout: float = 30, max_retries: int = 3):
+        """
+        Initialize transport
+
+        Args:
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum kept-alive connections per host
+            http2: Use HTTP/2 when httpx[http2] is available
+            timeout: Default request timeout in seconds
+            max_retries: Retries for connection errors and retryable statuses
+        """
+        self.timeout = timeout
+        self.http2 = False
+        self.session = requests.Session()
+
+        adapter = None
+        if http2:
+            try:
+                adapter = Http2Adapter(max_connections=pool_maxsize, max_keepalive=pool_maxsize,
+                                       max_retries=build_retry(max_retries))
+                self.http2 = True
+            except ImportError:
+                logger.warning("HTTP/2 requested but httpx[http2] is not installed, using HTTP/1.1")
+
+        if adapter is None:
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=build_retry(max_retries)
+            )
+
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        logger.debug(f"HTTP transport ready (pool_maxsize={pool_maxsize}, http2={self.http2})")
+
+    @classmethod
+    def from_config(cls, config) -> "HttpTransport":
+        """Create a transport from the 'http' section of a ConfigManager"""
+        http = config.settings.http
+        return cls(
+            pool_connections=http.pool_connections,
+            pool_maxsize=http.pool_maxsize,
+            http2=http.http2,
+            timeout=http.timeout_seconds,
+            max_retries=http.max_retries
+        )
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                **kwargs: Any) -> requests.Response:
+        """
+        Send a request over the shared session
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            headers: Per-request headers
+            **kwargs: Passed through to requests (json, params, timeout, ...)
+
+        Returns:
+            Response object
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, headers=headers, **kwargs)
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
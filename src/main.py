@@ -6,37 +6,69 @@ Auto PR Creator - Enhanced version with multi-collaborator support
 import sys
 import logging
 import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Only modules without third-party imports are loaded up front. The HTTP
+# stack (requests, urllib3) and the subsystems built on it are imported
+# when first used, so --help and --dry-run start fast.
 from src.config_manager import ConfigManager
-from src.git_operations import GitOperations
-from src.github_client import GitHubClient
-from src.notification_manager import NotificationManager
-from src.collaborator_manager import CollaboratorManager
-from src import utils
+from src.github_graphql import GraphQLError, PullRequestInfo
+from src.state_journal import JournalMismatchError, StateJournal
+from src import tracing, utils
 
 logger = logging.getLogger(__name__)
 
+# How GitHub's merge button names each merge.method
+MERGE_METHOD_LABELS = {
+    "merge": "Create a merge commit",
+    "squash": "Squash and merge",
+    "rebase": "Rebase and merge"
+}
+
+
+def _ignore_stage(stage: str, **data):
+    """Default stage callback"""
+
+
+def _raise_first(results: List[Any]):
+    """Raise the first exception in asyncio.gather(..., return_exceptions=True) results"""
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+def _pr_summary(pr: Dict) -> Dict:
+    """Fields of a PR worth journaling (enough to label, merge and notify later)"""
+    return {key: pr.get(key) for key in ("number", "title", "html_url", "node_id")}
+
 
 class AutoPRCreator:
     """Main application class with multi-collaborator support"""
 
-    def __init__(self, config_path="config/config.json", dry_run=False):
-        utils.setup_logging()
+    def __init__(self, config_path="config/config.json", dry_run=False, log_json: Optional[str] = None):
+        utils.setup_logging(json_path=log_json)
         self.dry_run = dry_run
         self.mode = None
 
         if dry_run:
             logger.info("🔧 DRY RUN MODE - No changes will be made")
 
+        # Subsystems are built on first use, see _component()
+        self._components: Dict[str, Any] = {}
+        self._components_lock = threading.RLock()
+
         try:
             self.config = ConfigManager(config_path)
-            self.git = GitOperations(self.config)
-            self.github = GitHubClient(self.config)
-            self.notifier = NotificationManager(self.config)
-            self.collaborator_manager = CollaboratorManager(self.config)
+            if not dry_run:
+                # Fail fast on a missing token without importing the HTTP stack
+                self.config.get_github_token()
+            self.config.subscribe(self._apply_config)
 
             logger.info("✅ Auto PR Creator initialized successfully")
 
@@ -44,8 +76,59 @@ class AutoPRCreator:
             logger.error(f"❌ Failed to initialize: {e}")
             raise
 
-    def run_single_user_mode(self):
-        """Original single-user mode"""
+    def _component(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Get a subsystem, building it on first use (thread-safe)"""
+        component = self._components.get(name)
+        if component is None:
+            with self._components_lock:
+                component = self._components.get(name)
+                if component is None:
+                    component = factory()
+                    self._components[name] = component
+        return component
+
+    @property
+    def git(self) -> "GitOperations":
+        from src.git_operations import GitOperations
+        return self._component("git", lambda: GitOperations(self.config))
+
+    @property
+    def transport(self) -> "HttpTransport":
+        """Pooled transport shared by the API client and webhooks"""
+        from src.http_transport import HttpTransport
+        return self._component("transport", lambda: HttpTransport.from_config(self.config))
+
+    @property
+    def github(self) -> "GitHubClient":
+        from src.github_client import GitHubClient
+        return self._component("github", lambda: GitHubClient(self.config, transport=self.transport))
+
+    @property
+    def merge_waiter(self) -> "MergeabilityWaiter":
+        from src.merge_waiter import MergeabilityWaiter
+        return self._component("merge_waiter", lambda: MergeabilityWaiter.from_config(self.github, self.config))
+
+    @property
+    def notifier(self) -> "NotificationManager":
+        from src.notification_manager import NotificationManager
+        return self._component("notifier", lambda: NotificationManager(self.config, transport=self.transport))
+
+    @property
+    def collaborator_manager(self) -> "CollaboratorManager":
+        from src.collaborator_manager import CollaboratorManager
+        return self._component("collaborator_manager", lambda: CollaboratorManager(self.config))
+
+    @tracing.traced("prepare_single")
+    def run_single_user_mode(self, on_stage: Optional[Callable[..., None]] = None,
+                             files: Optional[List[str]] = None):
+        """
+        Original single-user mode
+
+        Args:
+            on_stage: Called as on_stage(stage, **data) after each completed stage
+            files: Files to modify instead of files.to_modify
+        """
+        on_stage = on_stage or _ignore_stage
         branch = utils.generate_branch_name()
         logger.info(f"📦 Generated branch name: {branch}")
 
@@ -54,16 +137,17 @@ class AutoPRCreator:
             logger.info("[DRY RUN] Would modify files")
             logger.info("[DRY RUN] Would commit and push changes")
             logger.info("[DRY RUN] Would create and merge PR")
-            return True
-
-        # Create branch
-        self.git.create_branch(branch)
+            return branch, None
 
         # Modify files
-        files_to_modify = self.config.get_files_to_modify()
+        files_to_modify = files if files is not None else self.config.get_files_to_modify()
         if not files_to_modify:
             logger.warning("No files configured to modify")
-            return False
+            return None, None
+
+        # Create branch
+        self.git.create_branch(branch)
+        on_stage("branch_created", branch=branch)
 
         modified_files = self.git.modify_files(files_to_modify)
         logger.info(f"📝 Modified {len(modified_files)} files")
@@ -71,43 +155,85 @@ class AutoPRCreator:
         # Commit changes
         coauthor = self.config.get_coauthor_config()
         self.git.commit(modified_files, coauthor)
+        on_stage("committed")
 
         # Push to remote
         self.git.push(branch)
+        on_stage("pushed")
         logger.info("🚀 Pushed changes to remote")
 
         return branch, None
 
-    def run_collaborator_mode(self):
-        """Multi-collaborator mode"""
+    def run_parallel_single_user_mode(self, count: int):
+        """
+        Prepare several single-user branches at once, one per worktree
+
+        Args:
+            count: Number of branches to prepare
+
+        Returns:
+            Names of the branches that were prepared and pushed
+        """
+        branches = [utils.generate_branch_name() for _ in range(count)]
+        logger.info(f"📦 Preparing {count} branches in parallel")
+
+        if self.dry_run:
+            for branch in branches:
+                logger.info(f"[DRY RUN] Would prepare branch in worktree: {branch}")
+            return branches
+
+        files_to_modify = self.config.get_files_to_modify()
+        if not files_to_modify:
+            logger.warning("No files configured to modify")
+            return []
+
+        from src.worktree_pool import WorktreePool
+
+        coauthor = self.config.get_coauthor_config()
+        with WorktreePool(self.config, self.git.repo_path, freshness_cache=self.git.freshness_cache) as pool:
+            results = pool.prepare_branches(branches, files_to_modify, coauthor)
+
+        return [result["branch"] for result in results if result["error"] is None]
+
+    @tracing.traced("prepare_collaborator")
+    def run_collaborator_mode(self, on_stage: Optional[Callable[..., None]] = None):
+        """
+        Multi-collaborator mode
+
+        Args:
+            on_stage: Called as on_stage(stage, **data) after each completed stage
+        """
+        on_stage = on_stage or _ignore_stage
         branch = utils.generate_branch_name(prefix="collab-pr")
         logger.info(f"🤝 Creating collaborative branch: {branch}")
 
         if self.dry_run:
             logger.info(f"[DRY RUN] Would create branch: {branch}")
-            logger.info(f"[DRY RUN] Would create commits from {len(self.collaborator_manager.collaborators)} collaborators")
+            logger.info(f"[DRY RUN] Would create commits from {len(self.config.settings.collaborators)} collaborators")
             return branch, None
 
         # Create branch
         self.git.create_branch(branch)
+        on_stage("branch_created", branch=branch)
 
         # Create commits from multiple collaborators
         commits = self.collaborator_manager.create_multi_collaborator_commits(
             branch, 
             num_commits_per_collaborator=2
         )
+        on_stage("committed", commits=commits)
 
         # Push all commits
         self.git.push(branch)
+        on_stage("pushed")
         logger.info(f"🚀 Pushed {len(commits)} collaborator commits to remote")
 
         return branch, commits
 
-    def create_and_merge_pr(self, branch: str, commits=None):
-        """Create PR and merge using squash and merge"""
-        
+    def _build_pr_content(self, branch: str, commits=None, labels: Optional[List[str]] = None):
+        """Build PR title, body and labels (pull_request.labels unless given) for a branch"""
         # Get PR configuration
-        pr_config = self.config.get_pr_config()
+        pr_config = self.config.settings.pull_request
         
         if commits:
             # Build PR body with collaborator info
@@ -126,7 +252,7 @@ This PR includes contributions from {len(collaborators)} team members:
 ### 📊 Summary
 - **Total commits:** {len(commits)}
 - **Branch:** {branch}
-- **Merge method:** Squash and merge
+- **Merge method:** {MERGE_METHOD_LABELS.get(self._merge_method(), self._merge_method())}
 
 ### ✅ Changes
 Each contributor added their own files and made independent commits on the same branch.
@@ -135,44 +261,226 @@ Each contributor added their own files and made independent commits on the same
 *This PR demonstrates collaborative development workflow*
 """
         else:
-            pr_title = pr_config.get("title", "🚀 Auto PR Update")
+            pr_title = pr_config.title
             pr_body = utils.load_pr_template()
 
-        # Create PR
-        pr = self.github.create_pr(branch, pr_title, pr_body)
-
-        # Add labels
-        labels = pr_config.get("labels", ["automated"])
+        labels = list(labels if labels is not None else pr_config.labels)
         if commits:
             labels.append("collaborative")
-        self.github.add_labels(pr["number"], labels)
 
-        # Merge using squash and merge
-        self.github.merge_pr(pr["number"], method="squash")
-        logger.info(f"✅ Successfully created and squash-merged PR #{pr['number']}")
+        return pr_title, pr_body, labels
+
+    @tracing.traced("create_and_merge_pr")
+    def create_and_merge_pr(self, branch: str, commits=None, on_stage: Optional[Callable[..., None]] = None,
+                            resume: Optional[Dict] = None, labels: Optional[List[str]] = None):
+        """
+        Create PR and merge it once GitHub reports it mergeable
+
+        With run_settings.auto_merge disabled the PR is only created and labelled.
+
+        Args:
+            branch: Pushed branch to open the PR from
+            commits: Collaborator commits, if any
+            on_stage: Called as on_stage(stage, **data) after each completed stage
+            resume: Journal state of an interrupted attempt; its completed stages are skipped
+            labels: Labels instead of pull_request.labels
+        """
+        on_stage = on_stage or _ignore_stage
+        done = set(resume.get("stages", ())) if resume else set()
+        pr = resume.get("pr") if resume else None
+        pr_title, pr_body, labels = self._build_pr_content(branch, commits, labels)
+
+        if self.config.settings.use_graphql:
+            return self._create_and_merge_pr_graphql(branch, pr_title, pr_body, labels, on_stage, done, pr)
+
+        # Create PR
+        if "pr_opened" not in done:
+            pr = self.github.create_pr(branch, pr_title, pr_body)
+            on_stage("pr_opened", pr=_pr_summary(pr))
+
+        # Add labels
+        if "labelled" not in done:
+            self.github.add_labels(pr["number"], labels)
+            on_stage("labelled")
+
+        if not self._auto_merge():
+            logger.info(f"✅ Created PR #{pr['number']} (auto-merge disabled)")
+            self._notify(pr, "success", on_stage, done)
+            return pr
+
+        # Merge as soon as mergeability has been computed
+        if "merged" not in done:
+            self.merge_waiter.merge_when_ready(pr["number"], method=self._merge_method())
+            # The default branch just moved, the next branch must see it
+            self.git.freshness_cache.invalidate()
+            on_stage("merged")
+        logger.info(f"✅ Successfully created and merged PR #{pr['number']}")
 
         # Send notification
-        self.notifier.send_notification(pr, "merged")
+        self._notify(pr, "merged", on_stage, done)
 
         return pr
 
-    def run(self, mode="single"):
+    def _apply_config(self, config: ConfigManager):
+        """Publish a reloaded configuration to every long-lived component"""
+        for name in ("git", "github", "merge_waiter", "notifier", "collaborator_manager"):
+            component = self._components.get(name)
+            if component is not None:
+                component.apply_config(config)
+
+    def _auto_merge(self) -> bool:
+        return self.config.settings.run_settings.auto_merge
+
+    def _merge_method(self) -> str:
+        return self.config.settings.merge.method
+
+    def _notify(self, pr: Dict, status: str, on_stage: Callable[..., None], done=()):
+        if "notified" not in done:
+            self.notifier.send_notification(pr, status)
+            on_stage("notified")
+
+    def _create_and_merge_pr_graphql(self, branch: str, pr_title: str, pr_body: str, labels,
+                                     on_stage: Callable[..., None], done=(), pr: Optional[Dict] = None):
+        """
+        GraphQL variant of create_and_merge_pr
+
+        Two requests per PR instead of three: createPullRequest, then one
+        document that adds the labels and merges. Repository and label IDs
+        are looked up once per client and cached. If GitHub has not computed
+        mergeability yet the merge falls back to the mergeability waiter.
+        """
+        if "pr_opened" in done:
+            info = PullRequestInfo(id=pr["node_id"], number=pr["number"], url=pr["html_url"],
+                                   title=pr.get("title", ""))
+        else:
+            info = self.github.create_pr_graphql(branch, pr_title, pr_body, labels=labels)
+            on_stage("pr_opened", pr=_pr_summary(info.to_rest()))
+
+        if not self._auto_merge():
+            if "labelled" not in done:
+                self.github.add_labels(info.number, labels)
+                on_stage("labelled")
+            logger.info(f"✅ Created PR #{info.number} (auto-merge disabled)")
+            pr = info.to_rest()
+            self._notify(pr, "success", on_stage, done)
+            return pr
+
+        if "merged" not in done:
+            labelled = "labelled" in done
+            try:
+                info = self.github.label_and_merge_graphql(info, [] if labelled else labels,
+                                                           method=self._merge_method())
+            except GraphQLError as e:
+                logger.info(f"PR #{info.number} not merged immediately ({e}), waiting for mergeability")
+                # Mutations run in order, so the labels are in place unless that step failed too
+                if labels and not labelled and not e.data.get("labels"):
+                    self.github.add_labels(info.number, labels)
+                self.merge_waiter.merge_when_ready(info.number, method=self._merge_method())
+            info.state, info.merged = "MERGED", True
+            self.git.freshness_cache.invalidate()
+            if not labelled:
+                on_stage("labelled")
+            on_stage("merged")
+        else:
+            info.state, info.merged = "MERGED", True
+        logger.info(f"✅ Successfully created and merged PR #{info.number}")
+
+        pr = info.to_rest()
+        self._notify(pr, "merged", on_stage, done)
+
+        return pr
+
+    async def create_and_merge_pr_async(self, branch: str, commits=None,
+                                        on_stage: Optional[Callable[..., None]] = None,
+                                        resume: Optional[Dict] = None, labels: Optional[List[str]] = None):
+        """
+        Variant of create_and_merge_pr that overlaps independent calls
+
+        Takes the same arguments and records the same stages. Once the PR is
+        open, labelling runs alongside the mergeability wait inside
+        merge_when_ready; the merge itself is only sent after the labels
+        are in place, as in the sync path. Without auto-merge, labelling and
+        the notification run side by side. A "merged" notification still
+        follows the merge. With github.use_graphql the GraphQL flow is used
+        as is: labels and merge are already a single request there. At most
+        run_settings.max_concurrency calls are in flight.
+        """
+        on_stage = on_stage or _ignore_stage
+        done = set(resume.get("stages", ())) if resume else set()
+        pr = resume.get("pr") if resume else None
+        pr_title, pr_body, labels = self._build_pr_content(branch, commits, labels)
+        max_concurrency = self.config.settings.run_settings.max_concurrency
+
+        import asyncio
+        from src.async_github_client import AsyncGitHubClient
+
+        async with AsyncGitHubClient(self.github, max_concurrency=max_concurrency) as api:
+            if self.config.settings.use_graphql:
+                return await api.run_in_pool(self._create_and_merge_pr_graphql, branch, pr_title, pr_body, labels,
+                                             on_stage, done, pr)
+
+            if "pr_opened" not in done:
+                pr = await api.create_pr(branch, pr_title, pr_body)
+                on_stage("pr_opened", pr=_pr_summary(pr))
+
+            labelling = None if "labelled" in done else api.submit(self.github.add_labels, pr["number"], labels)
+
+            async def label():
+                if labelling is not None:
+                    await asyncio.wrap_future(labelling)
+                    on_stage("labelled")
+
+            if not self._auto_merge():
+                _raise_first(await asyncio.gather(
+                    label(),
+                    api.run_in_pool(self._notify, pr, "success", on_stage, done),
+                    return_exceptions=True
+                ))
+                logger.info(f"✅ Created PR #{pr['number']} (auto-merge disabled)")
+                return pr
+
+            if "merged" not in done:
+                # A failed labelling call is re-raised in merge_when_ready before anything is merged
+                _raise_first(await asyncio.gather(
+                    label(),
+                    api.run_in_pool(self.merge_waiter.merge_when_ready, pr["number"], method=self._merge_method(),
+                                    before_merge=labelling.result if labelling is not None else None),
+                    return_exceptions=True
+                ))
+                self.git.freshness_cache.invalidate()
+                on_stage("merged")
+            logger.info(f"✅ Successfully created and merged PR #{pr['number']}")
+
+            await api.run_in_pool(self._notify, pr, "merged", on_stage, done)
+
+        return pr
+
+    def run(self, mode="single", parallel: int = 1, use_async: bool = False):
         """
         Execute the PR creation workflow
         
         Args:
             mode: "single" or "collaborator"
+            parallel: Number of single-user branches to prepare concurrently
+            use_async: Overlap independent GitHub calls with the async client
         """
         try:
             self.mode = mode
             
+            if mode == "single" and parallel > 1:
+                return self._run_parallel(parallel)
+
             if mode == "collaborator":
                 branch, commits = self.run_collaborator_mode()
             else:
                 branch, commits = self.run_single_user_mode()
 
             if not self.dry_run and branch:
-                pr = self.create_and_merge_pr(branch, commits)
+                if use_async:
+                    import asyncio
+                    pr = asyncio.run(self.create_and_merge_pr_async(branch, commits))
+                else:
+                    pr = self.create_and_merge_pr(branch, commits)
                 return True
             elif self.dry_run:
                 return True
@@ -187,6 +495,268 @@ Each contributor added their own files and made independent commits on the same
                 pass
             return False
 
+    def _run_parallel(self, count: int) -> bool:
+        """
+        Open ``count`` single-user PRs, preparing the branches in parallel when possible
+
+        All branches edit the same files. Without auto-merge they are built
+        concurrently in worktrees from the same base and their PRs opened.
+        With auto-merge each branch has to start from the previous merge or
+        it would conflict, so the branches are built one after another in
+        the main checkout and the worktree pool is not used.
+        """
+        if self.dry_run or not self._auto_merge():
+            branches = self.run_parallel_single_user_mode(count)
+            if self.dry_run:
+                return True
+        else:
+            logger.info("🔗 Auto-merge is on, building each branch on top of the previous merge")
+            branches = None
+
+        # Report failed PRs instead of aborting the rest
+        failed = 0
+        for i in range(len(branches) if branches is not None else count):
+            branch = branches[i] if branches is not None else None
+            try:
+                if branch is None:
+                    branch, _ = self.run_single_user_mode()
+                    if branch is None:
+                        return False  # no files configured
+                self.create_and_merge_pr(branch)
+            except Exception as e:
+                failed += 1
+                logger.error(f"❌ PR {i + 1}/{count} ({branch or 'not prepared'}) failed: {e}")
+
+        verb = "merged" if self._auto_merge() else "opened"
+        prepared = len(branches) if branches is not None else count
+        logger.info(f"📊 Parallel run finished: {prepared - failed}/{count} PRs {verb}")
+        return prepared == count and failed == 0
+
+    def _prepare_branch(self, mode: str, on_stage: Optional[Callable[..., None]] = None,
+                        resume: Optional[Dict] = None, files: Optional[List[str]] = None):
+        """
+        Build and push one branch; returns (branch, commits) or (None, None)
+
+        A branch an interrupted attempt already pushed is reused, and one it
+        committed is pushed instead of being rebuilt. ``files`` overrides
+        files.to_modify in single mode.
+        """
+        on_stage = on_stage or _ignore_stage
+        stages = resume.get("stages", ()) if resume else ()
+        if "pushed" in stages:
+            logger.info(f"♻️ Reusing pushed branch {resume['branch']}")
+            return resume["branch"], resume.get("commits")
+        if "committed" in stages:
+            try:
+                self.git.push(resume["branch"])
+                on_stage("pushed")
+                logger.info(f"♻️ Pushed previously committed branch {resume['branch']}")
+                return resume["branch"], resume.get("commits")
+            except Exception as e:
+                logger.warning(f"Could not push {resume['branch']}, rebuilding: {e}")
+
+        if mode == "collaborator":
+            return self.run_collaborator_mode(on_stage)
+        return self.run_single_user_mode(on_stage, files=files)
+
+    def run_once(self, mode: str = "single", files: Optional[List[str]] = None,
+                 labels: Optional[List[str]] = None, branch_lock: Optional[threading.Lock] = None) -> Optional[Dict]:
+        """
+        Prepare one branch and open (and with auto-merge, merge) its PR
+
+        Safe to call from several threads when they share ``branch_lock``:
+        it is held while the branch is built in the shared working tree and,
+        with auto-merge, until the PR has merged, since the next branch
+        must be based on that merge. Notification happens after release.
+
+        Args:
+            mode: "single" or "collaborator"
+            files: Files to modify instead of files.to_modify (single mode)
+            labels: Labels instead of pull_request.labels
+            branch_lock: Lock serializing branch preparation and merges
+
+        Returns:
+            The PR, or None in dry-run mode
+
+        Raises:
+            RuntimeError: No branch could be prepared
+        """
+        lock = branch_lock or threading.Lock()
+        lock.acquire()
+        held = [True]
+
+        def release():
+            if held[0]:
+                held[0] = False
+                lock.release()
+
+        try:
+            branch, commits = self._prepare_branch(mode, files=files)
+            if self.dry_run:
+                return None
+            if not branch:
+                raise RuntimeError("Branch preparation produced no branch")
+            if not self._auto_merge():
+                release()
+            return self.create_and_merge_pr(
+                branch, commits, labels=labels,
+                on_stage=lambda stage, **data: release() if stage == "merged" else None
+            )
+        finally:
+            release()
+
+    def run_batch(self, count: Optional[int] = None, mode: str = "single", use_async: bool = False) -> bool:
+        """
+        Create and merge several PRs in one process
+
+        Clients, connections and caches are reused across iterations. The
+        next branch is built and pushed on a background thread while the
+        current PR is being notified and paced; with auto-merge it starts
+        right after the merge, because every branch appends to the same
+        files and must be based on the previous merge. Without auto-merge
+        nothing lands on the default branch, so it starts immediately. PRs
+        are opened at most once every run_settings.delay_seconds, and a
+        failed iteration is retried up to run_settings.max_retries times.
+
+        Every stage is recorded in the state journal. A batch that was
+        interrupted resumes where it stopped: completed PRs are skipped and
+        a half-done PR continues from its last recorded stage. The journal
+        is cleared once a batch finishes without failures, and a journal
+        left by a batch with another mode or count is refused rather than
+        replayed.
+
+        config.json is re-checked between PRs, so delay, retries,
+        collaborators, labels and the like can be changed during a long
+        batch. The PR count is fixed when the batch starts.
+
+        Args:
+            count: Number of PRs (defaults to run_settings.pr_count)
+            mode: "single" or "collaborator"
+            use_async: Overlap independent GitHub calls with the async client
+
+        Returns:
+            True if every PR succeeded
+        """
+        run_settings = self.config.settings.run_settings
+        count = count if count is not None else run_settings.pr_count
+        delay = run_settings.delay_seconds
+        max_retries = max(1, run_settings.max_retries)
+        self.mode = mode
+
+        journal = StateJournal.from_config(self.config)
+        try:
+            journal.begin({"mode": mode, "count": count, "repository": self.config.get_repo_slug()})
+        except JournalMismatchError as e:
+            logger.error(f"❌ {e}; finish that batch or run with --reset to discard it")
+            journal.close()
+            return False
+        indices = [index for index in range(1, count + 1) if not journal.is_complete(index)]
+        if len(indices) < count:
+            logger.info(f"♻️ Resuming batch: {count - len(indices)} of {count} PRs already completed")
+
+        if self.dry_run:
+            logger.info(f"[DRY RUN] Would create and merge {len(indices)} PRs in {mode} mode, {delay}s apart")
+            journal.close()
+            return True
+
+        import asyncio
+        from src.merge_waiter import MergeabilityError
+
+        stats = utils.PipelineStats()
+        logger.info(f"🏭 Starting batch of {len(indices)} PRs ({mode} mode, {delay}s between PRs)")
+
+        def prepare(index: int):
+            with stats.time("prepare"):
+                return self._prepare_branch(
+                    mode,
+                    lambda stage, **data: journal.record(index, stage, **data),
+                    journal.state(index)
+                )
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="batch-prepare")
+        try:
+            pending = executor.submit(prepare, indices[0]) if indices else None
+            last_opened = None
+
+            for position, index in enumerate(indices):
+                if self.config.reload_if_changed():
+                    delay = self.config.settings.run_settings.delay_seconds
+                    max_retries = max(1, self.config.settings.run_settings.max_retries)
+                next_index = indices[position + 1] if position + 1 < len(indices) else None
+                follow_up = []
+
+                def start_next():
+                    if next_index is not None and not follow_up:
+                        follow_up.append(executor.submit(prepare, next_index))
+
+                def on_stage(stage: str, **data):
+                    journal.record(index, stage, **data)
+                    if stage == "merged":
+                        start_next()
+
+                pr = None
+                for attempt in range(1, max_retries + 1):
+                    try:
+                        if attempt > 1:
+                            pending = executor.submit(prepare, index)
+                        branch, commits = pending.result()
+                        if not branch:
+                            raise RuntimeError("Branch preparation produced no branch")
+                        if not self._auto_merge():
+                            start_next()
+
+                        if last_opened is not None and delay > 0:
+                            with stats.time("delay"):
+                                time.sleep(max(0.0, last_opened + delay - time.monotonic()))
+                        last_opened = time.monotonic()
+
+                        resume = journal.state(index)
+                        with stats.time("github"):
+                            if use_async:
+                                pr = asyncio.run(self.create_and_merge_pr_async(branch, commits, on_stage=on_stage,
+                                                                                resume=resume))
+                            else:
+                                pr = self.create_and_merge_pr(branch, commits, on_stage=on_stage, resume=resume)
+                        break
+                    except MergeabilityError as e:
+                        # This PR can never merge; the retry starts over on a fresh branch
+                        logger.error(f"❌ PR {index}/{count} failed (attempt {attempt}/{max_retries}): {e}")
+                        journal.forget(index)
+                    except Exception as e:
+                        logger.error(f"❌ PR {index}/{count} failed (attempt {attempt}/{max_retries}): {e}")
+
+                if pr is None:
+                    stats.failed += 1
+                    try:
+                        self.notifier.send_error_notification(
+                            RuntimeError(f"PR {index}/{count} failed after {max_retries} attempts"), {"mode": mode}
+                        )
+                    except Exception:
+                        pass
+                else:
+                    stats.completed += 1
+                    logger.info(f"📈 Batch progress: {index}/{count} (PR #{pr['number']})")
+
+                start_next()
+                pending = follow_up[0] if follow_up else None
+        finally:
+            executor.shutdown(wait=True)
+            if stats.failed == 0 and journal.last_completed_pr >= count:
+                journal.reset()
+            else:
+                journal.close()
+
+        stats.log_summary(logger)
+        self.last_batch_stats = stats.summary()
+        return stats.failed == 0
+
+    def close(self):
+        """Release long-lived resources (only the subsystems that were built)"""
+        for name in ("git", "github", "notifier", "transport"):
+            component = self._components.get(name)
+            if component is not None:
+                component.close()
+
 
 def main():
     """Main entry point"""
@@ -196,14 +766,51 @@ def main():
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     parser.add_argument("--mode", type=str, choices=["single", "collaborator"], default="single",
                        help="Run mode: single user or multi-collaborator")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                       help="Overlap independent GitHub API calls (bounded by run_settings.max_concurrency)")
+    parser.add_argument("--parallel", type=int, default=1,
+                       help="Open this many single-user PRs; branches are prepared concurrently in "
+                            "separate worktrees when auto-merge is off")
+    parser.add_argument("--batch", action="store_true",
+                       help="Create and merge several PRs in one pipelined run")
+    parser.add_argument("--count", type=int, default=None,
+                       help="Number of PRs for --batch (defaults to run_settings.pr_count)")
+    parser.add_argument("--reset", action="store_true",
+                       help="Discard the saved batch state and start fresh")
+    parser.add_argument("--trace", type=str, metavar="PATH",
+                       help="Record git/GitHub/webhook timings and write a Chrome trace JSON to PATH")
+    parser.add_argument("--log-json", type=str, metavar="PATH",
+                       help="Also write logs to PATH as JSON lines")
+    parser.add_argument("--daemon", action="store_true",
+                       help="Keep running and process job files dropped into <queue-dir>/incoming")
+    parser.add_argument("--queue-dir", type=str, default=None,
+                       help="Job queue directory for --daemon (defaults to daemon.queue_dir)")
 
     args = parser.parse_args()
 
+    if args.trace:
+        tracing.enable()
+
+    creator = AutoPRCreator(config_path=args.config, dry_run=args.dry_run, log_json=args.log_json)
+    # After setup_logging, which resets the root level from the logging config
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
-
-    creator = AutoPRCreator(config_path=args.config, dry_run=args.dry_run)
-    success = creator.run(mode=args.mode)
+    if args.reset:
+        StateJournal.from_config(creator.config).reset()
+    try:
+        if args.daemon:
+            from src.daemon import JobDaemon
+            success = JobDaemon.from_config(creator, queue_dir=args.queue_dir).run()
+        elif args.batch:
+            success = creator.run_batch(count=args.count, mode=args.mode, use_async=args.use_async)
+        else:
+            success = creator.run(mode=args.mode, parallel=args.parallel, use_async=args.use_async)
+    finally:
+        creator.close()
+        tracer = tracing.disable()
+        if tracer:
+            tracer.log_summary(logger)
+            tracer.export_chrome_trace(args.trace)
 
     sys.exit(0 if success else 1)
 
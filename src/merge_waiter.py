@@ -0,0 +1,152 @@
+import time
+import logging
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from src import tracing
+
+logger = logging.getLogger(__name__)
+
+
+class MergeabilityError(RuntimeError):
+    """Pull request cannot be merged (conflicts, closed, or never became ready)"""
+
+
+class MergeabilityWaiter:
+    """
+    Waits for GitHub to compute a PR's mergeability before merging it
+
+    GitHub computes ``mergeable`` in the background after a PR is opened or
+    its base moves, and reports ``null`` until then; merging too early fails
+    with 405. The waiter polls ``get_pr`` starting with short intervals that
+    grow up to ``merge.retry_delay_seconds``. Polls go through the client's
+    conditional GET cache, so unchanged responses come back as 304 and cost
+    no rate limit. The merge is only sent once the PR is ready, and a 405
+    after that is retried up to ``merge.retry_count`` times.
+    """
+
+    def __init__(self, client, retry_count: int = 3, retry_delay: float = 5,
+                 poll_timeout: float = 120, initial_interval: float = 0.5,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize waiter
+
+        Args:
+            client: GitHubClient instance
+            retry_count: Merge attempts rejected with 405 before giving up
+            retry_delay: Longest interval between polls, and delay between merge attempts
+            poll_timeout: Maximum seconds to wait for mergeability
+            initial_interval: First poll interval; each later one is 1.5x longer
+            clock: Monotonic time source
+            sleep: Sleep function
+        """
+        self.client = client
+        self.retry_count = max(1, retry_count)
+        self.retry_delay = retry_delay
+        self.poll_timeout = poll_timeout
+        self.initial_interval = min(initial_interval, retry_delay)
+        self._clock = clock
+        self._sleep = sleep
+        self.polls = 0
+
+    @classmethod
+    def from_config(cls, client, config) -> "MergeabilityWaiter":
+        """Create a waiter from github.merge in a ConfigManager"""
+        merge = config.settings.merge
+        return cls(
+            client,
+            retry_count=merge.retry_count,
+            retry_delay=merge.retry_delay_seconds,
+            poll_timeout=merge.poll_timeout_seconds
+        )
+
+    def apply_config(self, config):
+        """Pick up reloaded github.merge settings"""
+        merge = config.settings.merge
+        self.retry_count = max(1, merge.retry_count)
+        self.retry_delay = merge.retry_delay_seconds
+        self.poll_timeout = merge.poll_timeout_seconds
+
+    @tracing.traced("wait_mergeable", "github")
+    def wait(self, pr_number: int) -> Dict[str, Any]:
+        """
+        Poll a PR until GitHub reports it mergeable
+
+        Args:
+            pr_number: PR number
+
+        Returns:
+            The PR data from the last poll
+
+        Raises:
+            MergeabilityError: If the PR is closed, has conflicts, or the timeout expires
+        """
+        deadline = self._clock() + self.poll_timeout
+        interval = self.initial_interval
+
+        while True:
+            pr = self.client.get_pr(pr_number)
+            self.polls += 1
+
+            if pr.get("merged"):
+                return pr
+            if pr.get("state") != "open":
+                raise MergeabilityError(f"PR #{pr_number} is {pr.get('state')}")
+            if pr.get("mergeable") is True:
+                return pr
+            if pr.get("mergeable") is False:
+                raise MergeabilityError(
+                    f"PR #{pr_number} is not mergeable ({pr.get('mergeable_state', 'unknown')})"
+                )
+
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                raise MergeabilityError(
+                    f"Timed out after {self.poll_timeout}s waiting for PR #{pr_number} to become mergeable"
+                )
+            logger.debug("PR #%s mergeability not computed yet, polling again in %.1fs", pr_number, interval)
+            self._sleep(min(interval, remaining))
+            interval = min(interval * 1.5, self.retry_delay)
+
+    def merge_when_ready(self, pr_number: int, method: str = "merge",
+                         before_merge: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+        """
+        Wait for a PR to become mergeable, then merge it
+
+        Args:
+            pr_number: PR number
+            method: Merge method (merge, squash, rebase)
+            before_merge: Called once the PR is mergeable, before the first merge
+                attempt; an exception it raises cancels the merge
+
+        Returns:
+            Merge result
+
+        Raises:
+            MergeabilityError: If the PR never becomes mergeable
+        """
+        for attempt in range(1, self.retry_count + 1):
+            pr = self.wait(pr_number)
+            if before_merge is not None:
+                before_merge()
+                before_merge = None
+            if pr.get("merged"):
+                logger.info(f"PR #{pr_number} is already merged")
+                return {"merged": True, "sha": pr.get("merge_commit_sha")}
+
+            try:
+                return self.client.merge_pr(pr_number, method=method)
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                # 405: not mergeable after all (e.g. the base just moved)
+                if status != 405 or attempt == self.retry_count:
+                    raise
+                logger.warning(
+                    f"Merge of PR #{pr_number} rejected, retrying in {self.retry_delay}s "
+                    f"(attempt {attempt}/{self.retry_count})"
+                )
+                self._sleep(self.retry_delay)
+
+        raise MergeabilityError(f"PR #{pr_number} could not be merged")
@@ -0,0 +1,184 @@
+import itertools
+import queue
+import threading
+import time
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.config_schema import DispatchSettings
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class NotificationDispatcher:
+    """
+    Background delivery for NotificationManager
+
+    Events are put on a bounded queue and returned immediately, so webhook
+    latency never blocks the PR pipeline. A worker thread collects events
+    for up to ``coalesce_seconds`` after the first one arrives and delivers
+    them in submission order: consecutive PR events are folded into a
+    single summary message, error events are delivered one by one. When the
+    queue is full the oldest event is dropped. ``close()`` flushes
+    everything still queued. While idle the worker retries the manager's
+    outbox every ``retry_interval`` seconds.
+    """
+
+    def __init__(self, manager, max_queue: int = 1000, coalesce_seconds: float = 2.0, max_batch: int = 20,
+                 retry_interval: float = 5.0):
+        """
+        Initialize dispatcher and start its worker thread
+
+        Args:
+            manager: NotificationManager that performs the actual delivery
+            max_queue: Maximum number of pending events
+            coalesce_seconds: How long to gather a burst before delivering it
+            max_batch: Maximum PR events folded into one summary message
+            retry_interval: Seconds between outbox retries while idle
+        """
+        self.manager = manager
+        self.coalesce_seconds = coalesce_seconds
+        self.max_batch = max(1, max_batch)
+        self.retry_interval = retry_interval
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_queue))
+        self._closed = False
+        self.delivered = 0
+        self.dropped = 0
+        self._worker = threading.Thread(target=self._run, name="notification-dispatcher", daemon=True)
+        self._worker.start()
+
+    @classmethod
+    def from_config(cls, manager, config) -> Optional["NotificationDispatcher"]:
+        """Create a dispatcher from notifications.dispatch, or None if disabled"""
+        settings = config.settings.notifications.dispatch
+        if not settings.enabled:
+            return None
+        return cls(
+            manager,
+            max_queue=settings.queue_size,
+            coalesce_seconds=settings.coalesce_seconds,
+            max_batch=settings.max_batch,
+            retry_interval=settings.retry_interval_seconds
+        )
+
+    def apply_settings(self, settings: DispatchSettings):
+        """Update coalescing and retry timing from notifications.dispatch (queue size stays)"""
+        self.coalesce_seconds = settings.coalesce_seconds
+        self.max_batch = settings.max_batch
+        self.retry_interval = settings.retry_interval_seconds
+
+    def submit(self, kind: str, *args: Any):
+        """
+        Queue an event without blocking
+
+        Args:
+            kind: "pr" (args: pr, status) or "error" (args: message)
+            *args: Event arguments
+        """
+        if self._closed:
+            logger.warning(f"Notification dispatcher closed, dropping {kind} event")
+            return
+        event = (kind, args)
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                    logger.warning("Notification queue full, dropped the oldest event")
+                except queue.Empty:
+                    pass
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            try:
+                event = self._queue.get(timeout=self.retry_interval)
+            except queue.Empty:
+                self._retry()
+                continue
+            if event is _STOP:
+                break
+
+            batch = [event]
+            deadline = time.monotonic() + self.coalesce_seconds
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if event is _STOP:
+                    stopping = True
+                    break
+                batch.append(event)
+
+            self._deliver(batch)
+
+        # Flush whatever is still queued after the stop marker
+        leftover = []
+        while True:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if event is not _STOP:
+                leftover.append(event)
+        for start in range(0, len(leftover), self.max_batch):
+            self._deliver(leftover[start:start + self.max_batch])
+
+    def _deliver(self, batch: List[Tuple[str, tuple]]):
+        for kind, group in itertools.groupby(batch, key=lambda event: event[0]):
+            events = [args for _, args in group]
+            try:
+                if kind == "pr":
+                    self.manager.deliver_events(events)
+                else:
+                    for args in events:
+                        self.manager.deliver_error(*args)
+                self.delivered += len(events)
+            except Exception as e:
+                logger.error(f"Notification delivery failed: {e}")
+
+    def _retry(self):
+        try:
+            self.manager.retry_pending()
+        except Exception as e:
+            logger.error(f"Notification retry failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """Get delivery counters"""
+        return {"queued": self._queue.qsize(), "delivered": self.delivered, "dropped": self.dropped}
+
+    def close(self, timeout: float = 30) -> bool:
+        """
+        Deliver everything still queued and stop the worker
+
+        Calling it again after a timeout waits for the flush once more.
+
+        Args:
+            timeout: Maximum seconds to wait for the flush
+
+        Returns:
+            True once the worker has exited, False if it is still delivering
+        """
+        if not self._closed:
+            self._closed = True
+            while True:
+                try:
+                    self._queue.put(_STOP, timeout=1)
+                    break
+                except queue.Full:
+                    if not self._worker.is_alive():
+                        break
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            logger.warning(f"Notification flush did not finish within {timeout}s")
+            return False
+        return True
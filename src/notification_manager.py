@@ -1,27 +1,35 @@
-import requests
 import logging
-from typing import Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+from src import tracing
+from src.http_transport import HttpTransport
+from src.notification_dispatcher import NotificationDispatcher
+from src.notification_outbox import NotificationOutbox
+
 logger = logging.getLogger(__name__)
 
 
 class NotificationManager:
     """Enhanced notification manager with Discord and Slack support"""
 
-    def __init__(self, config):
+    def __init__(self, config, transport: Optional[HttpTransport] = None):
         """
         Initialize notification manager
         
         Args:
             config: ConfigManager instance
+            transport: Shared HTTP transport, created from config if omitted
         """
         self.config = config
-        self.notification_config = config.get_notification_config()
+        self.transport = transport or HttpTransport.from_config(config)
+        channels = config.settings.notifications
 
-        # Get webhooks from environment
-        self.discord_webhook = config.get_discord_webhook()
-        self.slack_webhook = config.get_slack_webhook()
+        # Get webhooks from environment, for the channels switched on in notifications.enabled
+        self.discord_webhook = config.get_discord_webhook() if channels.discord else None
+        self.slack_webhook = config.get_slack_webhook() if channels.slack else None
 
         # Log which notifications are enabled
         enabled = []
@@ -35,10 +43,23 @@ class NotificationManager:
         else:
             logger.info("No notifications configured")
 
+        # Both channels are posted to at the same time
+        self._channel_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="webhook") if enabled else None
+
+        # Undelivered payloads survive outages and restarts
+        self.outbox = NotificationOutbox.from_config(config) if enabled else None
+        self._drain_locks = {"discord": threading.Lock(), "slack": threading.Lock()}
+
+        # Deliver in the background so webhooks stay off the PR critical path
+        self.dispatcher = NotificationDispatcher.from_config(self, config) if enabled else None
+        self._closed = False
+
     def send_notification(self, pr: Dict, status: str = "success"):
         """
         Send notification about PR status
-        
+
+        Returns immediately when background dispatch is enabled.
+
         Args:
             pr: Pull request data from GitHub API
             status: Status of the operation (success, failed, merged)
@@ -47,16 +68,162 @@ class NotificationManager:
             logger.debug("No notification channels configured, skipping")
             return
 
-        # Create message
-        message = self._format_message(pr, status)
+        if self.dispatcher:
+            self.dispatcher.submit("pr", pr, status)
+        else:
+            self.deliver_events([(pr, status)])
 
-        # Send to Discord if configured
-        if self.discord_webhook:
-            self._send_discord(message, pr)
+    def deliver_events(self, events: List[Tuple[Dict, str]]):
+        """
+        Post PR events to every channel now
+
+        A single event gets the detailed message; several are folded into
+        one summary message.
+
+        Args:
+            events: (pr, status) pairs
+        """
+        if len(events) == 1:
+            pr, status = events[0]
+            message = self._format_message(pr, status)
+            self._broadcast(self._discord_payload(message, pr), self._slack_payload(message, pr))
+            logger.debug(f"Notification sent for PR #{pr.get('number')}")
+            return
+
+        message = self._format_summary(events)
+        self._broadcast(
+            {
+                "content": message,
+                "username": "Auto PR Creator",
+                "avatar_url": "https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png"
+            },
+            {"text": message}
+        )
+        logger.debug(f"Summary notification sent for {len(events)} PR events")
+
+    def _post(self, channel: str, url: str, payload: Dict):
+        """POST a payload to a webhook, traced per channel"""
+        with tracing.span(channel, "webhook") as span:
+            response = self.transport.request("POST", url, json=payload, timeout=10)
+            span.set(status=response.status_code)
+        return response
 
-        # Send to Slack if configured
+    def _attempt(self, channel: str, url: str, payload: Dict) -> Tuple[bool, Optional[str], Optional[float]]:
+        """
+        Post one payload and check the response
+
+        Returns:
+            (delivered, error, retry_after) where retry_after is the wait a
+            429 asked for, in seconds
+        """
+        try:
+            response = self._post(channel, url, payload)
+            if response.status_code == 429:
+                return False, "429 Too Many Requests", _retry_after(response)
+            response.raise_for_status()
+            return True, None, None
+        except Exception as e:
+            return False, str(e), None
+
+    def _deliver(self, channel: str, url: str, payload: Dict) -> bool:
+        """
+        Post one payload, queueing it in the outbox if that fails
+
+        While a channel has a backlog new payloads are queued behind it so
+        messages arrive in order.
+
+        Returns:
+            True if the webhook accepted it now
+        """
+        if self.outbox and self.outbox.has_pending(channel):
+            self.outbox.add(channel, url, payload)
+            self._drain(channel, url)
+            return False
+
+        delivered, error, retry_after = self._attempt(channel, url, payload)
+        if delivered:
+            return True
+        logger.error(f"Failed to send {channel.capitalize()} notification: {error}")
+        if self.outbox:
+            self.outbox.add(channel, url, payload, error, retry_after)
+        return False
+
+    def _drain(self, channel: str, url: Optional[str]) -> int:
+        """
+        Deliver a channel's due outbox payloads in batches, oldest first
+
+        Each payload goes to the webhook it was queued for; ``url`` is only
+        used for rows from outboxes that did not record one, and such rows
+        are parked as dead when the channel has no webhook any more. Stops
+        at the first failure, since the channel is evidently still down.
+
+        Returns:
+            Number of payloads delivered
+        """
+        with self._drain_locks[channel]:
+            sent = 0
+            while True:
+                batch = self.outbox.due(channel)
+                if not batch:
+                    break
+                delivered = []
+                failed = False
+                for row_id, row_url, payload in batch:
+                    target = row_url or url
+                    if not target:
+                        self.outbox.abandon(row_id, "no webhook configured for this channel")
+                        continue
+                    ok, error, retry_after = self._attempt(channel, target, payload)
+                    if not ok:
+                        self.outbox.failed(row_id, error, retry_after)
+                        failed = True
+                        break
+                    delivered.append(row_id)
+                self.outbox.delivered(delivered)
+                sent += len(delivered)
+                if failed:
+                    break
+        if sent:
+            logger.info(f"📬 Delivered {sent} queued {channel.capitalize()} notifications")
+        return sent
+
+    def retry_pending(self) -> int:
+        """
+        Retry outbox payloads that are due on every channel with a backlog
+
+        Returns:
+            Number of payloads delivered
+        """
+        if not self.outbox:
+            return 0
+        sent = 0
+        for channel, url in (("discord", self.discord_webhook), ("slack", self.slack_webhook)):
+            if self.outbox.has_pending(channel):
+                sent += self._drain(channel, url)
+        return sent
+
+    def _broadcast(self, discord_payload: Dict, slack_payload: Dict) -> Dict[str, bool]:
+        """
+        Post to all configured channels concurrently
+
+        Returns:
+            Delivery result per channel
+        """
+        targets = []
+        if self.discord_webhook:
+            targets.append(("discord", self.discord_webhook, discord_payload))
         if self.slack_webhook:
-            self._send_slack(message, pr)
+            targets.append(("slack", self.slack_webhook, slack_payload))
+
+        if len(targets) == 1:
+            channel, url, payload = targets[0]
+            return {channel: self._deliver(channel, url, payload)}
+
+        futures = {
+            channel: self._channel_pool.submit(self._deliver, channel, url, payload)
+            for channel, url, payload in targets
+        }
+        return {channel: future.result() for channel, future in futures.items()}
 
     def _format_message(self, pr: Dict, status: str) -> str:
         """
@@ -69,8 +236,7 @@ class NotificationManager:
         Returns:
             Formatted message
         """
-        repo = self.config.get_repo_config()
-        repo_name = f"{repo.get('owner')}/{repo.get('name')}"
+        repo_name = self.config.get_repo_slug()
 
         # Status emoji
         emoji = {
@@ -94,94 +260,84 @@ class NotificationManager:
 
         return message
 
-    def _send_discord(self, message: str, pr: Dict):
+    def _format_summary(self, events: List[Tuple[Dict, str]]) -> str:
         """
-        Send notification to Discord webhook
-        
-        Args:
-            message: Formatted message
-            pr: Pull request data
-        """
-        if not self.discord_webhook:
-            return
-
-        try:
-            # Discord webhook payload
-            payload = {
-                "content": message,
-                "username": "Auto PR Creator",
-                "avatar_url": "https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png",
-                "embeds": [{
-                    "title": pr.get('title', 'Pull Request'),
-                    "url": pr.get('html_url', ''),
-                    "color": 0x2ecc71 if pr.get('merged') else 0x3498db,
-                    "fields": [
-                        {
-                            "name": "Branch",
-                            "value": f"`{pr.get('head', {}).get('ref', 'unknown')}` → `{pr.get('base', {}).get('ref', 'main')}`",
-                            "inline": True
-                        },
-                        {
-                            "name": "Created by",
-                            "value": pr.get('user', {}).get('login', 'auto'),
-                            "inline": True
-                        }
-                    ],
-                    "timestamp": datetime.now().isoformat()
-                }]
-            }
-
-            response = requests.post(self.discord_webhook, json=payload, timeout=10)
-            response.raise_for_status()
-            logger.debug(f"Discord notification sent for PR #{pr.get('number')}")
+        Format several PR events as one message
 
-        except Exception as e:
-            logger.error(f"Failed to send Discord notification: {e}")
-
-    def _send_slack(self, message: str, pr: Dict):
-        """
-        Send notification to Slack webhook
-        
         Args:
-            message: Formatted message
-            pr: Pull request data
+            events: (pr, status) pairs
+
+        Returns:
+            Formatted message
         """
-        if not self.slack_webhook:
-            return
+        repo_name = self.config.get_repo_slug()
 
-        try:
-            # Slack webhook payload
-            payload = {
-                "text": message,
-                "blocks": [
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": message
-                        }
-                    },
+        lines = [
+            f"📦 **Auto PR Creator - {len(events)} UPDATES**",
+            "━━━━━━━━━━━━━━━━━━━━━━",
+            f"**Repository:** `{repo_name}`"
+        ]
+        for pr, status in events:
+            emoji = {"success": "✅", "merged": "🚀", "failed": "❌", "created": "🆕"}.get(status, "📋")
+            lines.append(
+                f"{emoji} PR #{pr.get('number')} {status}: {pr.get('title', 'Untitled')} - {pr.get('html_url', 'No URL')}"
+            )
+        lines.append(f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append("━━━━━━━━━━━━━━━━━━━━━━")
+        return "\n".join(lines)
+
+    def _discord_payload(self, message: str, pr: Dict) -> Dict:
+        """Build the Discord webhook payload for one PR event"""
+        return {
+            "content": message,
+            "username": "Auto PR Creator",
+            "avatar_url": "https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png",
+            "embeds": [{
+                "title": pr.get('title', 'Pull Request'),
+                "url": pr.get('html_url', ''),
+                "color": 0x2ecc71 if pr.get('merged') else 0x3498db,
+                "fields": [
                     {
-                        "type": "divider"
+                        "name": "Branch",
+                        "value": f"`{pr.get('head', {}).get('ref', 'unknown')}` → `{pr.get('base', {}).get('ref', 'main')}`",
+                        "inline": True
                     },
                     {
-                        "type": "context",
-                        "elements": [
-                            {
-                                "type": "mrkdwn",
-                                "text": f"<{pr.get('html_url', '#')}|View Pull Request>"
-                            }
-                        ]
+                        "name": "Created by",
+                        "value": pr.get('user', {}).get('login', 'auto'),
+                        "inline": True
                     }
-                ]
-            }
-
-            response = requests.post(self.slack_webhook, json=payload, timeout=10)
-            response.raise_for_status()
-            logger.debug(f"Slack notification sent for PR #{pr.get('number')}")
+                ],
+                "timestamp": datetime.now().isoformat()
+            }]
+        }
 
-        except Exception as e:
-            logger.error(f"Failed to send Slack notification: {e}")
+    def _slack_payload(self, message: str, pr: Dict) -> Dict:
+        """Build the Slack webhook payload for one PR event"""
+        return {
+            "text": message,
+            "blocks": [
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": message
+                    }
+                },
+                {
+                    "type": "divider"
+                },
+                {
+                    "type": "context",
+                    "elements": [
+                        {
+                            "type": "mrkdwn",
+                            "text": f"<{pr.get('html_url', '#')}|View Pull Request>"
+                        }
+                    ]
+                }
+            ]
+        }
 
     def send_error_notification(self, error: Exception, context: Dict = None):
         """
@@ -207,18 +363,57 @@ class NotificationManager:
 
         error_message += "━━━━━━━━━━━━━━━━━━━━━━"
 
-        # Send to Discord
-        if self.discord_webhook:
-            try:
-                payload = {"content": error_message}
-                requests.post(self.discord_webhook, json=payload, timeout=10)
-            except Exception as e:
-                logger.error(f"Failed to send error to Discord: {e}")
+        if self.dispatcher:
+            self.dispatcher.submit("error", error_message)
+        else:
+            self.deliver_error(error_message)
 
-        # Send to Slack
-        if self.slack_webhook:
-            try:
-                payload = {"text": error_message}
-                requests.post(self.slack_webhook, json=payload, timeout=10)
-            except Exception as e:
-                logger.error(f"Failed to send error to Slack: {e}")
\ No newline at end of file
+    def deliver_error(self, error_message: str):
+        """Post a formatted error message to every channel now"""
+        self._broadcast({"content": error_message}, {"text": error_message})
+
+    def apply_config(self, config):
+        """Pick up reloaded notification settings"""
+        if self.dispatcher:
+            self.dispatcher.apply_settings(config.settings.notifications.dispatch)
+
+    def close(self):
+        """
+        Flush queued notifications and stop background workers
+
+        The webhook pool and the outbox stay open while the dispatcher is
+        still delivering, so a slow flush never loses its payloads.
+        """
+        if self._closed:
+            return
+        if self.dispatcher and not self.dispatcher.close():
+            logger.warning("Notifications are still being delivered, leaving the webhook pool and outbox open")
+            return
+        self._closed = True
+        if self._channel_pool:
+            self._channel_pool.shutdown(wait=True)
+        if self.outbox:
+            self.retry_pending()
+            pending = self.outbox.stats()["pending"]
+            if pending:
+                logger.warning(f"📮 {pending} notifications still in the outbox, they will be retried on the next run")
+            self.outbox.close()
+
+
+def _retry_after(response) -> Optional[float]:
+    """
+    Read the wait a 429 response asks for
+
+    Discord sends ``retry_after`` (seconds) in the JSON body, Slack sends a
+    ``Retry-After`` header.
+    """
+    try:
+        body = response.json()
+        if isinstance(body, dict) and body.get("retry_after") is not None:
+            return float(body["retry_after"])
+    except ValueError:
+        pass
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,227 @@
+import json
+import random
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    channel TEXT NOT NULL,
+    url TEXT,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    created REAL NOT NULL,
+    last_error TEXT,
+    dead INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (channel, dead, next_attempt, id);
+"""
+
+
+class NotificationOutbox:
+    """
+    SQLite outbox for webhook payloads that could not be delivered
+
+    Failed payloads are stored per channel, together with the webhook URL
+    they were meant for, and retried with exponential backoff (with
+    jitter). A 429 pauses the whole channel for exactly the ``retry_after``
+    the platform asked for. A channel's backlog is delivered strictly
+    oldest first: a payload is only handed out once every older one has
+    been delivered, so a row still in backoff holds back the newer ones.
+    Payloads that keep failing are parked as dead after ``max_attempts``
+    instead of being retried forever.
+    """
+
+    def __init__(self, path: str = ".cache/notification-outbox.sqlite3", max_attempts: int = 10,
+                 base_delay: float = 2.0, max_delay: float = 600.0, batch_size: int = 20,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize outbox
+
+        Args:
+            path: SQLite database file
+            max_attempts: Delivery attempts before a payload is parked as dead
+            base_delay: Backoff after the first failure, doubled per attempt
+            max_delay: Upper bound for the backoff
+            batch_size: Payloads taken per drain
+            clock: Wall-clock time source
+        """
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.batch_size = batch_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._blocked_until: Dict[str, float] = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(outbox)")}
+        if "url" not in columns:
+            # Outboxes from before rows remembered their webhook
+            self._db.execute("ALTER TABLE outbox ADD COLUMN url TEXT")
+
+    @classmethod
+    def from_config(cls, config) -> Optional["NotificationOutbox"]:
+        """Create an outbox from notifications.outbox, or None if disabled"""
+        settings = config.settings.notifications.outbox
+        if not settings.enabled:
+            return None
+        return cls(
+            path=settings.path,
+            max_attempts=settings.max_attempts,
+            base_delay=settings.base_delay_seconds,
+            max_delay=settings.max_delay_seconds,
+            batch_size=settings.batch_size
+        )
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.max_delay, self.base_delay * (2 ** max(0, attempts - 1)))
+        return delay * random.uniform(0.8, 1.2)
+
+    def add(self, channel: str, url: str, payload: Dict, error: Optional[str] = None,
+            retry_after: Optional[float] = None):
+        """
+        Store an undelivered payload
+
+        Args:
+            channel: Channel name (discord, slack)
+            url: Webhook the payload is delivered to, even if the channel's webhook changes later
+            payload: Webhook payload
+            error: Why the first delivery attempt failed; None queues the
+                payload unattempted behind the channel's backlog
+            retry_after: Seconds the platform asked to wait, if any
+        """
+        now = self._clock()
+        attempts = 0 if error is None else 1
+        if error is None:
+            delay = 0.0
+        else:
+            delay = retry_after if retry_after is not None else self._backoff(1)
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO outbox (channel, url, payload, attempts, next_attempt, created, last_error) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (channel, url, json.dumps(payload), attempts, now + delay, now, error)
+            )
+        if error is None:
+            return
+        if retry_after is not None:
+            self.block(channel, retry_after)
+        logger.warning(f"📮 Queued {channel} notification for retry in {delay:.1f}s: {error}")
+
+    def block(self, channel: str, seconds: float):
+        """Pause every delivery to a channel (e.g. after a 429)"""
+        with self._lock:
+            self._blocked_until[channel] = max(self._blocked_until.get(channel, 0.0), self._clock() + seconds)
+
+    def is_blocked(self, channel: str) -> bool:
+        """Whether a channel is paused by a rate limit"""
+        with self._lock:
+            return self._blocked_until.get(channel, 0.0) > self._clock()
+
+    def has_pending(self, channel: str) -> bool:
+        """Whether a channel has undelivered payloads (due or not)"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM outbox WHERE channel = ? AND dead = 0 LIMIT 1", (channel,)
+            ).fetchone()
+        return row is not None
+
+    def due(self, channel: str) -> List[Tuple[int, Optional[str], Dict]]:
+        """
+        Take the next batch of payloads that are due for a channel
+
+        Only the run of due payloads at the head of the backlog is returned;
+        the first one still in backoff ends the batch, so nothing overtakes
+        an older payload.
+
+        Args:
+            channel: Channel name
+
+        Returns:
+            (id, url, payload) tuples, oldest first; empty while the channel is paused
+        """
+        if self.is_blocked(channel):
+            return []
+        now = self._clock()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, url, payload, next_attempt FROM outbox WHERE channel = ? AND dead = 0 "
+                "ORDER BY id LIMIT ?",
+                (channel, self.batch_size)
+            ).fetchall()
+        batch = []
+        for row_id, url, payload, next_attempt in rows:
+            if next_attempt > now:
+                break
+            batch.append((row_id, url, json.loads(payload)))
+        return batch
+
+    def delivered(self, ids: List[int]):
+        """Remove delivered payloads"""
+        if not ids:
+            return
+        with self._lock:
+            self._db.executemany("DELETE FROM outbox WHERE id = ?", [(row_id,) for row_id in ids])
+
+    def failed(self, row_id: int, error: str, retry_after: Optional[float] = None):
+        """
+        Reschedule a payload after another failed attempt
+
+        Args:
+            row_id: Outbox row
+            error: Why delivery failed
+            retry_after: Seconds the platform asked to wait, if any
+        """
+        with self._lock:
+            row = self._db.execute("SELECT channel, attempts FROM outbox WHERE id = ?", (row_id,)).fetchone()
+            if row is None:
+                return
+            channel, attempts = row[0], row[1] + 1
+            if attempts >= self.max_attempts:
+                self._db.execute(
+                    "UPDATE outbox SET attempts = ?, last_error = ?, dead = 1 WHERE id = ?",
+                    (attempts, error, row_id)
+                )
+                logger.error(f"Giving up on {channel} notification after {attempts} attempts: {error}")
+                return
+            delay = retry_after if retry_after is not None else self._backoff(attempts)
+            self._db.execute(
+                "UPDATE outbox SET attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?",
+                (attempts, self._clock() + delay, error, row_id)
+            )
+        if retry_after is not None:
+            self.block(channel, retry_after)
+
+    def abandon(self, row_id: int, error: str):
+        """Park a payload as dead without retrying it (e.g. it has nowhere to go)"""
+        with self._lock:
+            row = self._db.execute("SELECT channel FROM outbox WHERE id = ?", (row_id,)).fetchone()
+            if row is None:
+                return
+            self._db.execute("UPDATE outbox SET last_error = ?, dead = 1 WHERE id = ?", (error, row_id))
+        logger.error(f"Giving up on {row[0]} notification: {error}")
+
+    def stats(self) -> Dict[str, int]:
+        """Get pending and dead payload counts"""
+        with self._lock:
+            pending, dead = self._db.execute(
+                "SELECT COALESCE(SUM(dead = 0), 0), COALESCE(SUM(dead = 1), 0) FROM outbox"
+            ).fetchone()
+        return {"pending": pending, "dead": dead}
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._db.close()
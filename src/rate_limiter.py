@@ -0,0 +1,210 @@
+import threading
+import time
+import logging
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class _ResourceBudget:
+    """Server-reported budget for one rate-limit resource (core, graphql, search, ...)"""
+
+    def __init__(self):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset: float = 0.0
+        self.blocked_until: float = 0.0
+        self.next_allowed: float = 0.0
+
+
+class RateLimitScheduler:
+    """
+    Paces GitHub API calls from the rate-limit headers GitHub returns
+
+    Each resource's primary budget comes from ``X-RateLimit-Remaining`` and
+    ``X-RateLimit-Reset``. Once the remaining budget falls below a reserve,
+    calls are spread evenly until the reset instead of running dry. Mutating
+    calls also draw from a token bucket for GitHub's secondary
+    (content-creation) limit. A 429 or secondary-limit 403 blocks the
+    resource for exactly as long as ``Retry-After`` (or the reset time) asks.
+    """
+
+    def __init__(self, secondary_per_minute: float = 80, secondary_burst: int = 10,
+                 reserve_fraction: float = 0.2, clock: Callable[[], float] = time.time,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize scheduler
+
+        Args:
+            secondary_per_minute: Sustained rate of mutating calls
+            secondary_burst: Mutating calls allowed back to back
+            reserve_fraction: Fraction of the primary budget below which calls are paced
+            clock: Wall-clock time source (reset headers are epoch seconds)
+            sleep: Sleep function
+        """
+        self.secondary_rate = secondary_per_minute / 60.0
+        self.secondary_burst = secondary_burst
+        self.reserve_fraction = reserve_fraction
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._budgets: Dict[str, _ResourceBudget] = {}
+        self._secondary_tokens = float(secondary_burst)
+        self._secondary_updated = clock()
+        self.total_wait = 0.0
+
+    @classmethod
+    def from_config(cls, config) -> "RateLimitScheduler":
+        """Create a scheduler from github.rate_limit in a ConfigManager"""
+        settings = config.settings.rate_limit
+        return cls(
+            secondary_per_minute=settings.secondary_per_minute,
+            secondary_burst=settings.secondary_burst,
+            reserve_fraction=settings.reserve_fraction
+        )
+
+    def _budget(self, resource: str) -> _ResourceBudget:
+        if resource not in self._budgets:
+            self._budgets[resource] = _ResourceBudget()
+        return self._budgets[resource]
+
+    def _reserve(self, method: str, resource: str) -> float:
+        """Take a slot if one is available now, otherwise return how long to wait"""
+        now = self._clock()
+        budget = self._budget(resource)
+        wait = budget.blocked_until - now
+
+        pace = 0.0
+        if budget.remaining is not None and budget.reset > now:
+            if budget.remaining <= 0:
+                wait = max(wait, budget.reset - now)
+            elif budget.limit and budget.remaining < budget.limit * self.reserve_fraction:
+                pace = (budget.reset - now) / budget.remaining
+                wait = max(wait, budget.next_allowed - now)
+
+        mutating = method.upper() in MUTATING_METHODS
+        if mutating:
+            elapsed = now - self._secondary_updated
+            self._secondary_tokens = min(self.secondary_burst, self._secondary_tokens + elapsed * self.secondary_rate)
+            self._secondary_updated = now
+            if self._secondary_tokens < 1:
+                wait = max(wait, (1 - self._secondary_tokens) / self.secondary_rate)
+
+        if wait > 0:
+            return wait
+
+        if mutating:
+            self._secondary_tokens -= 1
+        if budget.remaining is not None:
+            budget.remaining -= 1
+        budget.next_allowed = now + pace
+        return 0.0
+
+    def acquire(self, method: str = "GET", resource: str = "core"):
+        """
+        Block until a call to ``resource`` is allowed
+
+        Args:
+            method: HTTP method of the call
+            resource: Rate-limit resource the call is billed to
+        """
+        while True:
+            with self._lock:
+                wait = self._reserve(method, resource)
+                if wait > 0:
+                    self.total_wait += wait
+            if wait <= 0:
+                return
+            logger.debug("Rate limiter pacing %s: sleeping %.2fs", resource, wait)
+            self._sleep(wait)
+
+    def update(self, headers, resource: str = "core") -> str:
+        """
+        Record the budget reported in response headers
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+            resource: Resource assumed when the response does not name one
+
+        Returns:
+            The resource the response was billed to
+        """
+        resource = headers.get("X-RateLimit-Resource", resource)
+        with self._lock:
+            budget = self._budget(resource)
+            try:
+                if "X-RateLimit-Limit" in headers:
+                    budget.limit = int(headers["X-RateLimit-Limit"])
+                if "X-RateLimit-Remaining" in headers:
+                    budget.remaining = int(headers["X-RateLimit-Remaining"])
+                if "X-RateLimit-Reset" in headers:
+                    budget.reset = float(headers["X-RateLimit-Reset"])
+            except ValueError:
+                logger.debug(f"Ignoring malformed rate-limit headers for {resource}")
+        return resource
+
+    def retry_after(self, status_code: int, headers, resource: str = "core") -> Optional[float]:
+        """
+        Work out whether a response was a rate-limit rejection
+
+        Blocks the resource until the server says it may be retried.
+
+        Args:
+            status_code: Response status code
+            headers: Response headers
+            resource: Resource the call was billed to
+
+        Returns:
+            Seconds to wait before retrying, or None if this was not a rate-limit rejection
+        """
+        if status_code not in (403, 429):
+            return None
+
+        now = self._clock()
+        delay = None
+        if "Retry-After" in headers:
+            try:
+                delay = float(headers["Retry-After"])
+            except ValueError:
+                delay = None
+        if delay is None and headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+            delay = max(float(headers["X-RateLimit-Reset"]) - now, 0.0)
+        if delay is None:
+            if status_code == 403:
+                # Plain permission error, not a rate limit
+                return None
+            # 429 without guidance: GitHub asks for at least a minute
+            delay = 60.0
+
+        with self._lock:
+            budget = self._budget(resource)
+            budget.blocked_until = max(budget.blocked_until, now + delay)
+        logger.warning(f"⏳ GitHub rate limit hit on '{resource}', retrying in {delay:.1f}s")
+        return delay
+
+    def get_budget(self) -> Dict[str, Dict]:
+        """
+        Current budget per resource, for metrics and logging
+
+        Returns:
+            Mapping of resource name to limit, remaining, reset and blocked_until,
+            plus a 'secondary' entry with the available mutating-call tokens
+        """
+        with self._lock:
+            budget = {
+                name: {
+                    "limit": state.limit,
+                    "remaining": state.remaining,
+                    "reset": state.reset,
+                    "blocked_until": state.blocked_until
+                }
+                for name, state in self._budgets.items()
+            }
+            budget["secondary"] = {
+                "tokens": round(self._secondary_tokens, 2),
+                "per_minute": self.secondary_rate * 60,
+                "total_wait_seconds": round(self.total_wait, 2)
+            }
+        return budget
@@ -0,0 +1,170 @@
+import json
+import os
+import threading
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache for conditional GitHub GET requests
+
+    Stores the ETag / Last-Modified validators, Link header and decoded body
+    of each URL. Callers send the validators back as If-None-Match /
+    If-Modified-Since and serve the cached body on 304 Not Modified, which
+    GitHub does not count against the rate limit. Entries are kept in memory
+    and optionally persisted to a JSON file between runs.
+    """
+
+    def __init__(self, max_entries: int = 512, path: Optional[str] = None):
+        """
+        Initialize response cache
+
+        Args:
+            max_entries: Maximum number of cached URLs before LRU eviction
+            path: Optional JSON file to load from and save to
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.path = Path(path) if path else None
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._load()
+
+    @classmethod
+    def from_config(cls, config) -> Optional["ResponseCache"]:
+        """Create a cache from github.response_cache, or None if disabled"""
+        settings = config.settings.response_cache
+        if not settings.enabled:
+            return None
+        return cls(max_entries=settings.max_entries, path=settings.path)
+
+    def _load(self):
+        if not self.path or not self.path.exists():
+            return
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+            for key, entry in entries[-self.max_entries:]:
+                self._entries[key] = entry
+            logger.debug(f"Loaded {len(self._entries)} cached responses from {self.path}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable response cache {self.path}: {e}")
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached entry for a URL
+
+        The caller keeps the entry for the whole request: it supplies the
+        validators and, on 304, the body, even if the URL is evicted while
+        the request is in flight.
+
+        Args:
+            key: Cache key (full request URL)
+
+        Returns:
+            Cached entry, or None if not cached
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Get validator headers for a cached entry
+
+        Args:
+            entry: Entry returned by lookup()
+
+        Returns:
+            If-None-Match / If-Modified-Since headers, empty if not cached
+        """
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def hit(self, key: str, entry: Dict[str, Any]) -> Tuple[Any, Optional[str]]:
+        """
+        Serve a cached body after a 304 response
+
+        Args:
+            key: Cache key
+            entry: Entry whose validators were sent with the request
+
+        Returns:
+            Cached body and the Link header it was served with
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+        return entry["body"], entry.get("link")
+
+    def store(self, key: str, headers, body: Any):
+        """
+        Record a fresh response
+
+        Args:
+            key: Cache key
+            headers: Response headers
+            body: Decoded response body
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "link": headers.get("Link"),
+                "body": body
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._dirty = True
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "evictions": self.evictions
+            }
+
+    def save(self):
+        """Persist entries to disk atomically (no-op without a path)"""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(list(self._entries.items()))
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, self.path)
+            logger.debug(f"Saved response cache to {self.path}")
+        except OSError as e:
+            logger.warning(f"Failed to save response cache: {e}")
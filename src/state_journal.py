@@ -0,0 +1,279 @@
+import json
+import os
+import threading
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Stage transitions of one PR, in the order they happen
+STAGES = ("branch_created", "committed", "pushed", "pr_opened", "labelled", "merged", "notified")
+
+
+class JournalMismatchError(RuntimeError):
+    """The journal belongs to a batch with different parameters"""
+
+
+class StateJournal:
+    """
+    Crash-safe, append-only journal of batch-run progress
+
+    Every stage transition of every PR is appended as one JSON line and
+    fsync'd before the run moves on, so after a crash or Ctrl+C the journal
+    says exactly which branches were pushed, which PRs exist and which were
+    merged. Replaying it on restart lets the batch runner skip completed
+    stages instead of redoing them.
+
+    PRs are numbered 1..N within a batch, so the indices only mean
+    something for the batch that wrote them: begin() records the batch
+    parameters (mode, count, repository) in a ``{"batch": ...}`` header
+    and refuses a journal written for different ones. A PR is complete
+    once it reaches ``notified``. Compaction rewrites the file atomically
+    as a single ``{"last_completed_pr": N, "batch": ...}`` header followed
+    by the records of PRs that are still in flight, so the file stays
+    small however long the run. A torn last line (crash mid-append) is
+    ignored on replay.
+    """
+
+    def __init__(self, path: str = "state.jsonl", compact_every: int = 100, fsync: bool = True):
+        """
+        Initialize journal and replay any existing state
+
+        Args:
+            path: Journal file
+            compact_every: Compact after this many appended records (0 disables)
+            fsync: fsync every append (disable only for benchmarks)
+        """
+        self.path = Path(path)
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._prs: Dict[int, Dict[str, Any]] = {}
+        self._last_completed = 0
+        self._appended = 0
+        self._file = None
+        self._batch: Optional[Dict[str, Any]] = None
+        self._batch_pending = False
+        self._replay()
+
+    @classmethod
+    def from_config(cls, config) -> "StateJournal":
+        """Create a journal from run_settings.state_file / state_compact_every"""
+        run_settings = config.settings.run_settings
+        return cls(path=run_settings.state_file, compact_every=run_settings.state_compact_every)
+
+    def _replay(self):
+        if not self.path.exists():
+            return
+
+        data = self.path.read_bytes()
+        # Every record ends with a newline; anything after the last one is a torn append
+        # and is cut off, so the next append starts on a fresh line
+        complete, _, torn = data.rpartition(b"\n")
+        if torn:
+            logger.warning(f"Discarding torn last record in {self.path}")
+            with open(self.path, "r+b") as f:
+                f.truncate(len(data) - len(torn))
+
+        records = 0
+        for line in complete.decode("utf-8", errors="replace").splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning(f"Ignoring unreadable record in {self.path}")
+                continue
+            self._apply(record)
+            records += 1
+
+        self._advance()
+        logger.info(
+            f"📒 Replayed {records} journal records: last completed PR {self._last_completed}, "
+            f"{len(self._prs)} in flight"
+        )
+
+    def begin(self, batch: Dict[str, Any]):
+        """
+        Check that the journal belongs to a batch, claiming it if it is new
+
+        Args:
+            batch: JSON-serializable batch parameters (mode, count, repository, ...)
+
+        Raises:
+            JournalMismatchError: The journal holds progress of a different batch
+        """
+        with self._lock:
+            if self._batch is not None and self._batch != batch:
+                raise JournalMismatchError(
+                    f"{self.path} holds progress of another batch ({self._describe(self._batch)}), "
+                    f"not {self._describe(batch)}"
+                )
+            if self._batch is None and (self._prs or self._last_completed):
+                logger.warning(f"Journal {self.path} has no batch header, assuming it belongs to this batch")
+            if self._batch is None:
+                self._batch = dict(batch)
+                # Written with the first record, so a batch that never starts leaves no file behind
+                self._batch_pending = True
+
+    @staticmethod
+    def _describe(batch: Dict[str, Any]) -> str:
+        return ", ".join(f"{key}={value}" for key, value in sorted(batch.items()))
+
+    def _apply(self, record: Dict[str, Any]):
+        if "batch" in record:
+            self._batch = record["batch"]
+            if "last_completed_pr" not in record:
+                return
+        if "last_completed_pr" in record:
+            self._last_completed = max(self._last_completed, record["last_completed_pr"])
+            return
+        if record.get("reset"):
+            self._prs.pop(record["pr"], None)
+            return
+        state = self._prs.setdefault(record["pr"], {"stages": []})
+        if record["stage"] not in state["stages"]:
+            state["stages"].append(record["stage"])
+        state.update(record.get("data", {}))
+
+    def _advance(self):
+        """Fold PRs that completed in order into last_completed_pr"""
+        while "notified" in self._prs.get(self._last_completed + 1, {}).get("stages", ()):
+            self._last_completed += 1
+            del self._prs[self._last_completed]
+
+    def _append(self, record: Dict[str, Any]):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        if self._batch_pending:
+            self._file.write(json.dumps({"batch": self._batch}) + "\n")
+            self._batch_pending = False
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def record(self, index: int, stage: str, **data: Any):
+        """
+        Durably record that a PR reached a stage
+
+        Args:
+            index: PR index within the batch (1-based)
+            stage: One of STAGES
+            **data: JSON-serializable details to remember (branch, PR data, ...)
+        """
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage: {stage}")
+
+        record = {"pr": index, "stage": stage, "time": datetime.now().isoformat()}
+        if data:
+            record["data"] = data
+
+        with self._lock:
+            self._append(record)
+            self._apply(record)
+            self._advance()
+            self._appended += 1
+            if self.compact_every and self._appended >= self.compact_every:
+                self._compact()
+
+    def forget(self, pr: int):
+        """
+        Durably discard a PR's recorded stages so it is redone from scratch
+
+        Args:
+            pr: PR index within the batch
+        """
+        record = {"pr": pr, "reset": True, "time": datetime.now().isoformat()}
+        with self._lock:
+            self._append(record)
+            self._apply(record)
+            self._appended += 1
+
+    def state(self, pr: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the recorded state of a PR
+
+        Args:
+            pr: PR index within the batch
+
+        Returns:
+            Dict with 'stages' and any recorded data, {"stages": list(STAGES)}
+            for PRs folded into last_completed_pr, or None if never started
+        """
+        with self._lock:
+            if pr <= self._last_completed:
+                return {"stages": list(STAGES)}
+            state = self._prs.get(pr)
+            return {**state, "stages": list(state["stages"])} if state else None
+
+    def is_complete(self, pr: int) -> bool:
+        """Whether a PR reached its final stage"""
+        state = self.state(pr)
+        return bool(state) and "notified" in state["stages"]
+
+    @property
+    def last_completed_pr(self) -> int:
+        """Highest PR index up to which every PR is complete"""
+        with self._lock:
+            return self._last_completed
+
+    def _compact(self):
+        header = {"last_completed_pr": self._last_completed}
+        if self._batch is not None:
+            header["batch"] = self._batch
+        records = [header]
+        for pr in sorted(self._prs):
+            state = self._prs[pr]
+            data = {key: value for key, value in state.items() if key != "stages"}
+            for stage in state["stages"]:
+                records.append({"pr": pr, "stage": stage, "data": data})
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        if self.fsync and hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(self.path.parent, os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+        self._appended = 0
+        self._batch_pending = False
+        logger.debug(f"Compacted journal to {len(records)} records")
+
+    def compact(self):
+        """Rewrite the journal as its minimal equivalent"""
+        with self._lock:
+            self._compact()
+
+    def reset(self):
+        """Forget all progress and delete the journal file"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._prs.clear()
+            self._last_completed = 0
+            self._appended = 0
+            self._batch = None
+            self._batch_pending = False
+            if self.path.exists():
+                self.path.unlink()
+        logger.info(f"🧹 Cleared run state in {self.path}")
+
+    def close(self):
+        """Compact and close the journal"""
+        with self._lock:
+            if self._file is not None or self._appended:
+                self._compact()
@@ -0,0 +1,217 @@
+import functools
+import json
+import os
+import re
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.utils import percentile
+
+logger = logging.getLogger(__name__)
+
+_tracer: Optional["Tracer"] = None
+
+
+class _NullSpan:
+    """Shared span returned while tracing is disabled; does nothing"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args: Any):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """One timed operation; use as a context manager"""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is None:
+            self.args.setdefault("outcome", "ok")
+        else:
+            self.args["outcome"] = "error"
+            self.args["error"] = exc_type.__name__
+        self.tracer._finish(self, end)
+        return False
+
+    def set(self, **args: Any):
+        """Attach extra details (status code, counts, ...) to the span"""
+        self.args.update(args)
+
+
+class Tracer:
+    """
+    Collects spans from git commands, GitHub calls, webhooks and run stages
+
+    Spans are plain tuples appended to a list, so recording is cheap and
+    thread-safe. Export as Chrome trace JSON (open in chrome://tracing or
+    Perfetto) or as a per-operation latency summary.
+    """
+
+    def __init__(self):
+        self._events: List[tuple] = []
+        self._origin = time.perf_counter_ns()
+        self._threads: Dict[int, str] = {}
+
+    def _finish(self, span: Span, end: int):
+        thread = threading.current_thread()
+        self._threads.setdefault(thread.ident, thread.name)
+        self._events.append((span.name, span.category, span.start, end - span.start, thread.ident, span.args))
+
+    def __len__(self):
+        return len(self._events)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Render spans in the Chrome trace event format
+
+        Returns:
+            Dict with traceEvents ("X" complete events plus thread names)
+        """
+        pid = os.getpid()
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self._threads.items()
+        ]
+        for name, category, start, duration, tid, args in list(self._events):
+            events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": args
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str):
+        """Write the Chrome trace JSON to a file"""
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        logger.info(f"🧭 Wrote {len(self)} trace spans to {output}")
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Latency per operation
+
+        Returns:
+            Mapping of "category name" to count, errors, total and p50/p95/p99
+            seconds, slowest total first
+        """
+        durations: Dict[str, List[float]] = {}
+        errors: Dict[str, int] = {}
+        for name, category, _, duration, _, args in list(self._events):
+            key = f"{category} {name}"
+            durations.setdefault(key, []).append(duration / 1e9)
+            if args.get("outcome") == "error":
+                errors[key] = errors.get(key, 0) + 1
+
+        summary = {
+            key: {
+                "count": len(values),
+                "errors": errors.get(key, 0),
+                "total": round(sum(values), 4),
+                "p50": round(percentile(values, 0.50), 4),
+                "p95": round(percentile(values, 0.95), 4),
+                "p99": round(percentile(values, 0.99), 4)
+            }
+            for key, values in durations.items()
+        }
+        return dict(sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True))
+
+    def log_summary(self, log: logging.Logger):
+        """Log the summary as a table"""
+        log.info(f"🧭 Trace summary ({len(self)} spans)")
+        for key, values in self.summary().items():
+            log.info(
+                f"   {key:<32} n={values['count']:<5} err={values['errors']:<3} total={values['total']:.3f}s "
+                f"p50={values['p50']:.4f}s p95={values['p95']:.4f}s p99={values['p99']:.4f}s"
+            )
+
+
+def enable() -> Tracer:
+    """Start recording spans (keeps the current tracer if already enabled)"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def disable() -> Optional[Tracer]:
+    """Stop recording spans and return the tracer that was active"""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """The active tracer, or None while tracing is disabled"""
+    return _tracer
+
+
+def span(name: str, category: str = "app", **args: Any):
+    """
+    Time a block of code
+
+    Args:
+        name: Operation name (e.g. "fetch", "POST pulls")
+        category: Span category (git, github, webhook, stage, ...)
+        **args: Details recorded with the span
+
+    Returns:
+        Context manager; a shared no-op object while tracing is disabled
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return Span(tracer, name, category, args)
+
+
+def traced(name: str, category: str = "stage"):
+    """Decorator that records every call of a function as a span"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with Span(tracer, name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+_NUMBER = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_name(method: str, path: str) -> str:
+    """Name an API call by its path shape, with numbers replaced by {n} (e.g. PUT pulls/{n}/merge)"""
+    return f"{method} {_NUMBER.sub('/{n}', path.split('?', 1)[0])}"
@@ -1,20 +1,63 @@
+import atexit
 import json
 import logging
 import logging.config
+import math
+import queue
 from pathlib import Path
 from datetime import datetime
 import random
 import string
-from typing import Optional
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
 
 
-def setup_logging(config_path="config/logging_config.json"):
-    """Setup logging configuration"""
+# Background thread that runs the real handlers, see setup_logging()
+_listener: Optional[QueueListener] = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format records as one JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def setup_logging(config_path="config/logging_config.json", json_path: Optional[str] = None):
+    """
+    Setup logging configuration
+
+    The configured handlers run on a QueueListener thread; loggers only put
+    records on a queue, so file writes never block git or API work. Log
+    directories are created as needed. Calling this again replaces the
+    previous setup.
+
+    Args:
+        config_path: dictConfig JSON file, basic console logging if missing
+        json_path: Also write every record that passes the root level to this file as JSON lines
+    """
+    stop_logging()
+
     config_file = Path(config_path)
     if config_file.exists():
         try:
             with open(config_file, "r", encoding="utf-8") as f:
                 config = json.load(f)
+            for handler in config.get("handlers", {}).values():
+                if handler.get("filename"):
+                    Path(handler["filename"]).parent.mkdir(parents=True, exist_ok=True)
             logging.config.dictConfig(config)
             logging.getLogger(__name__).debug("Logging configured from file")
         except Exception as e:
@@ -23,6 +66,16 @@ def setup_logging(config_path="config/logging_config.json"):
     else:
         _setup_basic_logging()
 
+    root = logging.getLogger()
+    if json_path:
+        Path(json_path).parent.mkdir(parents=True, exist_ok=True)
+        json_handler = logging.FileHandler(json_path, encoding="utf-8")
+        json_handler.setLevel(logging.DEBUG)
+        json_handler.setFormatter(JsonLinesFormatter())
+        root.addHandler(json_handler)
+
+    _start_listener(root)
+
 
 def _setup_basic_logging():
     """Setup basic logging as fallback"""
@@ -34,6 +87,39 @@ def _setup_basic_logging():
     logging.getLogger(__name__).info("Using basic logging configuration")
 
 
+def _start_listener(root: logging.Logger):
+    """Move the root handlers onto a QueueListener thread"""
+    global _listener
+    handlers = list(root.handlers)
+    if not handlers:
+        return
+    for handler in handlers:
+        root.removeHandler(handler)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging():
+    """Flush queued records and hand the handlers back to the root logger"""
+    global _listener
+    if _listener is None:
+        return
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        root.addHandler(handler)
+    _listener = None
+
+
+atexit.register(stop_logging)
+
+
 def generate_branch_name(prefix="auto-pr", max_length=50):
     """
     Generate a unique branch name
@@ -93,4 +179,80 @@ This PR was automatically created by Auto PR Creator.
 
 def format_timestamp(format_str="%Y-%m-%d %H:%M:%S") -> str:
     """Get formatted current timestamp"""
-    return datetime.now().strftime(format_str)
\ No newline at end of file
+    return datetime.now().strftime(format_str)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of numbers (0.0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class PipelineStats:
+    """Collects per-stage latency and throughput for multi-PR runs"""
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stages: Dict[str, List[float]] = {}
+        self.started = clock()
+        self.completed = 0
+        self.failed = 0
+
+    def record(self, stage: str, seconds: float):
+        """Record one duration for a stage"""
+        with self._lock:
+            self._stages.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def time(self, stage: str):
+        """Time the enclosed block as one occurrence of a stage"""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record(stage, self._clock() - start)
+
+    def summary(self) -> Dict:
+        """
+        Summarize the run
+
+        Returns:
+            Dict with PR counts, elapsed time, PRs per minute and
+            count/mean/p50/p95/max seconds per stage
+        """
+        elapsed = self._clock() - self.started
+        with self._lock:
+            stages = {
+                stage: {
+                    "count": len(values),
+                    "mean": round(sum(values) / len(values), 3),
+                    "p50": round(percentile(values, 0.50), 3),
+                    "p95": round(percentile(values, 0.95), 3),
+                    "max": round(max(values), 3)
+                }
+                for stage, values in self._stages.items()
+            }
+        return {
+            "completed": self.completed,
+            "failed": self.failed,
+            "elapsed_seconds": round(elapsed, 3),
+            "prs_per_minute": round(self.completed / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            "stages": stages
+        }
+
+    def log_summary(self, log: logging.Logger):
+        """Log the summary in a readable form"""
+        summary = self.summary()
+        log.info(
+            f"📊 {summary['completed']} PRs ({summary['failed']} failed) in {summary['elapsed_seconds']:.1f}s "
+            f"- {summary['prs_per_minute']:.2f} PRs/min"
+        )
+        for stage, values in summary["stages"].items():
+            log.info(
+                f"   {stage:<10} n={values['count']:<4} mean={values['mean']:.3f}s "
+                f"p50={values['p50']:.3f}s p95={values['p95']:.3f}s max={values['max']:.3f}s"
+            )
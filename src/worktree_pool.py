@@ -0,0 +1,178 @@
+import os
+import queue
+import shutil
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.git_operations import GitOperations, RefFreshnessCache
+from src.git_process import GitProcessPool
+
+logger = logging.getLogger(__name__)
+
+WORKTREE_DIR = "auto-pr-worktrees"
+
+
+class WorktreePool:
+    """
+    Pool of linked `git worktree` checkouts for preparing branches in parallel
+
+    Each worktree has its own index and HEAD, so branch creation, file
+    modification, commit and push run concurrently instead of queueing on the
+    single working copy's index lock. Worktrees live under the repository's
+    common git dir and start detached at ``origin/<default_branch>``.
+    """
+
+    def __init__(self, config, repo_path=".", size: Optional[int] = None,
+                 freshness_cache: Optional[RefFreshnessCache] = None):
+        """
+        Initialize worktree pool
+
+        Args:
+            config: ConfigManager instance
+            repo_path: Path to the main git repository
+            size: Number of worktrees, defaults to run_settings.worktrees
+            freshness_cache: Remote ref cache shared with the main GitOperations
+        """
+        self.config = config
+        self.repo_path = Path(repo_path).resolve()
+        self.git = GitOperations(config, self.repo_path, freshness_cache=freshness_cache)
+        self.git_pool = self.git.git_pool
+
+        if size is None:
+            size = config.settings.run_settings.worktrees or min(4, os.cpu_count() or 1)
+        if size < 1:
+            raise ValueError("Worktree pool size must be at least 1")
+        self.size = size
+
+        self.default_branch = config.settings.repository.default_branch
+        common_dir = self.git_pool.run(["rev-parse", "--path-format=absolute", "--git-common-dir"])
+        self.root = Path(common_dir).resolve() / WORKTREE_DIR
+        self._available = queue.Queue()
+        self._worktrees: List[Path] = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def start(self):
+        """Fetch the default branch once and create or reuse the worktrees"""
+        if self._worktrees:
+            return
+
+        self.cleanup_stale()
+        self.git.refresh_default_branch()
+
+        start_point = f"origin/{self.default_branch}"
+        self.root.mkdir(parents=True, exist_ok=True)
+        registered = self._registered_worktrees()
+
+        for i in range(self.size):
+            path = self.root / f"wt-{i}"
+            if path in registered and path.exists():
+                self._reset(GitProcessPool(path), start_point)
+            else:
+                self.git_pool.run(["worktree", "add", "--force", "--detach", str(path), start_point])
+            self._worktrees.append(path)
+            self._available.put(path)
+
+        logger.info(f"🌳 Worktree pool ready with {self.size} checkout(s) of {start_point}")
+
+    def _registered_worktrees(self) -> List[Path]:
+        output = self.git_pool.run(["worktree", "list", "--porcelain"])
+        return [Path(line[len("worktree "):]).resolve()
+                for line in output.splitlines() if line.startswith("worktree ")]
+
+    def _reset(self, pool: GitProcessPool, start_point: str):
+        """Put a worktree back to a clean, detached checkout"""
+        pool.run(["checkout", "--force", "--detach", start_point])
+        pool.run(["clean", "-fdq"])
+
+    def cleanup_stale(self):
+        """Drop registrations of deleted worktrees and remove leftover checkouts beyond the pool size"""
+        self.git_pool.run(["worktree", "prune"])
+        if not self.root.exists():
+            return
+
+        wanted = {self.root / f"wt-{i}" for i in range(self.size)}
+        registered = set(self._registered_worktrees())
+        for path in self.root.iterdir():
+            if path in wanted:
+                continue
+            if path.resolve() in registered:
+                self.git_pool.run(["worktree", "remove", "--force", str(path)], check=False)
+            if path.exists():
+                shutil.rmtree(path, ignore_errors=True)
+            logger.debug(f"Removed stale worktree: {path}")
+
+    def _prepare_one(self, branch: str, files: List[str], coauthor: Dict, push: bool) -> Dict:
+        """Prepare a single branch in whichever worktree is free"""
+        path = self._available.get()
+        git = None
+        try:
+            git = GitOperations(self.config, repo_path=path, freshness_cache=self.git.freshness_cache)
+            git.create_branch(branch)
+            modified = git.modify_files(files)
+            git.commit(modified, coauthor)
+            if push:
+                git.push(branch)
+            # Detach so the branch can be checked out elsewhere later
+            git.detach()
+            return {"branch": branch, "files": modified, "error": None}
+        except Exception as e:
+            logger.error(f"❌ Failed to prepare branch {branch} in {path.name}: {e}")
+            try:
+                self._reset(GitProcessPool(path), f"origin/{self.default_branch}")
+            except RuntimeError as reset_error:
+                logger.warning(f"Failed to reset worktree {path.name}: {reset_error}")
+            return {"branch": branch, "files": [], "error": str(e)}
+        finally:
+            if git is not None:
+                git.close()
+            self._available.put(path)
+
+    def prepare_branches(self, branches: List[str], files: List[str], coauthor: Dict,
+                         push: bool = True) -> List[Dict]:
+        """
+        Create, modify, commit and optionally push branches in parallel
+
+        Every branch starts from ``origin/<default_branch>``; at most ``size``
+        branches are prepared at a time.
+
+        Args:
+            branches: Names of the branches to create
+            files: Files to modify on every branch
+            coauthor: Co-author configuration with 'name' and 'email'
+            push: Whether to push each branch after committing
+
+        Returns:
+            One dict per branch with 'branch', 'files' and 'error' (None on success)
+        """
+        self.start()
+        with ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="worktree") as executor:
+            futures = [executor.submit(self._prepare_one, branch, files, coauthor, push) for branch in branches]
+            results = [future.result() for future in futures]
+
+        prepared = sum(1 for result in results if result["error"] is None)
+        logger.info(f"🌳 Prepared {prepared}/{len(branches)} branch(es) across {self.size} worktree(s)")
+        return results
+
+    def close(self, remove: bool = True):
+        """
+        Release the pool
+
+        Args:
+            remove: Whether to delete the worktrees (kept for reuse otherwise)
+        """
+        if remove:
+            for path in self._worktrees:
+                self.git_pool.run(["worktree", "remove", "--force", str(path)], check=False)
+            self.git_pool.run(["worktree", "prune"], check=False)
+        self._worktrees = []
+        self._available = queue.Queue()
+        self.git.close()
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from benchmarks.fixtures import make_workspace
+from src.config_manager import ConfigManager
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Bare origin plus a configured clone (see benchmarks.fixtures)"""
+    return make_workspace(tmp_path / "workspace", files=2, collaborators=2)
+
+
+@pytest.fixture
+def config(workspace, monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    return ConfigManager(str(workspace.config_path))
+
+
+@pytest.fixture
+def git(config, workspace):
+    from src.git_operations import GitOperations
+
+    operations = GitOperations(config, workspace.work)
+    yield operations
+    operations.close()
+
+
+@pytest.fixture
+def fake_github(workspace):
+    from benchmarks.fake_github import FakeGitHub
+
+    with FakeGitHub(str(workspace.origin)) as github:
+        yield github
+
+
+@pytest.fixture
+def github(workspace, fake_github, monkeypatch):
+    """GitHubClient talking to the fake API, caches under the workspace clone"""
+    from src.github_client import GitHubClient
+
+    monkeypatch.chdir(workspace.work)
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("GITHUB_API_URL", fake_github.url)
+    client = GitHubClient(ConfigManager(str(workspace.config_path)))
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def webhooks():
+    from benchmarks.fake_github import FakeWebhooks
+
+    with FakeWebhooks() as hooks:
+        yield hooks
+
+
+@pytest.fixture
+def notifier(workspace, webhooks, monkeypatch, tmp_path):
+    """NotificationManager posting to the fake Discord webhook, outbox under tmp_path"""
+    from src.notification_manager import NotificationManager
+
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("DISCORD_WEBHOOK", webhooks.discord_url)
+    monkeypatch.delenv("SLACK_WEBHOOK", raising=False)
+    monkeypatch.chdir(tmp_path)
+    manager = NotificationManager(ConfigManager(str(workspace.config_path)))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def creator(workspace, fake_github, webhooks, monkeypatch):
+    """AutoPRCreator working in the workspace clone against the fake API and webhooks"""
+    from src import utils
+    from src.main import AutoPRCreator
+
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("GITHUB_API_URL", fake_github.url)
+    monkeypatch.setenv("DISCORD_WEBHOOK", webhooks.discord_url)
+    monkeypatch.delenv("SLACK_WEBHOOK", raising=False)
+    monkeypatch.chdir(workspace.work)
+    config = json.loads(workspace.config_path.read_text(encoding="utf-8"))
+    config["notifications"]["dispatch"]["coalesce_seconds"] = 0.05
+    workspace.config_path.write_text(json.dumps(config), encoding="utf-8")
+
+    instance = AutoPRCreator(config_path=str(workspace.config_path))
+    instance.merge_waiter.initial_interval = 0.01
+    yield instance
+    instance.close()
+    utils.stop_logging()
@@ -0,0 +1,84 @@
+import asyncio
+import time
+
+import pytest
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def _run(creator, branch, **kwargs):
+    stages = []
+    kwargs.setdefault("on_stage", lambda stage, **data: stages.append(stage))
+    pr = asyncio.run(creator.create_and_merge_pr_async(branch, **kwargs))
+    return pr, stages
+
+
+def test_labels_then_merges_and_notifies(creator, fake_github, webhooks):
+    branch, _ = creator.run_single_user_mode()
+
+    pr, stages = _run(creator, branch)
+
+    pull = fake_github.pulls[pr["number"]]
+    assert pull["merged"]
+    assert [label["name"] for label in pull["labels"]] == list(creator.config.settings.pull_request.labels)
+    assert stages[0] == "pr_opened"
+    assert stages.index("labelled") < stages.index("merged") < stages.index("notified")
+    _wait_for(lambda: webhooks.requests["POST /discord"] == 1)
+
+
+def test_failed_labelling_prevents_the_merge(creator, fake_github, monkeypatch):
+    branch, _ = creator.run_single_user_mode()
+
+    def fail(number, labels):
+        raise RuntimeError("labels rejected")
+
+    monkeypatch.setattr(creator.github, "add_labels", fail)
+    with pytest.raises(RuntimeError, match="labels rejected"):
+        _run(creator, branch)
+
+    assert not fake_github.pulls[1]["merged"]
+    assert fake_github.requests["PUT /repos/bench/fixture/pulls/{n}/merge"] == 0
+
+
+def test_resume_skips_completed_stages(creator, fake_github):
+    branch, _ = creator.run_single_user_mode()
+    opened = creator.github.create_pr(branch, "title", "body")
+    fake_github.requests.clear()
+
+    resume = {"stages": ["branch_created", "committed", "pushed", "pr_opened"], "pr": opened}
+    pr, stages = _run(creator, branch, resume=resume)
+
+    assert pr["number"] == opened["number"]
+    assert fake_github.pulls[opened["number"]]["merged"]
+    assert fake_github.requests["POST /repos/bench/fixture/pulls"] == 0
+    assert set(stages) == {"labelled", "merged", "notified"}
+
+
+def test_without_auto_merge_labels_and_notification_overlap(creator, fake_github, webhooks, monkeypatch):
+    monkeypatch.setattr(creator, "_auto_merge", lambda: False)
+    branch, _ = creator.run_single_user_mode()
+
+    pr, stages = _run(creator, branch)
+
+    assert not fake_github.pulls[pr["number"]]["merged"]
+    assert sorted(stages) == ["labelled", "notified", "pr_opened"]
+    _wait_for(lambda: webhooks.requests["POST /discord"] == 1)
+
+
+def test_graphql_setting_uses_the_graphql_flow(creator, monkeypatch):
+    calls = []
+    settings = creator.config.settings
+    values = {name: getattr(settings, name) for name in settings.__slots__}
+    monkeypatch.setattr(creator.config, "settings", type(settings)(**{**values, "use_graphql": True}))
+    monkeypatch.setattr(creator, "_create_and_merge_pr_graphql",
+                        lambda branch, *args: calls.append(branch) or {"number": 7})
+
+    pr, _ = _run(creator, "some-branch")
+
+    assert pr == {"number": 7}
+    assert calls == ["some-branch"]
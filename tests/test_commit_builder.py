@@ -0,0 +1,98 @@
+import subprocess
+
+import pytest
+
+from src.commit_builder import CommitBuilder
+
+ALICE = {"name": "Alice", "email": "alice@example.com"}
+BOB = {"name": "Bob", "email": "bob@example.com"}
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True).stdout.decode("utf-8")
+
+
+def _tip(repo, ref="feature"):
+    return _git(repo, "rev-parse", ref).strip()
+
+
+@pytest.fixture
+def repo(workspace):
+    _git(workspace.work, "branch", "feature")
+    return workspace.work
+
+
+def test_commits_land_on_a_branch_that_is_not_checked_out(repo):
+    start = _tip(repo)
+    with CommitBuilder(repo, "feature") as builder:
+        builder.commit(ALICE, "first\n", {"a.txt": "a\n"})
+        builder.commit(BOB, "second\n", {"b.txt": b"b\n", "README.md": None})
+    shas = _git(repo, "rev-list", f"{start}..feature").split()
+
+    assert len(shas) == 2
+    assert _git(repo, "log", "--format=%an <%ae>|%cn|%s", "feature").splitlines()[:2] == [
+        "Bob <bob@example.com>|Bob|second", "Alice <alice@example.com>|Alice|first"
+    ]
+    assert _git(repo, "ls-tree", "--name-only", "feature").split() == ["a.txt", "b.txt", "config", "docs", "templates"]
+    # The checked out branch and its working tree are untouched
+    assert not (repo / "a.txt").exists()
+    assert _git(repo, "status", "--porcelain") == ""
+
+
+def test_checked_out_branch_gets_index_and_working_tree_updated(repo):
+    _git(repo, "checkout", "-q", "feature")
+    with CommitBuilder(repo, "feature") as builder:
+        builder.commit(ALICE, "edit\n", {"README.md": "# Edited\n", "docs/file-0.md": None})
+
+    assert (repo / "README.md").read_text(encoding="utf-8") == "# Edited\n"
+    assert not (repo / "docs" / "file-0.md").exists()
+    assert _git(repo, "status", "--porcelain") == ""
+
+
+def test_read_file_returns_committed_blob_and_pending_content(repo):
+    _git(repo, "checkout", "-q", "feature")
+    (repo / "crlf.txt").write_bytes(b"one\r\ntwo\r\n")
+    _git(repo, "-c", "core.autocrlf=false", "add", "crlf.txt")
+    _git(repo, "commit", "-q", "-m", "crlf")
+    (repo / "README.md").write_text("# Uncommitted\n", encoding="utf-8")
+
+    with CommitBuilder(repo, "feature") as builder:
+        assert builder.read_file("crlf.txt") == "one\r\ntwo\r\n"
+        assert builder.read_file("README.md") == "# Benchmark fixture\n"
+        assert builder.read_file("missing.txt") is None
+        builder.commit(ALICE, "add\n", {"new.txt": "pending\n"})
+        assert builder.read_file("new.txt") == "pending\n"
+
+
+def test_failed_working_tree_update_resets_the_branch(repo):
+    _git(repo, "checkout", "-q", "feature")
+    start = _tip(repo)
+    (repo / "README.md").write_text("# Local edit\n", encoding="utf-8")
+
+    builder = CommitBuilder(repo, "feature")
+    builder.commit(ALICE, "clobber\n", {"README.md": "# From builder\n"})
+    with pytest.raises(RuntimeError, match="reset to"):
+        builder.finish()
+
+    assert _tip(repo) == start
+    assert (repo / "README.md").read_text(encoding="utf-8") == "# Local edit\n"
+
+
+def test_rejected_commit_leaves_the_stream_usable(repo):
+    start = _tip(repo)
+    with CommitBuilder(repo, "feature") as builder:
+        with pytest.raises(ValueError):
+            builder.commit({"name": "Bad <name>", "email": "bad@example.com"}, "bad\n", {"bad.txt": "x"})
+        assert builder.read_file("bad.txt") is None
+        builder.commit(ALICE, "good\n", {"good.txt": "ok\n"})
+
+    assert _git(repo, "log", "--format=%s", f"{start}..feature").split() == ["good"]
+
+
+def test_exception_in_block_leaves_the_branch_alone(repo):
+    start = _tip(repo)
+    with pytest.raises(KeyError):
+        with CommitBuilder(repo, "feature") as builder:
+            builder.commit(ALICE, "never\n", {"a.txt": "a\n"})
+            raise KeyError("boom")
+    assert _tip(repo) == start
@@ -0,0 +1,149 @@
+import copy
+import json
+import os
+
+import pytest
+
+from src.config_schema import ConfigError, parse_config
+
+BASE = {
+    "github": {"repository": {"owner": "octo", "name": "repo"}},
+    "files": {"to_modify": ["README.md"]},
+    "collaborators": [{"name": "Alice", "email": "alice@example.com"}]
+}
+
+
+def _with(path, value):
+    config = copy.deepcopy(BASE)
+    *parents, name = path
+    section = config
+    for part in parents:
+        section = section.setdefault(part, {})
+    section[name] = value
+    return config
+
+
+def test_defaults_fill_a_minimal_config():
+    settings = parse_config(BASE, {"GITHUB_API_URL": "https://ghe.example.com/api/v3/"})
+
+    assert settings.repository.slug == "octo/repo"
+    assert settings.repository.default_branch == "main"
+    assert settings.merge.method == "squash"
+    assert settings.run_settings.pr_count == 1
+    assert settings.collaborators[0].email == "alice@example.com"
+    assert settings.api_url == "https://ghe.example.com/api/v3"
+    assert settings.github_token is None
+
+
+@pytest.mark.parametrize("path, value, key", [
+    (("run_settings", "pr_count"), 0, "run_settings.pr_count"),
+    (("run_settings", "delay_seconds"), "5", "run_settings.delay_seconds"),
+    (("run_settings", "auto_merge"), "yes", "run_settings.auto_merge"),
+    (("github", "merge", "method"), "fast-forward", "github.merge.method"),
+    (("github", "merge", "retry_count"), True, "github.merge.retry_count"),
+    (("github", "rate_limit", "reserve_fraction"), 1, "github.rate_limit.reserve_fraction"),
+    (("github", "repository", "name"), "", "github.repository.name"),
+    (("github", "merge"), [], "github.merge"),
+    (("notifications", "dispatch", "queue_size"), -1, "notifications.dispatch.queue_size"),
+    (("collaborators",), {"name": "Alice"}, "collaborators"),
+    (("collaborators",), [{"name": "Alice", "email": "alice@example.com"}, {"name": "Bob", "email": "bob"}],
+     "collaborators[1].email"),
+    (("collaborators",), [{"name": "Alice", "email": "a@example.com"}, {"name": "Alice", "email": "b@example.com"}],
+     "collaborators[1].name"),
+    (("coauthor",), {"name": " ", "email": "x@example.com"}, "coauthor.name"),
+    (("files", "to_modify"), ["data.json"], "files.to_modify"),
+    (("pull_request", "labels"), ["ok", 1], "pull_request.labels"),
+])
+def test_errors_name_the_offending_key(path, value, key):
+    with pytest.raises(ConfigError) as raised:
+        parse_config(_with(path, value), {})
+    assert raised.value.key == key
+    assert str(raised.value).startswith(f"config.{key}: ")
+
+
+def test_missing_section_is_reported():
+    config = copy.deepcopy(BASE)
+    del config["files"]
+    with pytest.raises(ConfigError, match="config.files: missing required section"):
+        parse_config(config, {})
+
+
+def test_unknown_keys_only_warn(caplog):
+    settings = parse_config(_with(("run_settings", "pr_cuont"), 3), {})
+    assert settings.run_settings.pr_count == 1
+    assert "Unknown config key run_settings.pr_cuont is ignored" in caplog.text
+
+
+def test_snapshot_and_getter_views_are_read_only(config):
+    with pytest.raises(AttributeError):
+        config.settings.merge.method = "merge"
+    with pytest.raises(TypeError):
+        config.get_merge_config()["method"] = "merge"
+    assert config.get_merge_config() is config.get_merge_config()
+    assert config.get_merge_config()["method"] == config.settings.merge.method
+    assert config.get_notification_config()["dispatch"]["max_batch"] == config.settings.notifications.dispatch.max_batch
+
+
+def _rewrite(path, update=None, text=None):
+    """Rewrite the config file with a distinct mtime"""
+    if text is None:
+        config = json.loads(path.read_text(encoding="utf-8"))
+        update(config)
+        text = json.dumps(config)
+    stat = path.stat()
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_valid_edit_is_published_to_subscribers(config, workspace):
+    seen = []
+    config.subscribe(lambda manager: seen.append(manager.settings.merge.retry_count))
+    config.subscribe(lambda manager: 1 / 0)
+
+    _rewrite(workspace.config_path, lambda data: data["github"].setdefault("merge", {}).update(retry_count=7))
+    assert config.reload_if_changed(force=True)
+    assert config.version == 2
+    assert seen == [7]
+    assert config.get_merge_config()["retry_count"] == 7
+    # Nothing changed on disk since
+    assert not config.reload_if_changed(force=True)
+
+
+@pytest.mark.parametrize("text, update", [
+    ("{ not json", None),
+    (None, lambda data: data["github"].setdefault("merge", {}).update(method="fast-forward")),
+    (None, lambda data: data["github"]["repository"].update(name="other")),
+], ids=["json", "schema", "repository"])
+def test_invalid_edit_keeps_the_last_good_config(config, workspace, caplog, text, update):
+    before = config.settings
+    seen = []
+    config.subscribe(seen.append)
+
+    _rewrite(workspace.config_path, update, text)
+    assert not config.reload_if_changed(force=True)
+    assert config.settings is before
+    assert config.version == 1
+    assert seen == []
+    assert "Rejected config change" in caplog.text
+
+
+def test_polling_is_rate_limited_and_can_be_switched_off(config, workspace):
+    _rewrite(workspace.config_path, lambda data: data["run_settings"].update(config_poll_seconds=3600))
+    assert config.reload_if_changed()
+
+    _rewrite(workspace.config_path, lambda data: data["run_settings"].update(hot_reload=False))
+    # Within the poll interval
+    assert not config.reload_if_changed()
+    assert config.reload_if_changed(force=True)
+    assert not config.settings.run_settings.hot_reload
+
+    _rewrite(workspace.config_path, lambda data: data["run_settings"].update(delay_seconds=9))
+    assert not config.reload_if_changed()
+
+
+def test_reload_reaches_the_creator_components(creator, workspace):
+    waiter = creator.merge_waiter
+    _rewrite(workspace.config_path, lambda data: data["github"].setdefault("merge", {}).update(retry_count=9))
+    assert creator.config.reload_if_changed(force=True)
+    assert waiter.retry_count == 9
+    assert creator.merge_waiter is waiter
@@ -0,0 +1,76 @@
+import pytest
+
+from src.content_updater import UPDATE_LOG_END, UPDATE_LOG_START, ContentUpdater
+
+
+def _entries(content):
+    block = content[content.index(UPDATE_LOG_START):content.index(UPDATE_LOG_END)]
+    return [line[2:] for line in block.split("\n") if line.startswith("- ")]
+
+
+def test_log_keeps_last_entries():
+    updater = ContentUpdater(max_entries=3)
+    content = "# Title\n"
+    for i in range(5):
+        content = updater.render(content, f"entry {i}")
+    assert content.startswith("# Title\n\n")
+    assert _entries(content) == ["entry 2", "entry 3", "entry 4"]
+
+
+def test_legacy_lines_are_folded_into_the_log():
+    updater = ContentUpdater(max_entries=10)
+    content = "# Title\n\n# Auto-updated on 2024-01-01 10:00:00\n\n- 🚀 Contribution from @alice on 2024-01-02\n"
+    content = updater.render(content, "entry")
+    assert "\n# Auto-updated on" not in content
+    assert _entries(content) == [
+        "Auto-updated on 2024-01-01 10:00:00", "🚀 Contribution from @alice on 2024-01-02", "entry"
+    ]
+
+
+def test_entries_for_different_branches_change_a_full_log():
+    updater = ContentUpdater(max_entries=2)
+    content = None
+    for _ in range(2):
+        content = updater.render(content, "Auto-updated on 2024-01-01 10:00:00 in `auto-pr-1`")
+    assert updater.render(content, "Auto-updated on 2024-01-01 10:00:00 in `auto-pr-2`") != content
+
+
+def test_block_uses_the_comment_syntax_of_the_file():
+    updater = ContentUpdater(max_entries=2)
+    source = updater.render("import os\n", "Auto-updated on 2024-01-01 10:00:00 in `b1`", "tool.py")
+    source = updater.render(source, "Auto-updated on 2024-01-01 10:00:01 in `b2`", "tool.py")
+    compile(source, "tool.py", "exec")
+    assert source == (
+        "import os\n\n"
+        "# auto-pr:update-log:start\n"
+        "# - Auto-updated on 2024-01-01 10:00:00 in `b1`\n"
+        "# - Auto-updated on 2024-01-01 10:00:01 in `b2`\n"
+        "# auto-pr:update-log:end\n"
+    )
+    assert "// - entry" in updater.render("", "entry", "src/app.ts")
+    assert "/* - entry */" in updater.render("", "entry", "style.css")
+
+
+def test_markdown_block_in_other_files_is_converted():
+    updater = ContentUpdater(max_entries=10)
+    content = "key: value\n\n" + "\n".join([UPDATE_LOG_START, "- old", UPDATE_LOG_END]) + "\n"
+    content = updater.render(content, "new", "config.yml")
+    assert UPDATE_LOG_START not in content
+    assert content == "key: value\n\n# auto-pr:update-log:start\n# - old\n# - new\n# auto-pr:update-log:end\n"
+
+
+def test_files_without_comments_are_refused():
+    with pytest.raises(ValueError, match="no comment syntax"):
+        ContentUpdater().render("{}", "entry", "data.json")
+
+
+def test_crlf_line_endings_are_kept(tmp_path):
+    original = b"# Title\r\n\r\nBody\r\n"
+    (tmp_path / "README.md").write_bytes(original)
+    updater = ContentUpdater(max_entries=2)
+
+    updater.update_files(tmp_path, ["README.md"], "first")
+    updater.update_files(tmp_path, ["README.md"], "second")
+
+    block = "\r\n".join([UPDATE_LOG_START, "- first", "- second", UPDATE_LOG_END])
+    assert (tmp_path / "README.md").read_bytes() == original + b"\r\n" + block.encode("utf-8") + b"\r\n"
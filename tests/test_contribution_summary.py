@@ -0,0 +1,63 @@
+from datetime import datetime
+
+from src.contribution_summary import INDEX_VERSION, ContributionSummary
+
+
+def _commits(branch_no, names=("alice", "bob")):
+    return [
+        {"collaborator": name, "email": f"{name}@example.com", "file": f"contributions/{name}-{branch_no}.md",
+         "timestamp": f"2024-01-{branch_no:02d}T10:00:00"}
+        for name in names
+    ]
+
+
+def _listed(markdown):
+    section = markdown.split("## 📝 Individual Contributions", 1)[1]
+    return [line for line in section.splitlines() if line.startswith("- ")]
+
+
+def test_recent_list_is_capped_and_totals_keep_counting():
+    summary = ContributionSummary(max_recent=3)
+    for branch_no in range(1, 6):
+        summary.add(f"auto-pr-{branch_no}", _commits(branch_no))
+
+    assert summary.total == 10
+    assert summary.branches == 5
+    assert len(summary.recent) == 3
+    assert summary.contributors["alice"] == {"email": "alice@example.com", "commits": 5, "last": "2024-01-05"}
+
+    listed = _listed(summary.render("auto-pr-5", generated=datetime(2024, 1, 5)))
+    assert listed == [
+        "- [2024-01-05] @bob: `contributions/bob-5.md` on `auto-pr-5`",
+        "- [2024-01-05] @alice: `contributions/alice-5.md` on `auto-pr-5`",
+        "- [2024-01-04] @bob: `contributions/bob-4.md` on `auto-pr-4`",
+        "- … and 7 earlier contributions",
+    ]
+
+
+def test_index_round_trip_continues_the_aggregates():
+    summary = ContributionSummary(max_recent=2)
+    summary.add("auto-pr-1", _commits(1))
+    reloaded = ContributionSummary.load(summary.to_json(), max_recent=2)
+    reloaded.add("auto-pr-2", _commits(2, names=("carol",)))
+
+    assert reloaded.total == 3
+    assert list(reloaded.contributors) == ["alice", "bob", "carol"]
+    assert [record["collaborator"] for record in reloaded.recent] == ["bob", "carol"]
+    assert "**Total:** 3 contributions across 2 branches" in reloaded.render("auto-pr-2")
+
+
+def test_a_smaller_cap_trims_a_loaded_index_on_the_next_add():
+    summary = ContributionSummary(max_recent=10)
+    summary.add("auto-pr-1", _commits(1, names=("a", "b", "c", "d")))
+    reloaded = ContributionSummary.load(summary.to_json(), max_recent=2)
+    reloaded.add("auto-pr-2", _commits(2, names=("e",)))
+    assert [record["collaborator"] for record in reloaded.recent] == ["d", "e"]
+
+
+def test_unusable_index_starts_over(caplog):
+    for text in ("not json", '{"version": %d}' % (INDEX_VERSION + 1), "[]"):
+        summary = ContributionSummary.load(text)
+        assert summary.total == 0 and summary.contributors == {}
+    assert "Ignoring contributions index" in caplog.text
+    assert ContributionSummary.load(None).recent == []
@@ -0,0 +1,140 @@
+import json
+import threading
+import time
+
+import pytest
+
+from src.daemon import Job, JobDaemon, JobError, submit_job
+
+
+class _Config:
+    def __init__(self):
+        self.reloads = 0
+
+    def reload_if_changed(self):
+        self.reloads += 1
+        return False
+
+
+class _Notifier:
+    def __init__(self):
+        self.errors = []
+
+    def send_error_notification(self, error, context=None):
+        self.errors.append((str(error), context))
+
+
+class _Creator:
+    """Stands in for AutoPRCreator.run_once"""
+
+    def __init__(self, release=None):
+        self.config = _Config()
+        self.notifier = _Notifier()
+        self.release = release
+        self.started = threading.Event()
+        self.calls = []
+
+    def run_once(self, mode, files=None, labels=None, branch_lock=None):
+        self.started.set()
+        if self.release:
+            self.release.wait(5)
+        if labels == ["boom"]:
+            raise RuntimeError("push rejected")
+        self.calls.append((mode, files, labels))
+        return {"number": len(self.calls), "html_url": f"https://github.test/pull/{len(self.calls)}"}
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def _result(daemon, job_file):
+    return json.loads((daemon.done / f"{job_file.stem}.result.json").read_text(encoding="utf-8"))
+
+
+def _start(daemon):
+    outcome = {}
+    thread = threading.Thread(target=lambda: outcome.update(ok=daemon.run()), daemon=True)
+    thread.start()
+    return thread, outcome
+
+
+def test_job_files_are_validated():
+    job = Job.from_dict({"mode": "single", "files": ["README.md"], "count": 2}, "fallback")
+    assert (job.id, job.files, job.count) == ("fallback", ["README.md"], 2)
+    for data, key in (([], "job"), ({"mode": "batch"}, "job.mode"), ({"labels": "x"}, "job.labels"),
+                      ({"mode": "collaborator", "files": ["a"]}, "job.files"), ({"count": True}, "job.count")):
+        with pytest.raises(JobError, match=f"^{key}"):
+            Job.from_dict(data, "fallback")
+
+
+def test_oldest_jobs_are_claimed_up_to_the_limit(tmp_path):
+    daemon = JobDaemon(_Creator(), queue_dir=str(tmp_path))
+    daemon.processing.mkdir(parents=True)
+    paths = [submit_job(str(tmp_path), {"id": f"job-{i}"}) for i in range(3)]
+
+    claimed = daemon._claim(2)
+    assert [path.name for path in claimed] == [path.name for path in paths[:2]]
+    assert all(path.parent == daemon.processing for path in claimed)
+    assert [path.name for path in daemon.incoming.glob("*.json")] == [paths[2].name]
+    assert daemon._claim(0) == []
+
+
+def test_jobs_run_and_report_results(tmp_path):
+    creator = _Creator()
+    daemon = JobDaemon(creator, queue_dir=str(tmp_path), poll_interval=0.01)
+    good = submit_job(str(tmp_path), {"id": "good", "count": 2, "labels": ["x"]})
+    bad = submit_job(str(tmp_path), {"id": "bad", "labels": ["boom"]})
+    invalid = submit_job(str(tmp_path), {"id": "invalid", "mode": "batch"})
+
+    thread, outcome = _start(daemon)
+    _wait_for(lambda: len(list(daemon.done.glob("*.result.json"))) == 3)
+    daemon.stop()
+    thread.join(5)
+
+    assert outcome["ok"] is False
+    assert daemon.counts == {"succeeded": 1, "failed": 1, "rejected": 1}
+    assert [pr["number"] for pr in _result(daemon, good)["prs"]] == [1, 2]
+    assert _result(daemon, bad)["error"] == "push rejected"
+    assert creator.notifier.errors == [("push rejected", {"job": "bad"})]
+    assert _result(daemon, invalid)["status"] == "rejected"
+    assert (daemon.done / good.name).exists()
+    assert creator.config.reloads > 0
+
+
+def test_interrupted_jobs_are_requeued(tmp_path):
+    daemon = JobDaemon(_Creator(), queue_dir=str(tmp_path), poll_interval=0.01)
+    daemon.processing.mkdir(parents=True)
+    (daemon.processing / "left-over.json").write_text(json.dumps({"id": "left-over"}), encoding="utf-8")
+
+    thread, outcome = _start(daemon)
+    _wait_for(lambda: (daemon.done / "left-over.result.json").exists())
+    daemon.stop()
+    thread.join(5)
+
+    assert outcome["ok"] is True
+    assert not list(daemon.processing.iterdir())
+
+
+def test_stop_drains_in_flight_jobs_and_leaves_the_rest(tmp_path):
+    release = threading.Event()
+    creator = _Creator(release)
+    daemon = JobDaemon(creator, queue_dir=str(tmp_path), max_concurrency=1, poll_interval=0.01)
+    running = submit_job(str(tmp_path), {"id": "running"})
+
+    thread, outcome = _start(daemon)
+    assert creator.started.wait(5)
+    waiting = submit_job(str(tmp_path), {"id": "waiting"})
+    daemon.stop()
+    time.sleep(0.1)
+    # run() waits for the job that is still running
+    assert thread.is_alive()
+
+    release.set()
+    thread.join(5)
+    assert outcome["ok"] is True
+    assert _result(daemon, running)["status"] == "succeeded"
+    assert waiting.exists()
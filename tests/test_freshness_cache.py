@@ -0,0 +1,79 @@
+import subprocess
+import threading
+import time
+
+from src.git_operations import RefFreshnessCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def test_sha_is_reused_until_stale():
+    clock = _Clock()
+    cache = RefFreshnessCache(max_age=60, clock=clock)
+    fetches = []
+
+    def fetch():
+        fetches.append(clock.now)
+        return f"sha-{len(fetches)}"
+
+    assert cache.get_or_refresh("main", fetch) == "sha-1"
+    clock.now = 59.9
+    assert cache.is_fresh("main")
+    assert cache.get_or_refresh("main", fetch) == "sha-1"
+    clock.now = 60
+    assert not cache.is_fresh("main")
+    assert cache.get_or_refresh("main", fetch) == "sha-2"
+    assert fetches == [0.0, 60]
+
+
+def test_invalidate_forces_a_fetch():
+    cache = RefFreshnessCache(max_age=60, clock=_Clock())
+    cache.get_or_refresh("main", lambda: "old")
+    cache.get_or_refresh("dev", lambda: "old")
+
+    cache.invalidate("main")
+    assert cache.get_or_refresh("main", lambda: "new") == "new"
+    assert cache.get_or_refresh("dev", lambda: "new") == "old"
+    cache.invalidate()
+    assert not cache.is_fresh("dev")
+
+
+def test_concurrent_users_fetch_once():
+    cache = RefFreshnessCache(max_age=60)
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        time.sleep(0.05)
+        return "sha"
+
+    threads = [threading.Thread(target=cache.get_or_refresh, args=("main", fetch)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert fetches == [1]
+
+
+def test_default_branch_is_fetched_again_only_when_stale_or_forced(git, workspace):
+    before = git.refresh_default_branch()
+
+    # Move main on the remote behind the clone's back
+    _git(workspace.work, "commit", "-q", "--allow-empty", "-m", "remote change")
+    moved = _git(workspace.work, "rev-parse", "HEAD")
+    _git(workspace.work, "push", "-q", "origin", "HEAD:refs/heads/elsewhere")
+    _git(workspace.origin, "update-ref", "refs/heads/main", moved)
+
+    assert git.refresh_default_branch() == before
+    assert git.refresh_default_branch(force=True) == moved
+    assert _git(workspace.work, "rev-parse", "origin/main") == moved
@@ -0,0 +1,50 @@
+import pytest
+
+from src.config_manager import ConfigManager
+from src.github_client import GitHubClient, _next_page_url
+
+
+def _client(workspace, monkeypatch, api_url):
+    monkeypatch.chdir(workspace.work)
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("GITHUB_API_URL", api_url)
+    return GitHubClient(ConfigManager(str(workspace.config_path)))
+
+
+@pytest.mark.parametrize("api_url", ["https://api.github.com", "https://ghe.example.com/api/v3"],
+                         ids=["github.com", "enterprise"])
+def test_endpoints_are_named_below_the_api_root(workspace, monkeypatch, api_url):
+    client = _client(workspace, monkeypatch, api_url)
+    try:
+        assert client._endpoint_path(client.graphql_url) == "/graphql"
+        assert client._endpoint_path(f"{client.api_url}/pulls/7?per_page=100") == f"/repos/{client.owner}/{client.repo}/pulls/7"
+    finally:
+        client.close()
+
+
+def test_pages_are_followed_through_the_link_header(github, fake_github):
+    for i in range(5):
+        github.create_pr(f"branch-{i}", f"PR {i}", "")
+
+    assert [pr["number"] for pr in github.list_prs(per_page=2)] == [1, 2, 3, 4, 5]
+    pages = f"GET /repos/{github.owner}/{github.repo}/pulls"
+    assert fake_github.requests[pages] == 3
+    # Pages bypass the response cache
+    assert github.get_cache_stats()["entries"] == 0
+
+
+def test_iteration_stops_fetching_at_the_limit(github, fake_github):
+    for i in range(5):
+        github.create_pr(f"branch-{i}", f"PR {i}", "")
+
+    assert [pr["number"] for pr in github.iter_prs(per_page=2, limit=3)] == [1, 2, 3]
+    assert fake_github.requests[f"GET /repos/{github.owner}/{github.repo}/pulls"] == 2
+
+
+def test_next_page_url_is_taken_from_rel_next():
+    link = ('<https://api.github.com/repos/o/r/pulls?page=1>; rel="prev", '
+            '<https://api.github.com/repos/o/r/pulls?page=3>; rel="next", '
+            '<https://api.github.com/repos/o/r/pulls?page=9>; rel="last"')
+    assert _next_page_url(link) == "https://api.github.com/repos/o/r/pulls?page=3"
+    assert _next_page_url('<https://api.github.com/repos/o/r/pulls?page=1>; rel="prev"') is None
+    assert _next_page_url(None) is None
@@ -0,0 +1,87 @@
+import re
+
+import pytest
+
+from src.github_graphql import GraphQLBatch, GraphQLError, PullRequestInfo
+
+
+def _node(number, **fields):
+    return {"id": f"PR_{number}", "number": number, "url": f"https://github.test/pull/{number}", **fields}
+
+
+def test_batch_renames_variables_per_alias():
+    batch = GraphQLBatch("mutation")
+    batch.add("first", "addLabelsToLabelable(input: $input) { clientMutationId }", {"input": ("In!", {"a": 1})})
+    batch.add("second", "mergePullRequest(input: $input) { clientMutationId }", {"input": ("In!", {"b": 2})})
+
+    query, variables = batch.build()
+    assert query.startswith("mutation($first_input: In!, $second_input: In!) {")
+    assert "first: addLabelsToLabelable(input: $first_input)" in query
+    assert "second: mergePullRequest(input: $second_input)" in query
+    assert variables == {"first_input": {"a": 1}, "second_input": {"b": 2}}
+    assert len(batch) == 2
+
+
+def test_batch_rejects_bad_aliases_and_empty_documents():
+    batch = GraphQLBatch()
+    batch.add("ok", "viewer { login }")
+    for alias in ("ok", "1bad", "with-dash"):
+        with pytest.raises(ValueError):
+            batch.add(alias, "viewer { login }")
+    with pytest.raises(ValueError):
+        GraphQLBatch().build()
+    with pytest.raises(ValueError):
+        GraphQLBatch("subscription")
+
+
+def test_status_queries_are_split_into_batches(github, monkeypatch):
+    queries = []
+
+    def execute_batch(batch):
+        query, _ = batch.build()
+        numbers = [int(n) for n in re.findall(r"pullRequest\(number: (\d+)\)", query)]
+        queries.append(numbers)
+        # PR 4 does not exist
+        return {"repository": {
+            f"p{i}": _node(n, state="OPEN", mergeable="MERGEABLE") if n != 4 else None
+            for i, n in enumerate(numbers)
+        }}
+
+    monkeypatch.setattr(github, "execute_batch", execute_batch)
+    statuses = github.get_prs_status([1, 2, 3, 4, 5], batch_size=2)
+
+    assert queries == [[1, 2], [3, 4], [5]]
+    assert sorted(statuses) == [1, 2, 3, 5]
+    assert statuses[5].mergeable == "MERGEABLE"
+    assert github.get_prs_status([]) == {}
+
+
+def test_labels_and_merge_share_one_request(github, monkeypatch):
+    requests_sent = []
+
+    def graphql(query, variables=None):
+        requests_sent.append(query)
+        if "label(name:" in query:
+            return {"repository": {"id": "R_1", "l0": {"id": "L_1", "name": "auto-pr"}, "l1": None}}
+        return {"labels": {"clientMutationId": None}, "merge": {"pullRequest": _node(7, merged=True, state="MERGED")}}
+
+    rest_labels = []
+    monkeypatch.setattr(github, "graphql", graphql)
+    monkeypatch.setattr(github, "add_labels", lambda number, labels: rest_labels.append((number, labels)))
+
+    merged = github.label_and_merge_graphql(PullRequestInfo(id="PR_7", number=7, url=""), ["auto-pr", "new"], "squash")
+
+    assert merged.merged
+    assert len(requests_sent) == 2
+    assert "labels: addLabelsToLabelable" in requests_sent[1] and "merge: mergePullRequest" in requests_sent[1]
+    # Labels GraphQL cannot add yet go through REST, which creates them
+    assert rest_labels == [(7, ["new"])]
+
+
+def test_errors_are_raised_with_their_messages(github, monkeypatch):
+    monkeypatch.setattr(github, "_send", lambda *args, **kwargs: (
+        {"errors": [{"message": "first"}, {"message": "second"}], "data": {"a": 1}}, None
+    ))
+    with pytest.raises(GraphQLError, match="first; second") as raised:
+        github.graphql("query { viewer { login } }")
+    assert raised.value.data == {"a": 1}
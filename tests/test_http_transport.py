@@ -0,0 +1,74 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.http_transport import HttpTransport, build_retry
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        server = self.server
+        server.hits.append(self.command)
+        status = server.statuses.pop(0) if server.statuses else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_POST = _reply
+
+
+@pytest.fixture
+def flaky_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyHandler)
+    server.daemon_threads = True
+    server.hits = []
+    server.statuses = []
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_retry_policy_covers_idempotent_methods_and_server_errors():
+    retry = build_retry(3)
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("POST", 503)
+    assert not retry.is_retry("PUT", 502)
+    # Rate limits are left to the callers
+    assert not retry.is_retry("GET", 429)
+
+
+@pytest.mark.parametrize("http2", [False, True], ids=["http1", "http2"])
+def test_server_errors_are_retried_for_get_only(flaky_server, http2):
+    if http2:
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+    transport = HttpTransport(http2=http2, max_retries=1, timeout=5)
+    assert transport.http2 is http2
+    url = f"http://127.0.0.1:{flaky_server.server_port}/"
+    try:
+        flaky_server.statuses[:] = [503]
+        assert transport.request("GET", url).status_code == 200
+        assert flaky_server.hits == ["GET", "GET"]
+
+        flaky_server.hits.clear()
+        flaky_server.statuses[:] = [503]
+        assert transport.request("POST", url, json={}).status_code == 503
+        assert flaky_server.hits == ["POST"]
+
+        flaky_server.statuses[:] = [503, 503]
+        with pytest.raises(requests.exceptions.RetryError):
+            transport.request("GET", url)
+    finally:
+        transport.close()
@@ -0,0 +1,101 @@
+import pytest
+import requests
+
+from src.merge_waiter import MergeabilityError, MergeabilityWaiter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class _Client:
+    def __init__(self, polls, merges):
+        self.polls = list(polls)
+        self.merges = list(merges)
+        self.merge_calls = []
+
+    def get_pr(self, number):
+        return self.polls.pop(0) if len(self.polls) > 1 else self.polls[0]
+
+    def merge_pr(self, number, method="merge"):
+        self.merge_calls.append(method)
+        status = self.merges.pop(0)
+        if status != 200:
+            response = requests.Response()
+            response.status_code = status
+            raise requests.exceptions.HTTPError(f"{status}", response=response)
+        return {"merged": True, "sha": "abc"}
+
+
+OPEN = {"state": "open", "mergeable": None}
+READY = {"state": "open", "mergeable": True}
+
+
+def _waiter(client, clock, **kwargs):
+    return MergeabilityWaiter(client, initial_interval=1, retry_delay=4, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_polls_with_growing_intervals_until_mergeable():
+    clock = _Clock()
+    client = _Client([OPEN, OPEN, OPEN, OPEN, READY], [200])
+    waiter = _waiter(client, clock)
+
+    assert waiter.merge_when_ready(7, method="squash") == {"merged": True, "sha": "abc"}
+    assert clock.sleeps == [1, 1.5, 2.25, 3.375]
+    assert client.merge_calls == ["squash"]
+
+
+def test_405_is_retried_after_polling_again():
+    clock = _Clock()
+    client = _Client([READY], [405, 405, 200])
+    waiter = _waiter(client, clock, retry_count=3)
+
+    assert waiter.merge_when_ready(7)["merged"]
+    assert client.merge_calls == ["merge"] * 3
+    assert clock.sleeps == [4, 4]
+    assert waiter.polls == 3
+
+
+def test_405_gives_up_after_retry_count():
+    clock = _Clock()
+    client = _Client([READY], [405, 405])
+    labelled = []
+    waiter = _waiter(client, clock, retry_count=2)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        waiter.merge_when_ready(7, before_merge=lambda: labelled.append(True))
+    assert len(client.merge_calls) == 2
+    assert labelled == [True]
+
+
+def test_other_errors_are_not_retried():
+    client = _Client([READY], [409])
+    with pytest.raises(requests.exceptions.HTTPError):
+        _waiter(client, _Clock()).merge_when_ready(7)
+    assert len(client.merge_calls) == 1
+
+
+@pytest.mark.parametrize("pr, message", [
+    ({"state": "open", "mergeable": False, "mergeable_state": "dirty"}, "not mergeable \\(dirty\\)"),
+    ({"state": "closed"}, "is closed"),
+    (OPEN, "Timed out"),
+])
+def test_unmergeable_prs_raise(pr, message):
+    clock = _Clock()
+    with pytest.raises(MergeabilityError, match=message):
+        _waiter(_Client([pr], []), clock, poll_timeout=10).merge_when_ready(7)
+
+
+def test_pr_body_names_the_configured_merge_method(creator, monkeypatch):
+    monkeypatch.setattr(creator, "_merge_method", lambda: "rebase")
+    _, body, _ = creator._build_pr_content("auto-pr-1", commits=[{"collaborator": "alice"}])
+    assert "- **Merge method:** Rebase and merge" in body
@@ -0,0 +1,66 @@
+import threading
+import time
+
+from src.notification_dispatcher import NotificationDispatcher
+
+
+class _RecordingManager:
+    def __init__(self, release=None):
+        self.calls = []
+        self.release = release
+
+    def deliver_events(self, events):
+        if self.release:
+            self.release.wait(5)
+        self.calls.append(("pr", [pr["number"] for pr, _ in events]))
+
+    def deliver_error(self, message):
+        self.calls.append(("error", message))
+
+    def retry_pending(self):
+        return 0
+
+
+def test_batch_keeps_submission_order():
+    manager = _RecordingManager()
+    dispatcher = NotificationDispatcher(manager, coalesce_seconds=5, retry_interval=60)
+    dispatcher.submit("pr", {"number": 1}, "created")
+    dispatcher.submit("error", "boom")
+    dispatcher.submit("pr", {"number": 2}, "created")
+    dispatcher.submit("pr", {"number": 3}, "merged")
+    assert dispatcher.close()
+
+    assert manager.calls == [("pr", [1]), ("error", "boom"), ("pr", [2, 3])]
+    assert dispatcher.stats()["delivered"] == 4
+
+
+def test_close_reports_an_unfinished_flush_and_can_wait_again():
+    release = threading.Event()
+    manager = _RecordingManager(release)
+    dispatcher = NotificationDispatcher(manager, coalesce_seconds=0, retry_interval=60)
+    dispatcher.submit("pr", {"number": 1}, "created")
+
+    assert not dispatcher.close(timeout=0.1)
+    release.set()
+    assert dispatcher.close(timeout=5)
+    assert manager.calls == [("pr", [1])]
+
+
+def test_manager_close_waits_for_a_slow_flush(notifier, webhooks, monkeypatch):
+    webhooks.latency = 0.5
+    notifier.dispatcher.coalesce_seconds = 0
+    flush = notifier.dispatcher.close
+    monkeypatch.setattr(notifier.dispatcher, "close", lambda: flush(timeout=0.05))
+    notifier.send_notification({"number": 1, "title": "Slow"}, "created")
+    time.sleep(0.1)
+
+    # The worker is still posting, so nothing it needs is torn down
+    notifier.close()
+    assert not notifier._closed
+    assert notifier.outbox.stats()["pending"] == 0
+
+    monkeypatch.setattr(notifier.dispatcher, "close", flush)
+    notifier.close()
+    notifier.close()
+    assert notifier._closed
+    assert webhooks.requests["POST /discord"] == 1
@@ -0,0 +1,77 @@
+import pytest
+
+from src.notification_outbox import NotificationOutbox
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def outbox(tmp_path, clock):
+    box = NotificationOutbox(str(tmp_path / "outbox.sqlite3"), max_attempts=3, base_delay=10, clock=clock)
+    yield box
+    box.close()
+
+
+def _ids(batch):
+    return [payload["n"] for _, _, payload in batch]
+
+
+def test_backlog_is_delivered_oldest_first(outbox, clock):
+    outbox.add("discord", "https://hook/1", {"n": 1}, error="boom")
+    outbox.add("discord", "https://hook/1", {"n": 2})
+    outbox.add("slack", "https://hook/2", {"n": 3})
+
+    # The failed head is in backoff and holds back the newer payload
+    assert outbox.due("discord") == []
+    assert _ids(outbox.due("slack")) == [3]
+
+    clock.now += 20
+    batch = outbox.due("discord")
+    assert batch[0][1] == "https://hook/1"
+    assert _ids(batch) == [1, 2]
+    outbox.delivered([row_id for row_id, _, _ in batch])
+    assert not outbox.has_pending("discord")
+
+
+def test_429_pauses_the_channel_for_retry_after(outbox, clock):
+    outbox.add("discord", "https://hook", {"n": 1})
+    outbox.add("discord", "https://hook", {"n": 2})
+    row_id = outbox.due("discord")[0][0]
+
+    outbox.failed(row_id, "429 Too Many Requests", retry_after=30)
+    assert outbox.is_blocked("discord")
+    clock.now += 29
+    assert outbox.due("discord") == []
+    clock.now += 2
+    assert _ids(outbox.due("discord")) == [1, 2]
+
+
+def test_payloads_are_parked_after_max_attempts(outbox, clock):
+    outbox.add("slack", "https://hook", {"n": 1}, error="boom")
+    for _ in range(2):
+        clock.now += 1000
+        row_id = outbox.due("slack")[0][0]
+        outbox.failed(row_id, "boom")
+    assert outbox.stats() == {"pending": 0, "dead": 1}
+    assert outbox.due("slack") == []
+
+
+def test_legacy_rows_without_a_webhook_do_not_block_the_backlog(notifier, webhooks):
+    notifier.outbox.add("slack", None, {"text": "legacy"})
+    notifier.outbox.add("slack", webhooks.slack_url, {"text": "current"})
+
+    assert notifier.slack_webhook is None
+    assert notifier.retry_pending() == 1
+    assert notifier.outbox.stats() == {"pending": 0, "dead": 1}
+    assert webhooks.payloads == [{"text": "current"}]
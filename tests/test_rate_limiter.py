@@ -0,0 +1,95 @@
+import pytest
+
+from src.rate_limiter import RateLimitScheduler
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+def _scheduler(clock, **kwargs):
+    return RateLimitScheduler(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_mutating_calls_draw_from_the_token_bucket(clock):
+    scheduler = _scheduler(clock, secondary_per_minute=60, secondary_burst=2)
+
+    for _ in range(5):
+        scheduler.acquire("GET")
+    assert clock.sleeps == []
+
+    scheduler.acquire("POST")
+    scheduler.acquire("put")
+    assert clock.sleeps == []
+    scheduler.acquire("POST")
+    assert clock.sleeps == [1.0]
+    assert scheduler.get_budget()["secondary"]["total_wait_seconds"] == 1.0
+
+
+def test_bucket_refills_up_to_the_burst(clock):
+    scheduler = _scheduler(clock, secondary_per_minute=60, secondary_burst=2)
+    scheduler.acquire("POST")
+    scheduler.acquire("POST")
+    clock.now += 3600
+    scheduler.acquire("POST")
+    scheduler.acquire("POST")
+    scheduler.acquire("POST")
+    assert clock.sleeps == [1.0]
+
+
+def test_headers_update_the_named_resource(clock):
+    scheduler = _scheduler(clock)
+    headers = {"X-RateLimit-Resource": "graphql", "X-RateLimit-Limit": "5000",
+               "X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "2000"}
+
+    assert scheduler.update(headers) == "graphql"
+    assert scheduler.update({"X-RateLimit-Remaining": "oops"}, "core") == "core"
+    budget = scheduler.get_budget()
+    assert budget["graphql"] == {"limit": 5000, "remaining": 4999, "reset": 2000.0, "blocked_until": 0.0}
+    assert budget["core"]["remaining"] is None
+
+
+def test_calls_are_spread_out_below_the_reserve(clock):
+    scheduler = _scheduler(clock, reserve_fraction=0.2)
+    scheduler.update({"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "1100"})
+
+    scheduler.acquire("GET")
+    scheduler.acquire("GET")
+    # 100 seconds left for 10 calls
+    assert clock.sleeps == [10.0]
+
+
+def test_exhausted_budget_waits_for_the_reset(clock):
+    scheduler = _scheduler(clock)
+    scheduler.update({"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"})
+    scheduler.acquire("GET")
+    assert clock.sleeps == [30.0]
+
+
+@pytest.mark.parametrize("status, headers, expected", [
+    (429, {"Retry-After": "12"}, 12.0),
+    (429, {}, 60.0),
+    (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1045"}, 45.0),
+    (403, {}, None),
+    (500, {"Retry-After": "5"}, None),
+])
+def test_rate_limit_rejections_block_the_resource(clock, status, headers, expected):
+    scheduler = _scheduler(clock)
+    assert scheduler.retry_after(status, headers) == expected
+
+    scheduler.acquire("GET")
+    assert clock.sleeps == ([expected] if expected else [])
@@ -0,0 +1,60 @@
+from src.response_cache import ResponseCache
+
+ETAG = {"ETag": '"v1"'}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.store("a", ETAG, {"n": "a"})
+    cache.store("b", ETAG, {"n": "b"})
+    # A 304 for "a" makes "b" the oldest
+    cache.hit("a", cache.lookup("a"))
+    cache.store("c", ETAG, {"n": "c"})
+
+    assert cache.lookup("b") is None
+    assert cache.lookup("a")["body"] == {"n": "a"}
+    assert cache.stats() == {"hits": 1, "misses": 3, "entries": 2, "evictions": 1}
+
+
+def test_validators_are_sent_back_and_304_serves_the_cached_body():
+    cache = ResponseCache()
+    cache.store("url", {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+                        "Link": '<url?page=2>; rel="next"'}, [1, 2])
+    entry = cache.lookup("url")
+
+    assert ResponseCache.conditional_headers(entry) == {
+        "If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+    }
+    assert ResponseCache.conditional_headers(None) == {}
+    assert cache.hit("url", entry) == ([1, 2], '<url?page=2>; rel="next"')
+
+
+def test_responses_without_validators_drop_the_entry():
+    cache = ResponseCache()
+    cache.store("url", ETAG, "old")
+    cache.store("url", {}, "new")
+    assert cache.lookup("url") is None
+
+
+def test_entries_survive_a_restart(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = ResponseCache(max_entries=3, path=str(path))
+    for key in "abcd":
+        cache.store(key, ETAG, key)
+    cache.save()
+
+    reloaded = ResponseCache(max_entries=2, path=str(path))
+    assert [key for key in "abcd" if reloaded.lookup(key)] == ["c", "d"]
+
+    path.write_text("not json", encoding="utf-8")
+    assert ResponseCache(path=str(path)).stats()["entries"] == 0
+
+
+def test_unchanged_pr_is_served_from_a_304(github, fake_github):
+    pr = github.create_pr("feature", "Title", "Body")
+    first = github.get_pr(pr["number"])
+    assert first["mergeable"] is True
+
+    assert github.get_pr(pr["number"]) == first
+    assert github.get_cache_stats()["hits"] == 1
+    assert fake_github.requests[f"GET /repos/{github.owner}/{github.repo}/pulls/{{n}}"] == 2
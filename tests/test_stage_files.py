@@ -0,0 +1,63 @@
+import os
+import subprocess
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True, check=True).stdout
+
+
+def _staged(repo):
+    return _git(repo, "diff", "--cached", "--name-status").splitlines()
+
+
+def test_modified_new_and_deleted_files_are_staged(git, workspace):
+    work = workspace.work
+    (work / "README.md").write_text("# Changed\n", encoding="utf-8")
+    (work / "docs" / "new.md").write_text("new\n", encoding="utf-8")
+    (work / "docs" / "file-0.md").unlink()
+
+    result = git.stage_files(["README.md", "docs/new.md", "docs/file-0.md", "README.md"])
+
+    assert result.ok
+    assert result.staged == ["README.md", "docs/new.md", "docs/file-0.md"]
+    assert sorted(_staged(work)) == ["A\tdocs/new.md", "D\tdocs/file-0.md", "M\tREADME.md"]
+
+
+def test_invalid_paths_are_reported_one_by_one(git, workspace):
+    (workspace.work / "README.md").write_text("# Changed\n", encoding="utf-8")
+
+    result = git.stage_files(["README.md", "docs", "missing.md", "../outside.md", "."])
+
+    assert result.staged == ["README.md"]
+    assert result.failed == {
+        "docs": "is a directory",
+        "missing.md": "does not exist",
+        "../outside.md": "outside of repository",
+        ".": "is a directory"
+    }
+    assert _staged(workspace.work) == ["M\tREADME.md"]
+
+
+def test_symlinks_are_staged_as_links(git, workspace, tmp_path):
+    work = workspace.work
+    os.symlink("../README.md", work / "docs" / "link.md")
+    os.symlink(str(tmp_path), work / "docs" / "external")
+
+    result = git.stage_files(["docs/link.md", "docs/external"])
+
+    assert result.ok
+    assert sorted(_staged(work)) == ["A\tdocs/external", "A\tdocs/link.md"]
+    assert _git(work, "ls-files", "-s", "docs/link.md").startswith("120000 ")
+
+
+def test_paths_git_rejects_do_not_fail_the_rest(git, workspace):
+    work = workspace.work
+    os.symlink("docs", work / "linked-docs")
+    (work / "README.md").write_text("# Changed\n", encoding="utf-8")
+
+    result = git.stage_files(["README.md", "linked-docs/file-1.md"])
+
+    assert result.staged == ["README.md"]
+    assert list(result.failed) == ["linked-docs/file-1.md"]
+    assert "beyond a symbolic link" in result.failed["linked-docs/file-1.md"]
+    assert _staged(work) == ["M\tREADME.md"]
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from src.state_journal import STAGES, JournalMismatchError, StateJournal
+
+BATCH = {"mode": "single", "count": 3, "repository": "owner/repo"}
+
+
+def _journal(path, **kwargs):
+    journal = StateJournal(str(path), fsync=False, **kwargs)
+    journal.begin(BATCH)
+    return journal
+
+
+def _complete(journal, pr):
+    for stage in STAGES:
+        journal.record(pr, stage)
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_replay_restores_progress(tmp_path):
+    path = tmp_path / "state.jsonl"
+    journal = _journal(path, compact_every=0)
+    _complete(journal, 1)
+    journal.record(2, "branch_created", branch="auto-pr-2")
+    journal.record(2, "pushed")
+    journal.close()
+
+    replayed = _journal(path)
+    assert replayed.is_complete(1)
+    assert replayed.last_completed_pr == 1
+    assert replayed.state(2) == {"stages": ["branch_created", "pushed"], "branch": "auto-pr-2"}
+    assert replayed.state(3) is None
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = tmp_path / "state.jsonl"
+    journal = _journal(path, compact_every=0)
+    journal.record(1, "branch_created", branch="auto-pr-1")
+    journal._file.close()
+    journal._file = None
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"pr": 1, "stage": "comm')
+
+    replayed = _journal(path)
+    assert replayed.state(1)["stages"] == ["branch_created"]
+
+    # Appending after the torn line still yields a readable journal
+    replayed.record(1, "committed")
+    replayed.close()
+    assert _journal(path).state(1)["stages"] == ["branch_created", "committed"]
+
+
+def test_compaction_keeps_only_in_flight_prs(tmp_path):
+    path = tmp_path / "state.jsonl"
+    journal = _journal(path, compact_every=5)
+    _complete(journal, 1)
+    _complete(journal, 2)
+    journal.record(3, "pr_opened", pr={"number": 3})
+    journal.close()
+
+    records = _lines(path)
+    assert records[0] == {"last_completed_pr": 2, "batch": BATCH}
+    assert all(record.get("pr") == 3 for record in records[1:])
+
+    replayed = _journal(path)
+    assert replayed.last_completed_pr == 2
+    assert replayed.state(3) == {"stages": ["pr_opened"], "pr": {"number": 3}}
+
+
+def test_forget_discards_recorded_stages(tmp_path):
+    path = tmp_path / "state.jsonl"
+    journal = _journal(path, compact_every=0)
+    journal.record(1, "branch_created", branch="auto-pr-1")
+    journal.record(1, "committed")
+    journal.forget(1)
+    assert journal.state(1) is None
+
+    journal.record(1, "branch_created", branch="auto-pr-1b")
+    journal.close()
+    assert _journal(path).state(1) == {"stages": ["branch_created"], "branch": "auto-pr-1b"}
+
+
+def test_journal_of_another_batch_is_refused(tmp_path):
+    path = tmp_path / "state.jsonl"
+    journal = _journal(path)
+    journal.record(1, "pushed", branch="collab-pr-1")
+    journal.close()
+
+    other = StateJournal(str(path), fsync=False)
+    with pytest.raises(JournalMismatchError):
+        other.begin({**BATCH, "mode": "collaborator"})
+
+    # Same parameters resume
+    _journal(path)
+
+
+def test_batch_that_never_records_leaves_no_file(tmp_path):
+    path = tmp_path / "state.jsonl"
+    _journal(path).close()
+    assert not path.exists()